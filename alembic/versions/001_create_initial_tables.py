@@ -19,7 +19,12 @@ _here = Path(__file__).parent
 
 def upgrade() -> None:
     sql = (_here / "001_create_initial_tables.sql").read_text()
-    op.execute(sql)
+
+    # One statement per execute so a failure points at the statement that caused it.
+    # Splitting on ";" is safe here because the schema has no functions or string literals containing one.
+    for statement in sql.split(";"):
+        if statement.strip():
+            op.execute(statement)
 
 
 def downgrade() -> None:
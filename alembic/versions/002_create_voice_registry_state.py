@@ -0,0 +1,25 @@
+"""Create voice_registry_state for skipping unchanged voice syncs on startup.
+
+Revision ID: 002
+Revises: 001
+Create Date: 2026-10-16
+"""
+
+from pathlib import Path
+
+from alembic import op
+
+revision = "002"
+down_revision = "001"
+branch_labels = None
+depends_on = None
+
+_here = Path(__file__).parent
+
+
+def upgrade() -> None:
+    op.execute((_here / "002_create_voice_registry_state.sql").read_text())
+
+
+def downgrade() -> None:
+    op.execute("DROP TABLE IF EXISTS voice_registry_state")
@@ -0,0 +1,7 @@
+-- fingerprint of the voices directory at the last filesystem -> DB sync
+
+CREATE TABLE voice_registry_state (
+    id SMALLINT PRIMARY KEY DEFAULT 1 CHECK (id = 1),
+    fingerprint VARCHAR(64) NOT NULL,
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT NOW()
+);
@@ -1,10 +1,14 @@
 """Audio cleanup - splits, normalizes, and trims audio clips for LoRA training."""
 
 import argparse
+import functools
 import logging
 import math
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 
+import soundfile as sf
 import torch
 import torchaudio
 
@@ -14,6 +18,12 @@ logger = logging.getLogger(__name__)
 _SUPPORTED_EXTENSIONS = {".wav", ".mp3", ".flac", ".ogg"}
 
 
+@functools.lru_cache(maxsize=16)
+def _get_resampler(orig_sr: int, target_sr: int) -> torchaudio.transforms.Resample:
+    """Build the resampling kernel for a sample-rate pair once and reuse it across files."""
+    return torchaudio.transforms.Resample(orig_sr, target_sr)
+
+
 def load_audio(path: Path, target_sr: int) -> tuple[torch.Tensor, int]:
     """Load an audio file, convert to mono, and resample to the target rate."""
     waveform, sample_rate = torchaudio.load(str(path))
@@ -24,23 +34,22 @@ def load_audio(path: Path, target_sr: int) -> tuple[torch.Tensor, int]:
 
     # Resample if needed
     if sample_rate != target_sr:
-        resampler = torchaudio.transforms.Resample(sample_rate, target_sr)
-        waveform = resampler(waveform)
+        waveform = _get_resampler(sample_rate, target_sr)(waveform)
 
     return waveform, target_sr
 
 
 def normalize_loudness(audio: torch.Tensor, target_db: float) -> torch.Tensor:
     """Normalize audio loudness to a target dBFS using RMS, then clamp to [-1, 1]."""
-    rms = audio.pow(2).mean().sqrt()
+    # vector_norm reduces without materializing the squared signal
+    rms = torch.linalg.vector_norm(audio) / math.sqrt(audio.numel())
     if rms < 1e-8:
         return audio
 
-    current_db = 20 * math.log10(rms.item())
-    gain_db = target_db - current_db
-    gain = 10 ** (gain_db / 20)
+    gain = 10 ** (target_db / 20) / rms
 
-    return (audio * gain).clamp(-1.0, 1.0)
+    # One output buffer: scale into a new tensor, then clamp it in place
+    return audio.mul(gain).clamp_(-1.0, 1.0)
 
 
 def trim_silence(audio: torch.Tensor, sample_rate: int, threshold_db: float) -> torch.Tensor:
@@ -48,18 +57,27 @@ def trim_silence(audio: torch.Tensor, sample_rate: int, threshold_db: float) ->
     threshold_linear = 10 ** (threshold_db / 20)
     abs_audio = audio.abs().squeeze(0)
 
-    # Find first sample above threshold
+    # Mask samples above the threshold
     above = abs_audio > threshold_linear
     if not above.any():
         return audio
 
-    indices = torch.nonzero(above, as_tuple=True)[0]
-    start = indices[0].item()
-    end = indices[-1].item() + 1
+    # argmax returns the first maximum, so the first loud sample from each end
+    above = above.to(torch.uint8)
+    start = int(above.argmax())
+    end = above.numel() - int(above.flip(0).argmax())
 
     return audio[:, start:end]
 
 
+def prepare_waveform(audio: torch.Tensor, sample_rate: int, threshold_db: float, target_db: float) -> torch.Tensor:
+    """Trim leading and trailing silence, then normalize the loudness of what remains.
+
+    Trimming returns a view, so the normalized clip is the only full-size buffer written.
+    """
+    return normalize_loudness(trim_silence(audio, sample_rate, threshold_db), target_db)
+
+
 def _compute_energy(audio: torch.Tensor, sample_rate: int, window_ms: int = 50) -> torch.Tensor:
     """Compute short-time energy in sliding windows."""
 
@@ -67,14 +85,11 @@ def _compute_energy(audio: torch.Tensor, sample_rate: int, window_ms: int = 50)
     if window_size < 1:
         window_size = 1
 
-    flat = audio.squeeze(0)
-    n_windows = len(flat) // window_size
-    if n_windows == 0:
-        return torch.tensor([flat.pow(2).mean()])
+    if audio.shape[-1] < window_size:
+        return audio.pow(2).mean().reshape(1)
 
-    trimmed = flat[: n_windows * window_size]
-    frames = trimmed.reshape(n_windows, window_size)
-    return frames.pow(2).mean(dim=1)
+    # Non-overlapping mean of the squared signal, one value per window
+    return torch.nn.functional.avg_pool1d(audio.pow(2), kernel_size=window_size, stride=window_size).squeeze(0)
 
 
 def split_on_silence(
@@ -104,24 +119,21 @@ def split_on_silence(
     min_silence_windows = silence_min_len_ms // window_ms
     is_silent = energy < threshold_linear
 
-    # Find split points at silence boundaries
-    split_points: list[int] = []  # sample indices
-    silence_start: int | None = None
+    # Find silence runs from the rising and falling edges of the silent mask
+    silent = is_silent.to(torch.int8)
+    zero = silent.new_zeros(1)
+    edges = torch.diff(silent, prepend=zero, append=zero)
+    starts = (edges == 1).nonzero().flatten()
+    ends = (edges == -1).nonzero().flatten()
 
-    for i in range(len(is_silent)):
-        if is_silent[i]:
-            if silence_start is None:
-                silence_start = i
-        else:
-            if silence_start is not None:
-                silence_len = i - silence_start
-
-                if silence_len >= min_silence_windows:
-                    # Split at the middle of the silence region
-                    mid_window = silence_start + silence_len // 2
-                    split_points.append(mid_window * window_size)
+    # A run that reaches the end of the audio is never closed by speech, so it isn't a split point
+    if is_silent[-1]:
+        starts, ends = starts[:-1], ends[:-1]
 
-                silence_start = None
+    # Split at the middle of each long enough silence region
+    lengths = ends - starts
+    long_enough = lengths >= min_silence_windows
+    split_points: list[int] = ((starts[long_enough] + lengths[long_enough] // 2) * window_size).tolist()
 
     # Create clips from split points
     clips: list[torch.Tensor] = []
@@ -155,7 +167,32 @@ def split_on_silence(
 
 def save_clip(audio: torch.Tensor, path: Path, sample_rate: int) -> None:
     """Save audio tensor as 16-bit PCM WAV."""
-    torchaudio.save(str(path), audio, sample_rate, encoding="PCM_S", bits_per_sample=16)
+    sf.write(str(path), audio.squeeze(0).numpy(), sample_rate, subtype="PCM_16")
+
+
+def process_file(audio_file: Path, output_dir: Path, args: argparse.Namespace) -> int:
+    """Clean and split one audio file, returning the number of clips written."""
+    waveform, sr = load_audio(audio_file, args.sample_rate)
+    waveform = prepare_waveform(waveform, sr, args.silence_threshold, args.target_loudness)
+    clips = split_on_silence(
+        audio=waveform,
+        sample_rate=sr,
+        silence_threshold_db=args.silence_threshold,
+        silence_min_len_ms=args.silence_min_len,
+        min_duration=args.min_duration,
+        max_duration=args.max_duration,
+    )
+
+    for i, clip in enumerate(clips):
+        out_path = output_dir / f"{audio_file.stem}_{i:03d}.wav"
+        save_clip(clip, out_path, sr)
+
+    return len(clips)
+
+
+def _init_worker() -> None:
+    """Limit each worker process to one intra-op thread so workers don't oversubscribe the CPU."""
+    torch.set_num_threads(1)
 
 
 def main() -> None:
@@ -169,6 +206,7 @@ def main() -> None:
     parser.add_argument("--silence-threshold", type=float, default=-40.0, help="Silence threshold in dB (default: -40.0)")
     parser.add_argument("--silence-min-len", type=int, default=500, help="Min silence length in ms for splitting (default: 500)")
     parser.add_argument("--target-loudness", type=float, default=-20.0, help="Target loudness in dBFS (default: -20.0)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="Worker processes (default: CPU count)")
     args = parser.parse_args()
 
     input_dir: Path = args.input_dir
@@ -191,35 +229,28 @@ def main() -> None:
     total_clips = 0
     skipped = 0
     errored = 0
-    for audio_file in audio_files:
-        try:
-            waveform, sr = load_audio(audio_file, args.sample_rate)
-            waveform = trim_silence(waveform, sr, args.silence_threshold)
-            waveform = normalize_loudness(waveform, args.target_loudness)
-            clips = split_on_silence(
-                audio=waveform,
-                sample_rate=sr,
-                silence_threshold_db=args.silence_threshold,
-                silence_min_len_ms=args.silence_min_len,
-                min_duration=args.min_duration,
-                max_duration=args.max_duration,
-            )
-
-            if not clips:
+
+    # Files are independent, so spread them across processes
+    with ProcessPoolExecutor(max_workers=args.workers, initializer=_init_worker) as pool:
+        futures = {pool.submit(process_file, audio_file, output_dir, args): audio_file for audio_file in audio_files}
+
+        for future in as_completed(futures):
+            audio_file = futures[future]
+            try:
+                n_clips = future.result()
+
+            except Exception:
+                logger.exception("Error processing %s", audio_file.name)
+                errored += 1
+                continue
+
+            if n_clips == 0:
                 logger.info("Skipped %s (no valid clips after processing)", audio_file.name)
                 skipped += 1
                 continue
 
-            for i, clip in enumerate(clips):
-                out_path = output_dir / f"{audio_file.stem}_{i:03d}.wav"
-                save_clip(clip, out_path, sr)
-
-            total_clips += len(clips)
-            logger.info("Processed %s -> %d clip(s)", audio_file.name, len(clips))
-
-        except Exception:
-            logger.exception("Error processing %s", audio_file.name)
-            errored += 1
+            total_clips += n_clips
+            logger.info("Processed %s -> %d clip(s)", audio_file.name, n_clips)
 
     print(f"\nDone: {total_clips} clip(s) from {len(audio_files)} file(s)")
 
@@ -2,17 +2,21 @@
 
 import argparse
 import csv
-import json
+import gc
 import logging
+import os
 import shutil
+from collections.abc import Iterator, Mapping
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
+import numpy as np
 import torch
 from datasets import Dataset
-from peft import LoraConfig, TaskType, get_peft_model
-from transformers import AutoModelForCausalLM, AutoTokenizer, Trainer, TrainingArguments
+from peft import LoraConfig, TaskType, get_peft_model, prepare_model_for_kbit_training
+from transformers import AutoModelForCausalLM, AutoTokenizer, BitsAndBytesConfig, Trainer, TrainingArguments
 
 from doppelganger.tts.snac_encoder import SNACEncoder
 
@@ -25,6 +29,11 @@ _END_OF_HUMAN = 128260
 _START_OF_AI = 128261
 _END_OF_AI = 128262
 _PAD_TOKEN = 128263
+_PROMPT_SUFFIX = (_END_OF_HUMAN, _START_OF_AI)
+
+# Per-clip SNAC token cache, relative to the dataset directory.
+_SNAC_CACHE_DIR = "snac_cache"
+_CACHE_WRITERS = 2
 
 
 @dataclass
@@ -33,7 +42,7 @@ class TrainingSample:
 
     filename: str
     text: str
-    audio_tokens: list[int] = field(default_factory=list)
+    audio_tokens: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.int32))
 
 
 def load_transcript(csv_path: Path) -> dict[str, str]:
@@ -53,21 +62,68 @@ def load_transcript(csv_path: Path) -> dict[str, str]:
     return transcript
 
 
-def load_snac_cache(cache_path: Path) -> dict[str, list[int]]:
-    """Load cached SNAC token encodings from a JSON file."""
-    if not cache_path.is_file():
-        return {}
+class SNACCache(Mapping[str, np.ndarray]):
+    """Read-only view of a SNAC cache directory holding one int32 .npy file per clip stem.
+
+    Only the directory listing is read up front; each clip's tokens are memory-mapped on access.
+    """
+
+    def __init__(self, cache_dir: Path) -> None:
+        self._dir = cache_dir
+        self._stems = {p.stem for p in cache_dir.glob("*.npy")} if cache_dir.is_dir() else set()
+
+    def __getitem__(self, stem: str) -> np.ndarray:
+        if stem not in self._stems:
+            raise KeyError(stem)
+        return np.load(self._dir / f"{stem}.npy", mmap_mode="r")
+
+    def __contains__(self, stem: object) -> bool:
+        return stem in self._stems
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._stems)
+
+    def __len__(self) -> int:
+        return len(self._stems)
+
+
+def load_snac_cache(cache_dir: Path) -> SNACCache:
+    """Open the per-clip SNAC token cache in a directory (empty if it doesn't exist)."""
+    return SNACCache(cache_dir)
+
 
-    with open(cache_path, encoding="utf-8") as f:
-        data: dict[str, list[int]] = json.load(f)
+def save_snac_cache(cache_dir: Path, stem: str, audio_tokens: np.ndarray) -> None:
+    """Write one clip's SNAC tokens to the cache directory."""
+    cache_dir.mkdir(exist_ok=True)
 
-    return data
+    # Write to a temp file and rename, so an interrupted run never leaves a truncated entry
+    tmp_path = cache_dir / f"{stem}.npy.tmp"
+    with open(tmp_path, "wb") as f:
+        np.save(f, audio_tokens.astype(np.int32, copy=False))
+    tmp_path.replace(cache_dir / f"{stem}.npy")
 
 
-def save_snac_cache(cache_path: Path, cache: dict[str, list[int]]) -> None:
-    """Write SNAC token encodings to a JSON cache file."""
-    with open(cache_path, "w", encoding="utf-8") as f:
-        json.dump(cache, f)
+def _encode_batch(encoder: SNACEncoder, wav_paths: list[Path]) -> list[tuple[Path, list[int]]]:
+    """Encode a batch of clips in one SNAC forward pass, retrying one at a time if the batch fails."""
+    try:
+        return list(zip(wav_paths, encoder.encode_batch([str(p) for p in wav_paths]), strict=True))
+    except Exception:
+        logger.exception("Batch encode failed, retrying %d clip(s) individually", len(wav_paths))
+
+    results: list[tuple[Path, list[int]]] = []
+    for wav_path in wav_paths:
+        try:
+            results.append((wav_path, encoder.encode(str(wav_path))))
+        except Exception:
+            logger.exception("Failed to encode %s", wav_path.name)
+
+    return results
+
+
+def _list_wavs(directory: Path) -> list[Path]:
+    """List WAV files in a directory, sorted by name, from cached scandir entries."""
+    with os.scandir(directory) as entries:
+        return sorted(Path(e.path) for e in entries if e.name.endswith(".wav") and e.is_file())
 
 
 def encode_dataset(
@@ -75,23 +131,24 @@ def encode_dataset(
     transcript: dict[str, str],
     encoder: SNACEncoder,
     use_cache: bool = True,
+    batch_size: int = 8,
 ) -> list[TrainingSample]:
     """Encode each WAV clip in the dataset directory using SNAC, with optional disk cache."""
 
     samples: list[TrainingSample] = []
-    wav_files = sorted(dataset_dir.glob("*.wav"))
+    wav_files = _list_wavs(dataset_dir)
 
     if not wav_files:
         print(f"No WAV files found in {dataset_dir}")
         return samples
 
-    cache_path = dataset_dir / "snac_cache.json"
-    cache: dict[str, list[int]] = {}
-    if use_cache:
-        cache = load_snac_cache(cache_path)
+    cache_dir = dataset_dir / _SNAC_CACHE_DIR
+    cache: Mapping[str, np.ndarray] = load_snac_cache(cache_dir) if use_cache else {}
+    encoded: dict[str, np.ndarray] = {}
 
     cached_count = 0
-    encoded_count = 0
+    pending: list[Path] = []
+    stems: list[str] = []
 
     for wav_path in wav_files:
         stem = wav_path.stem
@@ -100,26 +157,44 @@ def encode_dataset(
             logger.warning("No transcript for %s, skipping", wav_path.name)
             continue
 
+        stems.append(stem)
         if stem in cache:
-            sample = TrainingSample(filename=stem, text=transcript[stem], audio_tokens=cache[stem])
-            samples.append(sample)
             cached_count += 1
-            continue
-
-        try:
-            audio_tokens = encoder.encode(str(wav_path))
-            cache[stem] = audio_tokens
-            sample = TrainingSample(filename=stem, text=transcript[stem], audio_tokens=audio_tokens)
-            samples.append(sample)
-            encoded_count += 1
-            logger.info("Encoded %s: %d tokens", wav_path.name, len(audio_tokens))
-
-        except Exception:
-            logger.exception("Failed to encode %s", wav_path.name)
+        else:
+            pending.append(wav_path)
+
+    # Batch clips of similar length together so little of each batch is padding
+    pending.sort(key=lambda p: p.stat().st_size)
+
+    # Cache writes run in the background so disk I/O overlaps with encoding the next batch
+    writes: dict[Future[None], str] = {}
+    with ThreadPoolExecutor(max_workers=_CACHE_WRITERS) as writer:
+        for start in range(0, len(pending), batch_size):
+            for wav_path, token_list in _encode_batch(encoder, pending[start : start + batch_size]):
+                audio_tokens = np.asarray(token_list, dtype=np.int32)
+                encoded[wav_path.stem] = audio_tokens
+                logger.info("Encoded %s: %d tokens", wav_path.name, len(audio_tokens))
+
+                # Each clip is its own cache entry, so new encodes never rewrite the existing ones
+                if use_cache:
+                    writes[writer.submit(save_snac_cache, cache_dir, wav_path.stem, audio_tokens)] = wav_path.stem
+
+    for future, stem in writes.items():
+        if (exc := future.exception()) is not None:
+            logger.error("Failed to cache SNAC tokens for %s: %s", stem, exc)
+
+    encoded_count = len(encoded)
+
+    # Keep samples in directory order regardless of which batch encoded them
+    for stem in stems:
+        audio_tokens = encoded.get(stem)
+        if audio_tokens is None:
+            audio_tokens = cache.get(stem)
+        if audio_tokens is not None:
+            samples.append(TrainingSample(filename=stem, text=transcript[stem], audio_tokens=audio_tokens))
 
     if use_cache and encoded_count > 0:
-        save_snac_cache(cache_path, cache)
-        logger.info("Saved SNAC cache to %s", cache_path)
+        logger.info("Saved %d new clip(s) to SNAC cache in %s", encoded_count, cache_dir)
 
     if cached_count > 0:
         print(f"  {cached_count} clip(s) loaded from cache")
@@ -129,52 +204,114 @@ def encode_dataset(
     return samples
 
 
-def build_training_sequence(sample: TrainingSample, tokenizer: Any) -> dict[str, list[int]]:
-    """Build input_ids and labels for a single training sample.
+def build_training_sequence(sample: TrainingSample, text_tokens: list[int]) -> tuple[np.ndarray, int]:
+    """Build input_ids for a single training sample from its pre-tokenized text, with its prompt length.
 
     Format: [START_OF_HUMAN] + text_tokens + [END_OF_HUMAN, START_OF_AI] + audio_tokens + [END_OF_AI]
-    Labels mask the prompt portion with -100 so the model only learns audio generation.
+    Labels are input_ids with the prompt portion masked to -100 so the model only learns audio generation.
     """
-    text_tokens: list[int] = tokenizer.encode(sample.text, add_special_tokens=False)
-    prompt = [_START_OF_HUMAN] + text_tokens + [_END_OF_HUMAN, _START_OF_AI]
-    target = sample.audio_tokens + [_END_OF_AI]
+    n_prompt = len(text_tokens) + 3
 
-    input_ids = prompt + target
-    labels = [-100] * len(prompt) + target
+    # Fill one int32 buffer in place rather than concatenating Python lists
+    input_ids = np.empty(n_prompt + len(sample.audio_tokens) + 1, dtype=np.int32)
+    input_ids[0] = _START_OF_HUMAN
+    input_ids[1 : n_prompt - 2] = text_tokens
+    input_ids[n_prompt - 2 : n_prompt] = _PROMPT_SUFFIX
+    input_ids[n_prompt:-1] = sample.audio_tokens
+    input_ids[-1] = _END_OF_AI
 
-    return {"input_ids": input_ids, "labels": labels}
+    return input_ids, n_prompt
+
+
+def build_training_sequences(samples: list[TrainingSample], tokenizer: Any) -> list[tuple[np.ndarray, int]]:
+    """Build training sequences for all samples with a single batched tokenizer call."""
+    # One call lets a fast tokenizer encode every transcript natively instead of crossing into Rust per sample
+    encoded: list[list[int]] = tokenizer([s.text for s in samples], add_special_tokens=False)["input_ids"]
+    return [build_training_sequence(sample, text_tokens) for sample, text_tokens in zip(samples, encoded, strict=True)]
 
 
 def create_dataset(samples: list[TrainingSample], tokenizer: Any, max_seq_len: int) -> Dataset:
     """Build a HuggingFace Dataset from training samples."""
-    all_input_ids: list[list[int]] = []
-    all_labels: list[list[int]] = []
-    all_attention_mask: list[list[int]] = []
+    # Preallocate padded rows so each sample is a slice assignment, not a list rebuild
+    input_ids = np.full((len(samples), max_seq_len), _PAD_TOKEN, dtype=np.int32)
+    labels = np.full((len(samples), max_seq_len), -100, dtype=np.int32)
+    attention_mask = np.zeros((len(samples), max_seq_len), dtype=np.int8)
+
+    for i, (seq, n_prompt) in enumerate(build_training_sequences(samples, tokenizer)):
+        n = min(len(seq), max_seq_len)
+
+        input_ids[i, :n] = seq[:n]
+        labels[i, n_prompt:n] = seq[n_prompt:n]
+        attention_mask[i, :n] = 1
+
+    return Dataset.from_dict(
+        {
+            "input_ids": input_ids,
+            "labels": labels,
+            "attention_mask": attention_mask,
+        }
+    )
+
+
+def pack_sequences(lengths: list[int], max_seq_len: int) -> list[list[int]]:
+    """Group sample indices into rows of at most max_seq_len tokens, first-fit by decreasing length."""
+    rows: list[list[int]] = []
+    free: list[int] = []
 
-    for sample in samples:
-        seq = build_training_sequence(sample, tokenizer)
-        input_ids = seq["input_ids"][:max_seq_len]
-        labels = seq["labels"][:max_seq_len]
+    for idx in sorted(range(len(lengths)), key=lambda i: lengths[i], reverse=True):
+        n = lengths[idx]
+        for r, space in enumerate(free):
+            if n <= space:
+                rows[r].append(idx)
+                free[r] -= n
+                break
+        else:
+            rows.append([idx])
+            free.append(max_seq_len - n)
 
-        # Pad to max_seq_len
-        pad_len = max_seq_len - len(input_ids)
-        attention_mask = [1] * len(input_ids) + [0] * pad_len
-        input_ids = input_ids + [_PAD_TOKEN] * pad_len
-        labels = labels + [-100] * pad_len
+    return rows
 
-        all_input_ids.append(input_ids)
-        all_labels.append(labels)
-        all_attention_mask.append(attention_mask)
+
+def create_packed_dataset(samples: list[TrainingSample], tokenizer: Any, max_seq_len: int) -> Dataset:
+    """Build a HuggingFace Dataset packing several samples per row, with position_ids restarting per sample.
+
+    FlashAttention-2 splits each row at the position_ids resets, so packed samples never attend to each other.
+    """
+    seqs = build_training_sequences(samples, tokenizer)
+    lengths = [min(len(seq), max_seq_len) for seq, _ in seqs]
+    rows = pack_sequences(lengths, max_seq_len)
+
+    input_ids = np.full((len(rows), max_seq_len), _PAD_TOKEN, dtype=np.int32)
+    labels = np.full((len(rows), max_seq_len), -100, dtype=np.int32)
+    position_ids = np.zeros((len(rows), max_seq_len), dtype=np.int32)
+
+    for i, row in enumerate(rows):
+        start = 0
+        for idx in row:
+            seq, n_prompt = seqs[idx]
+            n = lengths[idx]
+            end = start + n
+            input_ids[i, start:end] = seq[:n]
+            labels[i, start + n_prompt : end] = seq[n_prompt:n]
+            position_ids[i, start:end] = np.arange(n)
+            start = end
+        # Trailing padding restarts at 0 as well, so it forms its own segment instead of extending the last sample
+        position_ids[i, start:] = np.arange(max_seq_len - start)
 
     return Dataset.from_dict(
         {
-            "input_ids": all_input_ids,
-            "labels": all_labels,
-            "attention_mask": all_attention_mask,
+            "input_ids": input_ids,
+            "labels": labels,
+            "position_ids": position_ids,
         }
     )
 
 
+def _dataloader_workers() -> int:
+    """Background DataLoader workers to use, leaving most cores for the main training process."""
+    return max(2, (os.cpu_count() or 1) // 4)
+
+
 def train(args: argparse.Namespace) -> None:
     """Run the full LoRA training pipeline."""
     dataset_dir = Path(args.dataset_dir)
@@ -192,45 +329,58 @@ def train(args: argparse.Namespace) -> None:
 
     # Encode audio with SNAC (skips cached clips)
     use_cache = not args.no_cache
-    cache_path = dataset_dir / "snac_cache.json"
     all_cached = False
 
     if use_cache:
-        cache = load_snac_cache(cache_path)
-        stems_needed = {p.stem for p in dataset_dir.glob("*.wav")} & set(transcript.keys())
-        all_cached = len(stems_needed) > 0 and stems_needed <= set(cache.keys())
+        cache = load_snac_cache(dataset_dir / _SNAC_CACHE_DIR)
+        # Key views compare as sets directly, without copying either side
+        stems_needed = transcript.keys() & {p.stem for p in _list_wavs(dataset_dir)}
+        all_cached = len(stems_needed) > 0 and stems_needed <= cache.keys()
 
     if all_cached:
         print("All clips found in SNAC cache, skipping encoder load")
         encoder = SNACEncoder(device="cpu")
     else:
         print("Encoding audio clips with SNAC...")
-        encoder = SNACEncoder(device=args.snac_device)
+        encoder = SNACEncoder(device=args.snac_device, half_precision=args.snac_bf16)
         encoder.load()
 
-    samples = encode_dataset(dataset_dir, transcript, encoder, use_cache=use_cache)
+    samples = encode_dataset(dataset_dir, transcript, encoder, use_cache=use_cache, batch_size=args.snac_batch_size)
     if not samples:
         print("No samples encoded, aborting")
         return
 
     print(f"Encoded {len(samples)} sample(s)")
 
-    # Free SNAC VRAM before loading the training model
+    # Drop SNAC before loading the training model; its freed blocks stay in the caching allocator for reuse
     if encoder.is_loaded:
         encoder.unload()
     del encoder
-
-    if torch.cuda.is_available():
-        torch.cuda.empty_cache()
+    gc.collect()
 
     # Load base model and tokenizer
     print(f"Loading base model: {args.base_model}")
     tokenizer = AutoTokenizer.from_pretrained(args.base_model)
+    quant_kwargs: dict[str, Any] = {}
+    if args.qlora:
+        # QLoRA: frozen base weights stored as NF4, LoRA deltas and matmuls stay in bf16
+        quant_kwargs["quantization_config"] = BitsAndBytesConfig(
+            load_in_4bit=True,
+            bnb_4bit_quant_type="nf4",
+            bnb_4bit_compute_dtype=torch.bfloat16,
+            bnb_4bit_use_double_quant=True,
+        )
+        quant_kwargs["device_map"] = {"": args.device}
+
     model = AutoModelForCausalLM.from_pretrained(
         args.base_model,
         torch_dtype=torch.bfloat16,
-        attn_implementation="sdpa",
+        # Packed rows need varlen FlashAttention-2; SDPA would attend across sample boundaries
+        attn_implementation="flash_attention_2" if args.packing else "sdpa",
+        **quant_kwargs,
     )
+    if args.qlora:
+        model = prepare_model_for_kbit_training(model)
 
     # Apply LoRA
     lora_config = LoraConfig(
@@ -247,14 +397,19 @@ def train(args: argparse.Namespace) -> None:
 
     # Build dataset
     print("Building training dataset...")
-    dataset = create_dataset(samples, tokenizer, args.max_seq_len)
-    print(f"Dataset size: {len(dataset)} sample(s)")
+    if args.packing:
+        dataset = create_packed_dataset(samples, tokenizer, args.max_seq_len)
+        print(f"Dataset size: {len(samples)} sample(s) packed into {len(dataset)} row(s)")
+    else:
+        dataset = create_dataset(samples, tokenizer, args.max_seq_len)
+        print(f"Dataset size: {len(dataset)} sample(s)")
 
     # Configure and run Trainer
     training_args = TrainingArguments(
         output_dir=str(output_dir / "checkpoints"),
         num_train_epochs=args.epochs,
         per_device_train_batch_size=args.batch_size,
+        gradient_accumulation_steps=args.grad_accum,
         learning_rate=args.learning_rate,
         bf16=True,
         gradient_checkpointing=True,
@@ -262,7 +417,13 @@ def train(args: argparse.Namespace) -> None:
         save_steps=args.save_steps,
         save_total_limit=2,
         remove_unused_columns=False,
-        dataloader_pin_memory=False,
+        # LoRA leaves no trainable parameter unused, so DDP can skip the unused-parameter scan
+        ddp_find_unused_parameters=False,
+        # Pinned host batches let Trainer's device copies run asynchronously; workers collate ahead of the GPU
+        dataloader_pin_memory=True,
+        dataloader_num_workers=_dataloader_workers(),
+        dataloader_persistent_workers=True,
+        dataloader_prefetch_factor=2,
         report_to="none",
     )
 
@@ -301,13 +462,18 @@ def main() -> None:
     parser.add_argument("--base-model", default="canopylabs/orpheus-tts-0.1-pretrained", help="HuggingFace base model ID")
     parser.add_argument("--epochs", type=int, default=1, help="Number of training epochs (default: 1)")
     parser.add_argument("--batch-size", type=int, default=1, help="Per-device batch size (default: 1)")
+    parser.add_argument("--grad-accum", type=int, default=1, help="Gradient accumulation steps (default: 1)")
     parser.add_argument("--learning-rate", type=float, default=5e-5, help="Learning rate (default: 5e-5)")
     parser.add_argument("--lora-rank", type=int, default=32, help="LoRA rank (default: 32)")
     parser.add_argument("--lora-alpha", type=int, default=64, help="LoRA alpha (default: 64)")
     parser.add_argument("--max-seq-len", type=int, default=2048, help="Max sequence length (default: 2048)")
+    parser.add_argument("--packing", action="store_true", help="Pack several samples per sequence (needs flash-attn)")
+    parser.add_argument("--qlora", action="store_true", help="Load the base model in 4-bit NF4 (needs bitsandbytes)")
     parser.add_argument("--save-steps", type=int, default=500, help="Save checkpoint every N steps (default: 500)")
     parser.add_argument("--device", default="cuda", help="Training device (default: cuda)")
     parser.add_argument("--snac-device", default="cpu", help="SNAC encoding device (default: cpu)")
+    parser.add_argument("--snac-batch-size", type=int, default=8, help="Clips per SNAC encoder pass (default: 8)")
+    parser.add_argument("--snac-bf16", action="store_true", help="Encode with bf16 autocast on a CUDA SNAC device")
     parser.add_argument("--no-cache", action="store_true", help="Disable SNAC encoding cache, re-encode all clips")
     args = parser.parse_args()
 
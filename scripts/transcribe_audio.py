@@ -3,13 +3,45 @@
 import argparse
 import csv
 import logging
+import os
+from collections import deque
+from collections.abc import Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 
+import numpy as np
+import torch
 import whisper
 
 logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
 logger = logging.getLogger(__name__)
 
+# Clips decoded ahead of the one being transcribed.
+_PREFETCH_DEPTH = 4
+
+
+def _list_wavs(directory: Path) -> list[Path]:
+    """List WAV files in a directory, sorted by name, from cached scandir entries."""
+    with os.scandir(directory) as entries:
+        return sorted(Path(e.path) for e in entries if e.name.endswith(".wav") and e.is_file())
+
+
+def _prefetch_audio(wav_files: list[Path]) -> Iterator[tuple[Path, Future[np.ndarray]]]:
+    """Yield clips in order with their pending decodes, keeping the next few decoding in the background.
+
+    whisper.load_audio shells out to ffmpeg, so decoding upcoming clips overlaps with inference on the current one.
+    """
+    with ThreadPoolExecutor(max_workers=_PREFETCH_DEPTH) as pool:
+        window: deque[tuple[Path, Future[np.ndarray]]] = deque()
+
+        for wav_path in wav_files:
+            window.append((wav_path, pool.submit(whisper.load_audio, str(wav_path))))
+            if len(window) > _PREFETCH_DEPTH:
+                yield window.popleft()
+
+        while window:
+            yield window.popleft()
+
 
 def transcribe_clips(
     input_dir: Path,
@@ -19,7 +51,7 @@ def transcribe_clips(
     device: str,
 ) -> None:
     """Transcribe all WAV clips in a directory and write a transcript CSV."""
-    wav_files = sorted(input_dir.glob("*.wav"))
+    wav_files = _list_wavs(input_dir)
     if not wav_files:
         print(f"No WAV files found in {input_dir}")
         return
@@ -28,11 +60,15 @@ def transcribe_clips(
     print(f"Loading Whisper model '{model_name}' on {device}...")
     model = whisper.load_model(model_name, device=device)
 
+    # Whisper only decodes in fp16 on CUDA; its own layers handle the casting
+    fp16 = torch.device(device).type == "cuda"
+
     results: list[tuple[str, str]] = []
     errors = 0
-    for wav_path in wav_files:
+    for wav_path, audio in _prefetch_audio(wav_files):
         try:
-            result = model.transcribe(str(wav_path), language=language)
+            with torch.inference_mode():
+                result = model.transcribe(audio.result(), language=language, fp16=fp16)
             text = result["text"].strip()
 
             if not text:
@@ -2,14 +2,26 @@
 
 import warnings
 
-# resemble-perth uses pkg_resources which setuptools deprecated - remove when perth updates
-warnings.filterwarnings("ignore", message="pkg_resources is deprecated", category=UserWarning)
+# Patterns are joined into one filter per category; every warnings.warn() call scans the filter list linearly
+_IGNORED_USER_WARNINGS = (
+    # resemble-perth uses pkg_resources which setuptools deprecated - remove when perth updates
+    r"pkg_resources is deprecated",
+    # transformers past_key_values tuple deprecation - remove when chatterbox updates
+    r".*past_key_values.*as a tuple of tuples.*",
+)
 
-# diffusers LoRACompatibleLinear deprecation - remove when diffusers drops it
-warnings.filterwarnings("ignore", message=".*LoRACompatibleLinear.*", category=FutureWarning)
+_IGNORED_FUTURE_WARNINGS = (
+    # diffusers LoRACompatibleLinear deprecation - remove when diffusers drops it
+    r".*LoRACompatibleLinear.*",
+    # torch sdp_kernel deprecation - remove when chatterbox switches to sdpa_kernel
+    r".*sdp_kernel.*",
+)
 
-# torch sdp_kernel deprecation - remove when chatterbox switches to sdpa_kernel
-warnings.filterwarnings("ignore", message=".*sdp_kernel.*", category=FutureWarning)
 
-# transformers past_key_values tuple deprecation - remove when chatterbox updates
-warnings.filterwarnings("ignore", message=".*past_key_values.*as a tuple of tuples.*", category=UserWarning)
+def _any_of(patterns: tuple[str, ...]) -> str:
+    """Combine message patterns into a single regex alternation."""
+    return "|".join(f"(?:{p})" for p in patterns)
+
+
+warnings.filterwarnings("ignore", message=_any_of(_IGNORED_USER_WARNINGS), category=UserWarning)
+warnings.filterwarnings("ignore", message=_any_of(_IGNORED_FUTURE_WARNINGS), category=FutureWarning)
@@ -2,7 +2,6 @@
 
 import json
 import logging
-from dataclasses import asdict
 
 from fastapi import APIRouter, Query, Request
 
@@ -25,12 +24,16 @@ async def list_audit(
     async with request.app.state.db_engine.connect() as conn:
         rows = await list_audit_entries(conn, limit=limit, action=action)
 
-    entries = []
-    for row in rows:
-        row_dict = asdict(row)
-        if row_dict["details"] is not None and isinstance(row_dict["details"], str):
-            row_dict["details"] = json.loads(row_dict["details"])
-
-        entries.append(AuditLogResponse(**row_dict))
+    # Build responses field by field rather than copying each row through asdict()
+    entries = [
+        AuditLogResponse(
+            id=row.id,
+            user_id=row.user_id,
+            action=row.action,
+            details=json.loads(row.details) if isinstance(row.details, str) else row.details,
+            created_at=row.created_at,
+        )
+        for row in rows
+    ]
 
     return AuditLogListResponse(entries=entries, count=len(entries))
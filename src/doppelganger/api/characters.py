@@ -1,10 +1,13 @@
 """Character management API endpoints."""
 
 import logging
+import re
 import shutil
 from pathlib import Path
+from typing import BinaryIO
 
-from fastapi import APIRouter, HTTPException, Request, UploadFile
+from fastapi import APIRouter, BackgroundTasks, HTTPException, Request, UploadFile
+from starlette.concurrency import run_in_threadpool
 from starlette.responses import Response
 
 from doppelganger.db.queries.characters import (
@@ -29,10 +32,14 @@ from doppelganger.models.tts import (
     CharacterTuning,
 )
 from doppelganger.tts.audio_validation import AudioValidationError, validate_reference_audio
+from doppelganger.tts.voice_registry import tombstone_path
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/api/characters", tags=["characters"])
 
+_COPY_CHUNK_SIZE = 1024 * 1024
+_NAME_RE = re.compile(r"[a-z0-9-]+")
+
 
 def _build_response(row: CharacterRow, engine_type: str | None = None) -> CharacterResponse:
     """Build a CharacterResponse from a DB row with tuning fields."""
@@ -53,6 +60,14 @@ def _build_response(row: CharacterRow, engine_type: str | None = None) -> Charac
     )
 
 
+def _write_reference(ref_path: Path, upload: BinaryIO) -> None:
+    """Copy an uploaded file to disk in fixed-size chunks, creating the character directory if needed."""
+    ref_path.parent.mkdir(parents=True, exist_ok=True)
+    upload.seek(0)
+    with open(ref_path, "wb") as f:
+        shutil.copyfileobj(upload, f, _COPY_CHUNK_SIZE)
+
+
 @router.get("", response_model=CharacterListResponse)
 async def list_characters(request: Request) -> CharacterListResponse:
     """List all registered characters with their IDs."""
@@ -62,9 +77,12 @@ async def list_characters(request: Request) -> CharacterListResponse:
     async with engine.connect() as conn:
         rows = await db_list_characters(conn)
 
+    # One registry copy, then a plain dict probe per row
+    voices = registry.snapshot()
+
     characters = []
     for r in rows:
-        voice = registry.get_voice(r.name)
+        voice = voices.get(r.name)
         engine_type = voice.engine.value if voice is not None else "chatterbox"
         characters.append(_build_response(r, engine_type))
 
@@ -75,30 +93,28 @@ async def list_characters(request: Request) -> CharacterListResponse:
 async def create_character(request: Request, name: str, audio: UploadFile) -> CharacterResponse:
     """Create a new character with a reference audio file."""
     name = name.lower().strip()
-    if not name or not all(c.isalnum() or c == "-" for c in name):
+    if not _NAME_RE.fullmatch(name):
         raise HTTPException(status_code=422, detail="Name must match pattern ^[a-z0-9-]+$")
 
     registry = request.app.state.voice_registry
     if registry.get_voice(name) is not None:
         raise HTTPException(status_code=409, detail=f"Character '{name}' already exists")
 
-    file_data = await audio.read()
+    # Validate the WAV header straight from the spooled upload, so rejected files never reach the voices dir
     try:
-        validate_reference_audio(file_data)
+        await run_in_threadpool(validate_reference_audio, audio.file)
     except AudioValidationError as e:
         raise HTTPException(status_code=422, detail=str(e)) from e
 
-    voices_dir = registry.voices_dir
-    char_dir = voices_dir / name
-    char_dir.mkdir(parents=True, exist_ok=True)
-    ref_path = char_dir / "reference.wav"
-    ref_path.write_bytes(file_data)
+    # Stream the upload to disk rather than reading it into memory
+    ref_path = registry.voices_dir / name / "reference.wav"
+    await run_in_threadpool(_write_reference, ref_path, audio.file)
 
     engine = request.app.state.db_engine
     async with engine.begin() as conn:
         row = await db_create_character(conn, name, str(ref_path))
 
-    registry.refresh()
+    registry.add_voice(name, ref_path)
     logger.info("Created character: %s", name)
 
     return CharacterResponse(
@@ -135,32 +151,59 @@ async def update_tuning(request: Request, character_id: int, body: CharacterTuni
     if evicted:
         logger.info("Evicted %d cached entries for character=%s after tuning update", evicted, row.name)
 
+    # The bot caches overrides for its queue worker, so drop the stale entry for this character
+    bot = getattr(request.app.state, "bot", None)
+    if bot is not None:
+        bot.overrides_cache.invalidate(row.name)
+
     voice = registry.get_voice(row.name)
     engine_type = voice.engine.value if voice is not None else row.engine
     return _build_response(row, engine_type)
 
 
+def _move_aside(char_dir: Path) -> Path | None:
+    """Rename a character directory to a hidden tombstone, returning it, or None if the directory is gone."""
+    if not char_dir.exists():
+        return None
+    tombstone = tombstone_path(char_dir)
+    char_dir.rename(tombstone)
+    return tombstone
+
+
 @router.delete("/{character_id}", status_code=204)
-async def delete_character(request: Request, character_id: int) -> Response:
+async def delete_character(request: Request, character_id: int, background_tasks: BackgroundTasks) -> Response:
     """Delete a character by ID."""
     engine = request.app.state.db_engine
     registry = request.app.state.voice_registry
 
-    async with engine.begin() as conn:
+    # Plain read first so the 404 path never opens a write transaction
+    async with engine.connect() as conn:
         row = await db_get_character(conn, character_id)
 
-        if row is None:
-            raise HTTPException(status_code=404, detail="Character not found")
+    if row is None:
+        raise HTTPException(status_code=404, detail="Character not found")
+
+    char_dir = Path(row.reference_audio_path).parent
+
+    async with engine.begin() as conn:
+        deleted = await db_delete_character(conn, character_id)
+
+    # A concurrent delete may have removed the row between the read and the write
+    if not deleted:
+        raise HTTPException(status_code=404, detail="Character not found")
 
-        ref_path = Path(row.reference_audio_path)
-        char_dir = ref_path.parent
+    # Renaming is atomic and instant; the tree itself is removed after the response is sent
+    tombstone = await run_in_threadpool(_move_aside, char_dir)
+    if tombstone is not None:
+        background_tasks.add_task(shutil.rmtree, tombstone, ignore_errors=True)
 
-        await db_delete_character(conn, character_id)
+    registry.remove_voice(row.name)
 
-    if char_dir.exists():
-        shutil.rmtree(char_dir)
+    # A character recreated under the same name must not inherit the deleted one's cached tuning
+    bot = getattr(request.app.state, "bot", None)
+    if bot is not None:
+        bot.overrides_cache.invalidate(row.name)
 
-    registry.refresh()
     logger.info("Deleted character id=%d name=%s", character_id, row.name)
 
     return Response(status_code=204)
@@ -1,12 +1,16 @@
 """Read-only endpoint exposing all application settings (secrets redacted)."""
 
+import functools
 import logging
+from collections.abc import Callable
 from pathlib import Path
+from types import UnionType
+from typing import Any, Union, get_args, get_origin
 
 from fastapi import APIRouter, Request
 from pydantic import BaseModel, SecretStr
 
-from doppelganger.config import get_settings
+from doppelganger.config import Settings, get_settings
 from doppelganger.models.config import ConfigEntry, ConfigSection, FullConfigResponse
 
 logger = logging.getLogger(__name__)
@@ -17,41 +21,77 @@ _REDACTED = "********"
 _PATH_FIELDS = {"voices_dir", "entrance_sound"}
 
 
-def _serialize_section(name: str, model: BaseModel) -> ConfigSection:
-    """Convert a pydantic model into a ConfigSection with redacted secrets."""
-    entries: list[ConfigEntry] = []
+def _render_secret(raw: object) -> str:
+    """Display a secret field as a fixed placeholder."""
+    return _REDACTED
+
+
+def _render_list(raw: list[object]) -> str:
+    """Display a list field as comma-separated values."""
+    return ", ".join(str(v) for v in raw)
+
+
+def _render_path(raw: str) -> str:
+    """Display a path field as an absolute path, leaving empty values as-is."""
+    return str(Path(raw).resolve()) if raw else str(raw)
+
+
+def _field_renderer(field_name: str, annotation: object) -> Callable[[Any], str] | None:
+    """Pick how a settings field is displayed from its annotation. Returns None for nested sections."""
+    types = get_args(annotation) if get_origin(annotation) in (Union, UnionType) else (annotation,)
 
-    for field_name in model.model_fields:
-        raw = getattr(model, field_name)
+    if any(isinstance(t, type) and issubclass(t, BaseModel) for t in types):
+        return None
+    if SecretStr in types:
+        return _render_secret
+    if any(t is list or get_origin(t) is list for t in types):
+        return _render_list
+    if field_name in _PATH_FIELDS:
+        return _render_path
+    return str
 
-        if isinstance(raw, BaseModel):
-            continue
 
-        if isinstance(raw, SecretStr):
-            display = _REDACTED
-        elif isinstance(raw, list):
-            display = ", ".join(str(v) for v in raw)
-        elif field_name in _PATH_FIELDS and raw:
-            display = str(Path(raw).resolve())
-        else:
-            display = str(raw)
+@functools.cache
+def _field_renderers(model_cls: type[BaseModel]) -> tuple[tuple[str, Callable[[Any], str]], ...]:
+    """Classify a settings model's fields once, skipping nested sections."""
+    renderers = ((name, _field_renderer(name, info.annotation)) for name, info in model_cls.model_fields.items())
+    return tuple((name, render) for name, render in renderers if render is not None)
 
-        entries.append(ConfigEntry(key=field_name, value=display))
 
+def _serialize_section(name: str, model: BaseModel) -> ConfigSection:
+    """Convert a pydantic model into a ConfigSection with redacted secrets."""
+    entries = [
+        ConfigEntry(key=field_name, value=render(getattr(model, field_name)))
+        for field_name, render in _field_renderers(type(model))
+    ]
     return ConfigSection(name=name, entries=entries)
 
 
+def _build_config_response(settings: Settings) -> FullConfigResponse:
+    """Serialize every settings section into a FullConfigResponse."""
+    return FullConfigResponse(
+        sections=[
+            _serialize_section("General", settings),
+            _serialize_section("Database", settings.database),
+            _serialize_section("Discord", settings.discord),
+            _serialize_section("Chatterbox", settings.chatterbox),
+            _serialize_section("Orpheus", settings.orpheus),
+        ]
+    )
+
+
+# Settings don't change while they're cached by get_settings, so neither does their serialized form
+_cached_response: tuple[Settings, FullConfigResponse] | None = None
+
+
 @router.get("", response_model=FullConfigResponse)
 async def get_config(request: Request) -> FullConfigResponse:
     """Return all application settings grouped by section, with secrets redacted."""
+    global _cached_response
     settings = get_settings()
 
-    sections = [
-        _serialize_section("General", settings),
-        _serialize_section("Database", settings.database),
-        _serialize_section("Discord", settings.discord),
-        _serialize_section("Chatterbox", settings.chatterbox),
-        _serialize_section("Orpheus", settings.orpheus),
-    ]
+    # Rebuild only when get_settings hands back a different object, e.g. after its cache is cleared
+    if _cached_response is None or _cached_response[0] is not settings:
+        _cached_response = (settings, _build_config_response(settings))
 
-    return FullConfigResponse(sections=sections)
+    return _cached_response[1]
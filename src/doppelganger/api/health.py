@@ -1,37 +1,73 @@
 """Health check endpoint for monitoring service status."""
 
+import asyncio
+import functools
 import logging
+import time
 
 import torch
 from fastapi import APIRouter, Request
 from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine
+from starlette.datastructures import State
 
 from doppelganger.models.common import HealthResponse
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
+# Probes this close together say nothing new, so /health reuses the last SELECT 1 result
+_DB_HEALTH_TTL = 1.0
 
+
+@functools.cache
 def _check_gpu() -> bool:
-    """Check if a CUDA GPU is available via torch."""
+    """Check if a CUDA GPU is available via torch, probing the driver only on the first call."""
     return bool(torch.cuda.is_available())
 
 
+async def _probe_database(engine: AsyncEngine) -> str:
+    """Run a trivial query to check database connectivity."""
+    try:
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+    except Exception:
+        logger.exception("Database health check failed")
+        return "disconnected"
+
+    return "connected"
+
+
+async def _check_database(state: State) -> str:
+    """Return the database status, reusing a probe result younger than _DB_HEALTH_TTL."""
+    engine = getattr(state, "db_engine", None)
+    if engine is None:
+        return "disconnected"
+
+    cached = getattr(state, "db_health", None)
+    if cached is not None and time.monotonic() - cached[0] < _DB_HEALTH_TTL:
+        return cached[1]
+
+    lock = getattr(state, "db_health_lock", None)
+    if lock is None:
+        lock = state.db_health_lock = asyncio.Lock()
+
+    # Only one request probes at a time; the rest wait and reuse its result
+    async with lock:
+        cached = getattr(state, "db_health", None)
+        if cached is not None and time.monotonic() - cached[0] < _DB_HEALTH_TTL:
+            return cached[1]
+
+        db_status = await _probe_database(engine)
+        state.db_health = (time.monotonic(), db_status)
+
+    return db_status
+
+
 @router.get("/health", response_model=HealthResponse)
 async def health_check(request: Request) -> HealthResponse:
     """Check database connectivity, TTS model state, and GPU availability."""
-    db_status = "disconnected"
-    engine = getattr(request.app.state, "db_engine", None)
-
-    if engine is not None:
-        try:
-            async with engine.connect() as conn:
-                await conn.execute(text("SELECT 1"))
-
-            db_status = "connected"
-        except Exception:
-            logger.exception("Database health check failed")
-            db_status = "disconnected"
+    db_status = await _check_database(request.app.state)
 
     tts_status = "not_loaded"
     if getattr(request.app.state, "tts_ready", False):
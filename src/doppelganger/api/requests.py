@@ -1,15 +1,10 @@
 """TTS request history API endpoints."""
 
 import logging
-from dataclasses import asdict
 
 from fastapi import APIRouter, HTTPException, Query, Request
 
-from doppelganger.db.queries.tts_requests import (
-    count_tts_requests,
-    get_tts_request,
-    list_tts_requests,
-)
+from doppelganger.db.queries.tts_requests import get_tts_request, list_tts_requests_page
 from doppelganger.db.request_status import RequestStatus
 from doppelganger.models.tts import TTSRequestListResponse, TTSRequestResponse
 
@@ -29,10 +24,10 @@ async def list_all_requests(
     filter_status = RequestStatus(status) if status is not None else None
 
     async with request.app.state.db_engine.connect() as conn:
-        total = await count_tts_requests(conn, status=filter_status)
-        rows = await list_tts_requests(conn, status=filter_status, limit=limit, offset=offset)
+        rows, total = await list_tts_requests_page(conn, status=filter_status, limit=limit, offset=offset)
 
-    requests_list = [TTSRequestResponse(**asdict(row)) for row in rows]
+    # Rows are already typed by the DB layer, so skip asdict()'s deep copy and per-field re-validation
+    requests_list = [TTSRequestResponse.model_construct(**vars(row)) for row in rows]
     return TTSRequestListResponse(requests=requests_list, count=len(requests_list), total=total)
 
 
@@ -46,4 +41,4 @@ async def get_single_request(request: Request, request_id: int) -> TTSRequestRes
     if row is None:
         raise HTTPException(status_code=404, detail="Request not found")
 
-    return TTSRequestResponse(**asdict(row))
+    return TTSRequestResponse.model_construct(**vars(row))
@@ -21,21 +21,23 @@ router = APIRouter(prefix="/api", tags=["status"])
 @router.get("/status", response_model=BotStatusResponse)
 async def get_bot_status(request: Request) -> BotStatusResponse:
     """Return the current bot connection status and config summary."""
-    bot = getattr(request.app.state, "bot", None)
+    state = request.app.state
+    bot = getattr(state, "bot", None)
 
     if bot is None or not bot.is_ready():
         return BotStatusResponse(connected=False)
 
     uptime = time.monotonic() - bot._started_at
     guilds = [GuildInfo(id=str(g.id), name=g.name, member_count=g.member_count or 0) for g in bot.guilds]
-    tts_service = getattr(request.app.state, "tts_service", None)
+    tts_service = getattr(state, "tts_service", None)
+    settings = bot.settings
 
     config = {
-        "max_text_length": bot.settings.max_text_length,
-        "cooldown_seconds": bot.settings.cooldown_seconds,
-        "max_queue_depth": bot.settings.max_queue_depth,
-        "requests_per_minute": bot.settings.requests_per_minute,
-        "required_role_id": bot.settings.required_role_id or "(none)",
+        "max_text_length": settings.max_text_length,
+        "cooldown_seconds": settings.cooldown_seconds,
+        "max_queue_depth": settings.max_queue_depth,
+        "requests_per_minute": settings.requests_per_minute,
+        "required_role_id": settings.required_role_id or "(none)",
         "tts_device": tts_service.device if tts_service else "unknown",
     }
 
@@ -54,20 +56,19 @@ async def get_bot_status(request: Request) -> BotStatusResponse:
 async def get_metrics(request: Request) -> MetricsResponse:
     """Return aggregated TTS request metrics."""
 
-    async with request.app.state.db_engine.connect() as conn:
+    state = request.app.state
+
+    async with state.db_engine.connect() as conn:
         metrics = await get_request_metrics(conn)
 
-    bot = getattr(request.app.state, "bot", None)
-    queue_depth = 0
-    if bot is not None:
-        state = bot.tts_queue.get_state()
-        queue_depth = state.depth
+    bot = getattr(state, "bot", None)
+    queue_depth = bot.tts_queue.get_state().depth if bot is not None else 0
 
-    cache = getattr(request.app.state, "audio_cache", None)
+    cache = getattr(state, "audio_cache", None)
     cache_size = cache.size if cache is not None else 0
 
-    registry = getattr(request.app.state, "voice_registry", None)
-    voices_loaded = len(registry.list_voices()) if registry is not None else 0
+    registry = getattr(state, "voice_registry", None)
+    voices_loaded = registry.size if registry is not None else 0
 
     top_users = [TopUserEntry(**u) for u in metrics.get("top_users", [])]
 
@@ -1,8 +1,10 @@
 """TTS generation API endpoints."""
 
 import asyncio
+import contextlib
 import logging
 from collections.abc import AsyncIterator
+from concurrent.futures import Executor
 from functools import partial
 
 from fastapi import APIRouter, HTTPException, Request
@@ -10,6 +12,7 @@ from starlette.responses import Response, StreamingResponse
 
 from doppelganger.db.queries.characters import get_character_overrides
 from doppelganger.models.tts import TTSGenerateRequest
+from doppelganger.tts.cache import cache_key
 from doppelganger.tts.exceptions import (
     TTSEngineUnavailableError,
     TTSGenerationError,
@@ -21,45 +24,49 @@ from doppelganger.tts.exceptions import (
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/api/tts", tags=["tts"])
 _generation_lock = asyncio.Lock()
+# Chunks buffered ahead of a streaming client before generation waits for it
+_STREAM_QUEUE_DEPTH = 4
 # Force download in Swagger UI - browser can't play audio inline
 _WAV_HEADERS = {"Content-Disposition": "attachment; filename=output.wav"}
+# Exception class -> (HTTP status, log message); subclasses map through their nearest listed base
+_TTS_ERROR_STATUS: dict[type[Exception], tuple[int, str]] = {
+    TTSVoiceNotFoundError: (404, "Voice not found"),
+    TTSOutOfMemoryError: (503, "TTS out of memory"),
+    TTSModelNotLoadedError: (503, "TTS model not loaded"),
+    TTSEngineUnavailableError: (503, "TTS engine unavailable"),
+    TTSGenerationError: (500, "TTS generation failed"),
+}
 
 
 def _map_tts_error(e: Exception) -> HTTPException:
     """Map TTS exceptions to HTTP errors."""
+    # The raised class itself is the usual hit, so this is one dict lookup in the common case
+    mapping = next((_TTS_ERROR_STATUS[cls] for cls in type(e).__mro__ if cls in _TTS_ERROR_STATUS), None)
+    if mapping is None:
+        logger.exception("Unexpected TTS error: %s", e)
+        return HTTPException(status_code=500, detail="Unexpected TTS error")
 
-    if isinstance(e, TTSVoiceNotFoundError):
-        logger.warning("Voice not found: %s", e)
-        return HTTPException(status_code=404, detail=str(e))
-    if isinstance(e, TTSOutOfMemoryError):
-        logger.error("TTS out of memory: %s", e)
-        return HTTPException(status_code=503, detail=str(e))
-    if isinstance(e, TTSModelNotLoadedError):
-        logger.error("TTS model not loaded: %s", e)
-        return HTTPException(status_code=503, detail=str(e))
-    if isinstance(e, TTSEngineUnavailableError):
-        logger.error("TTS engine unavailable: %s", e)
-        return HTTPException(status_code=503, detail=str(e))
-    if isinstance(e, TTSGenerationError):
-        logger.error("TTS generation failed: %s", e)
-        return HTTPException(status_code=500, detail=str(e))
-
-    logger.exception("Unexpected TTS error: %s", e)
-    return HTTPException(status_code=500, detail="Unexpected TTS error")
+    status_code, message = mapping
+    if status_code == 404:
+        logger.warning("%s: %s", message, e)
+    else:
+        logger.error("%s: %s", message, e)
+    return HTTPException(status_code=status_code, detail=str(e))
 
 
-@router.post("/generate")
-async def generate_speech(request: Request, body: TTSGenerateRequest) -> Response:
-    """Generate speech audio for the given text and character voice."""
+def _tts_executor(request: Request) -> Executor | None:
+    """Return the dedicated TTS executor, or None for the default one if the app didn't create it."""
+    return getattr(request.app.state, "tts_executor", None)
+
+
+async def _run_generation(request: Request, body: TTSGenerateRequest) -> bytes:
+    """Generate and cache audio for one request on the dedicated TTS executor, one generation at a time.
+
+    Called through _generate_once, so concurrent identical requests share a single call.
+    """
     tts_service = request.app.state.tts_service
-    cache = request.app.state.audio_cache
     db_engine = request.app.state.db_engine
 
-    cached = cache.get(body.character, body.text)
-    if cached is not None:
-        logger.debug("Cache hit for %s: %s", body.character, body.text[:30])
-        return Response(content=cached, media_type="audio/wav", headers=_WAV_HEADERS)
-
     async with db_engine.connect() as conn:
         overrides = await get_character_overrides(conn, body.character)
 
@@ -67,14 +74,59 @@ async def generate_speech(request: Request, body: TTSGenerateRequest) -> Respons
     async with _generation_lock:
         try:
             result = await loop.run_in_executor(
-                executor=None,
+                executor=_tts_executor(request),
                 func=partial(tts_service.generate, body.character, body.text, overrides),
             )
         except Exception as e:
             raise _map_tts_error(e) from e
 
-    cache.put(body.character, body.text, result.audio_bytes)
-    return Response(content=result.audio_bytes, media_type="audio/wav", headers=_WAV_HEADERS)
+    request.app.state.audio_cache.put(body.character, body.text, result.audio_bytes)
+    return result.audio_bytes
+
+
+def _tts_inflight(request: Request) -> dict[str, asyncio.Task[bytes]]:
+    """Return the app's map of running generations, keyed like the audio cache."""
+    return request.app.state.tts_inflight
+
+
+async def _generate_once(request: Request, body: TTSGenerateRequest) -> bytes:
+    """Generate audio, letting concurrent identical requests share a single in-flight generation."""
+    inflight = _tts_inflight(request)
+    key = cache_key(body.character, body.text)
+    task = inflight.get(key)
+    if task is None:
+        # A task of its own, so the generation finishes and fills the cache even if the request that started it
+        # disconnects
+        task = asyncio.create_task(_run_generation(request, body))
+        inflight[key] = task
+        task.add_done_callback(partial(_forget_inflight, inflight, key))
+    else:
+        logger.debug("Joining in-flight generation for %s: %s", body.character, body.text[:30])
+
+    # Shield so one request disconnecting doesn't cancel the shared generation for everyone else
+    return await asyncio.shield(task)
+
+
+def _forget_inflight(inflight: dict[str, asyncio.Task[bytes]], key: str, task: asyncio.Task[bytes]) -> None:
+    """Done callback: drop a finished generation from the in-flight map."""
+    inflight.pop(key, None)
+    # Mark a failure retrieved so asyncio doesn't log it when every waiting request had already gone
+    if not task.cancelled():
+        task.exception()
+
+
+@router.post("/generate")
+async def generate_speech(request: Request, body: TTSGenerateRequest) -> Response:
+    """Generate speech audio for the given text and character voice."""
+    cache = request.app.state.audio_cache
+
+    cached = cache.get(body.character, body.text)
+    if cached is not None:
+        logger.debug("Cache hit for %s: %s", body.character, body.text[:30])
+        return Response(content=cached, media_type="audio/wav", headers=_WAV_HEADERS)
+
+    audio = await _generate_once(request, body)
+    return Response(content=audio, media_type="audio/wav", headers=_WAV_HEADERS)
 
 
 @router.post("/stream")
@@ -82,28 +134,37 @@ async def stream_speech(request: Request, body: TTSGenerateRequest) -> Streaming
     """Stream speech audio chunks for the given text and character voice."""
     tts_service = request.app.state.tts_service
     db_engine = request.app.state.db_engine
-    queue: asyncio.Queue[bytes | None] = asyncio.Queue()
+    # Bounded so generation pauses when the client reads slower than chunks are produced
+    queue: asyncio.Queue[bytes | None] = asyncio.Queue(maxsize=_STREAM_QUEUE_DEPTH)
 
     async with db_engine.connect() as conn:
         overrides = await get_character_overrides(conn, body.character)
 
-    # Producer-consumer pattern: _producer generates audio chunks in a thread
-    # pool and pushes them into an asyncio.Queue; _stream yields from the
-    # queue so StreamingResponse can send bytes as they become available.
+    # Producer-consumer pattern: _producer advances the chunk generator one step
+    # at a time on the TTS executor and pushes each chunk into an asyncio.Queue;
+    # _stream yields from the queue so StreamingResponse sends audio as it's made.
     async def _producer() -> None:
         loop = asyncio.get_running_loop()
+        executor = _tts_executor(request)
         try:
-            chunks = await loop.run_in_executor(
-                executor=None,
-                func=partial(list, tts_service.generate_stream(body.character, body.text, overrides)),
-            )
-            for chunk in chunks:
-                await queue.put(chunk.audio_bytes)
+            # The engine keeps model state across steps, so the whole stream holds the lock other generations take;
+            # a slow client therefore delays them until its stream ends or disconnects
+            async with _generation_lock:
+                chunks = tts_service.generate_stream(body.character, body.text, overrides)
+                try:
+                    while (chunk := await loop.run_in_executor(executor, next, chunks, None)) is not None:
+                        await queue.put(chunk.audio_bytes)
+                finally:
+                    # Engines stream from generators; close on the TTS thread so their cleanup runs after the
+                    # last step instead of whenever the generator is garbage collected
+                    close = getattr(chunks, "close", None)
+                    if close is not None:
+                        await loop.run_in_executor(executor, close)
 
         except Exception as e:
             logger.error("Stream generation error: %s", e)
-        finally:
-            await queue.put(None)
+
+        await queue.put(None)
 
     async def _stream() -> AsyncIterator[bytes]:
         task = asyncio.create_task(_producer())
@@ -115,6 +176,9 @@ async def stream_speech(request: Request, body: TTSGenerateRequest) -> Streaming
 
                 yield data
         finally:
-            await task
+            # A disconnected client leaves the producer blocked on a full queue, so stop it
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
 
     return StreamingResponse(_stream(), media_type="audio/wav")
@@ -1,7 +1,6 @@
 """User management API endpoints."""
 
 import logging
-from dataclasses import asdict
 
 from fastapi import APIRouter, HTTPException, Query, Request
 
@@ -26,7 +25,7 @@ async def list_all_users(request: Request) -> UserListResponse:
     async with request.app.state.db_engine.connect() as conn:
         rows = await list_users(conn)
 
-    users = [UserResponse(**asdict(row)) for row in rows]
+    users = [UserResponse.model_construct(**vars(row)) for row in rows]
     return UserListResponse(users=users, count=len(users))
 
 
@@ -39,7 +38,12 @@ async def toggle_blacklist(request: Request, user_id: int, body: BlacklistReques
     if row is None:
         raise HTTPException(status_code=404, detail="User not found")
 
-    return UserResponse(**asdict(row))
+    # The bot caches blacklist checks, so drop the stale entry for this user
+    bot = getattr(request.app.state, "bot", None)
+    if bot is not None:
+        bot.blacklist_cache.invalidate(row.discord_id)
+
+    return UserResponse.model_construct(**vars(row))
 
 
 @router.get("/{user_id}/requests", response_model=TTSRequestListResponse)
@@ -59,5 +63,5 @@ async def get_user_requests(
 
         rows = await list_tts_requests_by_user(conn, user_id, status=filter_status)
 
-    requests_list = [TTSRequestResponse(**asdict(row)) for row in rows]
+    requests_list = [TTSRequestResponse.model_construct(**vars(row)) for row in rows]
     return TTSRequestListResponse(requests=requests_list, count=len(requests_list), total=len(requests_list))
@@ -4,12 +4,14 @@ import asyncio
 import logging
 import time
 from collections.abc import AsyncIterator
+from concurrent.futures import Executor, ThreadPoolExecutor
 from contextlib import asynccontextmanager
 from pathlib import Path
 
 from fastapi import FastAPI
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, Response
 from fastapi.staticfiles import StaticFiles
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
 from starlette.middleware.cors import CORSMiddleware
 
 import doppelganger._warnings as _warnings  # noqa: F401
@@ -27,7 +29,7 @@ from doppelganger.api.system import router as system_router
 from doppelganger.api.tts import router as tts_router
 from doppelganger.api.users import router as users_router
 from doppelganger.bot.client import DoppelgangerBot
-from doppelganger.config import get_settings
+from doppelganger.config import Settings, get_settings
 from doppelganger.db.engine import create_db_engine, dispose_db_engine
 from doppelganger.db.queries.characters import sync_voices_to_db
 from doppelganger.db.queries.tts_requests import fail_stale_requests
@@ -41,40 +43,84 @@ from doppelganger.tts.voice_registry import VoiceRegistry
 logger = logging.getLogger(__name__)
 
 
-@asynccontextmanager
-async def lifespan(app: FastAPI) -> AsyncIterator[None]:
-    """Manage startup and shutdown resources."""
-    app.state._started_at = time.monotonic()
-    settings = get_settings()
+async def _fail_stale_requests(conn: AsyncConnection) -> None:
+    """Mark requests left in progress by a previous run as failed."""
+    try:
+        # Savepoint so a failure here doesn't abort the voice sync sharing this transaction
+        async with conn.begin_nested():
+            stale_count = await fail_stale_requests(conn)
+
+        if stale_count > 0:
+            logger.info("Marked %d stale request(s) as failed on startup", stale_count)
+
+    except Exception:
+        logger.warning("Could not clean up stale requests", exc_info=True)
 
-    engine = create_db_engine(settings)
-    app.state.db_engine = engine
 
+async def _sync_voices(conn: AsyncConnection, registry: VoiceRegistry) -> None:
+    """Insert DB rows for voices found on disk."""
     try:
-        async with engine.begin() as conn:
-            stale_count = await fail_stale_requests(conn)
+        async with conn.begin_nested():
+            synced = await sync_voices_to_db(conn, registry)
 
-            if stale_count > 0:
-                logger.info("Marked %d stale request(s) as failed on startup", stale_count)
+        if synced > 0:
+            logger.info("Synced %d filesystem voice(s) to database", synced)
 
     except Exception:
-        logger.warning("Could not clean up stale requests (DB may not be ready)", exc_info=True)
+        logger.warning("Could not sync voices to database", exc_info=True)
 
-    registry = VoiceRegistry(settings.voices_dir)
-    registry.scan()
-    app.state.voice_registry = registry
+
+async def _startup_maintenance(engine: AsyncEngine, registry: VoiceRegistry) -> None:
+    """Scan the voices directory while cleaning up stale requests, then sync voices, over one connection."""
+    # Character directories whose deletion was cut short by a restart; the scan already skips hidden directories
+    purge = asyncio.create_task(asyncio.to_thread(registry.purge_tombstones))
+    # The scan doesn't need the DB, so it runs even if the database is unreachable
+    scan = asyncio.create_task(asyncio.to_thread(registry.scan))
 
     try:
         async with engine.begin() as conn:
-            synced = await sync_voices_to_db(conn, registry)
+            await _fail_stale_requests(conn)
+
+            await asyncio.wait([scan])
+            if scan.exception() is None:
+                await _sync_voices(conn, registry)
+
+    except Exception:
+        logger.warning("Could not run startup DB maintenance (DB may not be ready)", exc_info=True)
+
+    try:
+        purged = await purge
+        if purged > 0:
+            logger.info("Removed %d leftover deleted voice folder(s)", purged)
+    except Exception:
+        logger.warning("Could not remove partially deleted voice directories", exc_info=True)
+
+    # Surface a scan failure the same way as before it ran concurrently
+    await scan
 
-            if synced > 0:
-                logger.info("Synced %d filesystem voice(s) to database", synced)
 
+async def _load_tts_model(app: FastAPI, tts_service: TTSService, executor: Executor) -> None:
+    """Load TTS models on the TTS executor, falling back to degraded mode on failure."""
+    try:
+        await asyncio.get_running_loop().run_in_executor(executor, tts_service.load_model)
+        app.state.tts_ready = True
     except Exception:
-        logger.warning("Could not sync voices to database (DB may not be ready)", exc_info=True)
+        logger.warning("TTS model failed to load. Running in degraded mode", exc_info=True)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Manage startup and shutdown resources."""
+    app.state._started_at = time.monotonic()
+    settings: Settings = app.state.settings
+
+    engine = create_db_engine(settings)
+    app.state.db_engine = engine
+
+    registry = VoiceRegistry(settings.voices_dir)
+    app.state.voice_registry = registry
 
-    cache = AudioCache(max_size=settings.cache_max_size)
+    cache = AudioCache(max_size=settings.cache_max_size, eviction_policy=settings.cache_eviction_policy)
     app.state.audio_cache = cache
 
     chatterbox = ChatterboxEngine(settings.chatterbox)
@@ -88,18 +134,29 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     app.state.tts_service = tts_service
     app.state.tts_ready = False
 
-    try:
-        tts_service.load_model()
-        app.state.tts_ready = True
-    except Exception:
-        logger.warning("TTS model failed to load. Running in degraded mode", exc_info=True)
+    # One worker: engines drive a single loaded model, so TTS jobs from the API and bot queue here
+    # instead of competing with file I/O on the default executor
+    tts_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="tts")
+    app.state.tts_executor = tts_executor
+    # API generations currently running, keyed like the audio cache, so duplicate requests share one
+    app.state.tts_inflight = {}
+
+    # Model load can take tens of seconds, so it finishes in the background while the server starts
+    # taking requests; health reports degraded until tts_ready flips and generations queue behind it
+    load_task = asyncio.create_task(_load_tts_model(app, tts_service, tts_executor))
 
+    await _startup_maintenance(engine, registry)
+
+    # Started after maintenance so the bot never sees stale in-progress requests or an unscanned registry;
+    # it gets the load task to tell a model that is still loading from one that failed
     bot = DoppelgangerBot(
         settings=settings.discord,
         tts_service=tts_service,
         voice_registry=registry,
         audio_cache=cache,
         db_engine=engine,
+        tts_executor=tts_executor,
+        tts_load_task=load_task,
     )
     app.state.bot = bot
     bot_task: asyncio.Task[None] | None = None
@@ -113,9 +170,19 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     yield
 
     if bot_task is not None:
+        # close() ends the gateway loop; await the task so it fully unwinds before the loop goes away
         await bot.close()
         bot_task.cancel()
-
+        try:
+            await bot_task
+        except asyncio.CancelledError:
+            pass
+        except Exception:
+            logger.warning("Discord bot task exited with an error", exc_info=True)
+
+    # Let an unfinished load complete so the model isn't unloaded from under it
+    await load_task
+    tts_executor.shutdown(wait=True)
     tts_service.unload_model()
     await dispose_db_engine(engine)
 
@@ -132,7 +199,11 @@ def create_app() -> FastAPI:
         version="0.1.0",
         lifespan=lifespan,
     )
+    # Lifespan reads the settings this app was built with instead of resolving them again
+    app.state.settings = settings
 
+    # Middleware added last runs first: CORS is outermost so preflights are answered before any other work
+    app.add_middleware(RequestIDMiddleware)
     app.add_middleware(
         CORSMiddleware,
         allow_origins=settings.allowed_origins,
@@ -140,7 +211,6 @@ def create_app() -> FastAPI:
         allow_methods=["*"],
         allow_headers=["*"],
     )
-    app.add_middleware(RequestIDMiddleware)
 
     register_error_handlers(app)
     app.include_router(health_router)
@@ -163,14 +233,28 @@ def create_app() -> FastAPI:
             app.mount("/assets", StaticFiles(directory=str(assets_dir)), name="static-assets")
 
         index_html = dist_dir / "index.html"
-
-        @app.get("/{path:path}", include_in_schema=False)
-        async def spa_fallback(path: str) -> FileResponse:
-            """Serve the SPA index.html for all non-API routes."""
-            file_path = dist_dir / path
-            if file_path.is_file() and file_path.resolve().is_relative_to(dist_dir.resolve()):
-                return FileResponse(str(file_path))
-
-            return FileResponse(str(index_html))
+        # A partial build without index.html still serves its assets, just without the SPA fallback
+        if index_html.is_file():
+            # Every client-side route falls back to index.html, so keep its (small) body in memory
+            index_body = index_html.read_bytes()
+
+            # The build output doesn't change while the server runs, so resolve and stat servable files
+            # once instead of on every request
+            dist_root = dist_dir.resolve()
+            spa_files = {
+                p.relative_to(dist_dir).as_posix(): (str(p), p.stat())
+                for p in dist_dir.rglob("*")
+                if p.is_file() and p.resolve().is_relative_to(dist_root)
+            }
+
+            @app.get("/{path:path}", include_in_schema=False)
+            async def spa_fallback(path: str) -> Response:
+                """Serve the SPA index.html for all non-API routes."""
+                spa_file = spa_files.get(path)
+                if spa_file is not None:
+                    file_path, stat_result = spa_file
+                    return FileResponse(file_path, stat_result=stat_result)
+
+                return Response(content=index_body, media_type="text/html")
 
     return app
@@ -5,29 +5,43 @@ import logging
 import discord
 from sqlalchemy.ext.asyncio import AsyncEngine
 
+from doppelganger.bot.ttl_cache import TTLCache
 from doppelganger.db.queries.users import get_user_by_discord_id
 
 logger = logging.getLogger(__name__)
 
 
-async def has_required_role(interaction: discord.Interaction, required_role_id: str) -> bool:
+class BlacklistCache(TTLCache[str, bool]):
+    """Bounded TTL cache of blacklist status keyed by Discord user ID."""
+
+    def __init__(self, max_size: int = 4096, ttl_seconds: float = 60.0) -> None:
+        super().__init__(max_size, ttl_seconds)
+
+
+async def has_required_role(interaction: discord.Interaction, required_role_id: int | None) -> bool:
     """Check if the user has the required role. Returns True if no role is configured."""
-    if not required_role_id:
+    if required_role_id is None:
         return True
 
     if not isinstance(interaction.user, discord.Member):
         return False
 
-    role_id = int(required_role_id)
-    return any(role.id == role_id for role in interaction.user.roles)
+    # Member keeps its role IDs sorted, so get_role is a binary search rather than a scan of every role
+    return interaction.user.get_role(required_role_id) is not None
 
 
-async def is_not_blacklisted(db_engine: AsyncEngine, discord_id: str) -> bool:
+async def is_not_blacklisted(db_engine: AsyncEngine, discord_id: str, cache: BlacklistCache | None = None) -> bool:
     """Check if the user is not blacklisted. Returns True if user doesn't exist or isn't blacklisted."""
+    if cache is not None:
+        cached = cache.get(discord_id)
+        if cached is not None:
+            return not cached
+
     async with db_engine.connect() as conn:
         user = await get_user_by_discord_id(conn, discord_id)
 
-    if user is None:
-        return True
+    blacklisted = user is not None and user.blacklisted
+    if cache is not None:
+        cache.put(discord_id, blacklisted)
 
-    return not user.blacklisted
+    return not blacklisted
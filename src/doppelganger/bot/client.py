@@ -1,13 +1,18 @@
 """Discord bot client for Doppelganger TTS."""
 
+import asyncio
 import logging
 import time
+from concurrent.futures import Executor
 
 import discord
 from discord.ext import commands
 from sqlalchemy.ext.asyncio import AsyncEngine
 
+from doppelganger.bot.checks import BlacklistCache
+from doppelganger.bot.overrides import OverridesCache
 from doppelganger.bot.queue import RateLimiter, TTSQueue
+from doppelganger.bot.voice import VoiceManager
 from doppelganger.config import DiscordSettings
 from doppelganger.tts.cache import AudioCache
 from doppelganger.tts.service import TTSService
@@ -26,6 +31,8 @@ class DoppelgangerBot(commands.Bot):
         voice_registry: VoiceRegistry,
         audio_cache: AudioCache,
         db_engine: AsyncEngine,
+        tts_executor: Executor | None = None,
+        tts_load_task: asyncio.Task[None] | None = None,
     ) -> None:
         intents = discord.Intents.default()
         intents.message_content = True
@@ -34,12 +41,25 @@ class DoppelgangerBot(commands.Bot):
         super().__init__(command_prefix=settings.command_prefix, intents=intents)
 
         self.settings = settings
+        # Parsed once here rather than on every gated command
+        self.required_role_id = int(settings.required_role_id) if settings.required_role_id else None
         self.tts_service = tts_service
         self.voice_registry = voice_registry
         self.audio_cache = audio_cache
         self.db_engine = db_engine
+        self.tts_executor = tts_executor
+        # Background model load started by the app; None when the model was loaded up front
+        self.tts_load_task = tts_load_task
         self.tts_queue = TTSQueue(max_depth=settings.max_queue_depth)
         self.rate_limiter = RateLimiter(requests_per_minute=settings.requests_per_minute)
+        self.blacklist_cache = BlacklistCache()
+        self.overrides_cache = OverridesCache()
+        # Owned by the bot so cog reloads keep per-guild cooldowns and voice state
+        self.voice_manager = VoiceManager(
+            cooldown_seconds=settings.cooldown_seconds,
+            entrance_sound=settings.entrance_sound,
+            idle_seconds=settings.voice_idle_seconds,
+        )
         self._started_at: float = time.monotonic()
 
     async def setup_hook(self) -> None:
@@ -13,16 +13,15 @@ from discord.ext import commands
 
 from doppelganger.bot.checks import has_required_role, is_not_blacklisted
 from doppelganger.bot.queue import QueueFullError, QueueItem
-from doppelganger.bot.voice import VoiceManager
+from doppelganger.bot.voice import decode_to_pcm
 from doppelganger.db.queries.audit_log import create_audit_entry
 from doppelganger.db.queries.characters import get_character_overrides
 from doppelganger.db.queries.tts_requests import (
-    create_tts_request,
     mark_tts_request_completed,
     mark_tts_request_started,
     update_tts_request_status,
+    upsert_user_and_create_request,
 )
-from doppelganger.db.queries.users import create_user, get_user_by_discord_id, update_username
 from doppelganger.db.request_status import RequestStatus
 
 if TYPE_CHECKING:
@@ -37,10 +36,7 @@ class TTSCog(commands.Cog):
     def __init__(self, bot: DoppelgangerBot) -> None:
         self.bot = bot
         self.max_text_length: int = bot.settings.max_text_length
-        self.voice_manager = VoiceManager(
-            cooldown_seconds=bot.settings.cooldown_seconds,
-            entrance_sound=bot.settings.entrance_sound,
-        )
+        self.voice_manager = bot.voice_manager
         self._worker_task: asyncio.Task[None] | None = None
 
     async def cog_load(self) -> None:
@@ -49,12 +45,14 @@ class TTSCog(commands.Cog):
         logger.info("TTS queue worker started")
 
     async def cog_unload(self) -> None:
-        """Stop the queue worker when the cog unloads."""
+        """Stop the queue worker and leave any voice channels when the cog unloads."""
         if self._worker_task is not None:
             self._worker_task.cancel()
             self._worker_task = None
             logger.info("TTS queue worker stopped")
 
+        await self.voice_manager.shutdown()
+
     async def _queue_worker(self) -> None:
         """Background worker that processes queued TTS requests."""
         while True:
@@ -82,11 +80,16 @@ class TTSCog(commands.Cog):
 
     async def _process_item(self, item: QueueItem) -> None:
         """Generate TTS audio, play it, and update the database for a single queue item."""
+        # Tuning rarely changes between consecutive items for the same character
+        overrides = self.bot.overrides_cache.get(item.character)
+
+        # One pooled connection for both; generation happens after it is returned to the pool
         async with self.bot.db_engine.begin() as conn:
             await mark_tts_request_started(conn, item.request_id)
-
-        async with self.bot.db_engine.connect() as conn:
-            overrides = await get_character_overrides(conn, item.character)
+            if overrides is None:
+                overrides = await get_character_overrides(conn, item.character)
+                if overrides is not None:
+                    self.bot.overrides_cache.put(item.character, overrides)
 
         cached = self.bot.audio_cache.get(item.character, item.text)
         if cached is not None:
@@ -96,13 +99,25 @@ class TTSCog(commands.Cog):
             loop = asyncio.get_running_loop()
             start_time = time.monotonic()
             result = await loop.run_in_executor(
-                None, self.bot.tts_service.generate, item.character, item.text, overrides
+                self.bot.tts_executor, self.bot.tts_service.generate, item.character, item.text, overrides
             )
             duration_ms = int((time.monotonic() - start_time) * 1000)
             audio_bytes = result.audio_bytes
             self.bot.audio_cache.put(item.character, item.text, audio_bytes)
 
-        await self.voice_manager.play(item.channel, audio_bytes)
+        # Decode once per cached clip so replays go straight to Discord without an FFmpeg process
+        pcm = self.bot.audio_cache.get_pcm(item.character, item.text)
+        if pcm is None and self.bot.audio_cache.enabled:
+            try:
+                pcm = await decode_to_pcm(audio_bytes)
+                self.bot.audio_cache.set_pcm(item.character, item.text, pcm)
+            except Exception:
+                # Playback can still decode the WAV on the fly, so a failed pre-decode only costs the shortcut
+                logger.warning(
+                    "PCM pre-decode failed for request %d, streaming WAV instead", item.request_id, exc_info=True
+                )
+
+        await self.voice_manager.play(item.channel, audio_bytes, pcm=pcm)
 
         async with self.bot.db_engine.begin() as conn:
             await mark_tts_request_completed(conn, item.request_id, duration_ms)
@@ -129,15 +144,25 @@ class TTSCog(commands.Cog):
         """Generate TTS audio for the given text and play it in a voice channel."""
         await interaction.response.defer(ephemeral=True)
 
-        if not await has_required_role(interaction, self.bot.settings.required_role_id):
+        if not await has_required_role(interaction, self.bot.required_role_id):
             await interaction.followup.send("You don't have the required role to use this command.")
             return
 
         discord_id = str(interaction.user.id)
-        if not await is_not_blacklisted(self.bot.db_engine, discord_id):
+        if not await is_not_blacklisted(self.bot.db_engine, discord_id, self.bot.blacklist_cache):
             await interaction.followup.send("You have been blacklisted from using this bot.")
             return
 
+        # The bot comes online while the model is still loading; don't spend the user's rate limit on it
+        load_task = self.bot.tts_load_task
+        if load_task is not None and not load_task.done():
+            await interaction.followup.send("The voice model is still warming up. Try again in a moment.")
+            return
+
+        if not self.bot.tts_service.is_loaded:
+            await interaction.followup.send("Text-to-speech is unavailable because the voice model failed to load.")
+            return
+
         if not self.bot.rate_limiter.try_acquire(discord_id):
             remaining = self.bot.rate_limiter.remaining(discord_id)
             await interaction.followup.send(f"Rate limit reached. You have {remaining} requests remaining this minute.")
@@ -177,16 +202,9 @@ class TTSCog(commands.Cog):
 
         try:
             async with self.bot.db_engine.begin() as conn:
-                user = await get_user_by_discord_id(conn, discord_id)
-
-                if user is None:
-                    user = await create_user(conn, discord_id, username=display_name)
-                elif user.username != display_name:
-                    await update_username(conn, user.id, display_name)
-
-                user_id: int = user.id
-                request_row = await create_tts_request(conn, user_id, character, text)
-                request_id: int = request_row.id
+                user_id, request_id = await upsert_user_and_create_request(
+                    conn, discord_id, display_name, character, text
+                )
 
         except Exception:
             logger.exception("Error creating TTS request")
@@ -224,9 +242,9 @@ class TTSCog(commands.Cog):
         current: str,
     ) -> list[app_commands.Choice[str]]:
         """Provide autocomplete suggestions for the character parameter."""
-        voices = self.bot.voice_registry.list_voices()
-        matches = [v for v in voices if current.lower() in v.name.lower()]
-        return [app_commands.Choice(name=v.name, value=v.name) for v in matches[:25]]
+        # Discord shows at most 25 choices
+        names = self.bot.voice_registry.search_names(current, 25)
+        return [app_commands.Choice(name=name, value=name) for name in names]
 
     @app_commands.command(name="voices", description="List available character voices")
     async def voices(self, interaction: discord.Interaction) -> None:
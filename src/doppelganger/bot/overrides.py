@@ -0,0 +1,11 @@
+"""Short-lived cache of per-character TTS overrides for the queue worker."""
+
+from doppelganger.bot.ttl_cache import TTLCache
+from doppelganger.tts.engine import TTSOverrides
+
+
+class OverridesCache(TTLCache[str, TTSOverrides]):
+    """Bounded TTL cache of character tuning overrides keyed by character name."""
+
+    def __init__(self, max_size: int = 128, ttl_seconds: float = 60.0) -> None:
+        super().__init__(max_size, ttl_seconds)
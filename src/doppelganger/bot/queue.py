@@ -3,7 +3,7 @@
 import asyncio
 import logging
 import time
-from collections import deque
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from typing import Any
 
@@ -50,71 +50,121 @@ class QueueItem:
 
 
 class RateLimiter:
-    """Sliding-window per-user rate limiter."""
+    """Token-bucket per-user rate limiter refilling requests_per_minute tokens over each minute."""
 
     _WINDOW_SECONDS = 60
+    # How often idle buckets are dropped
+    _SWEEP_INTERVAL_SECONDS = 300
 
     def __init__(self, requests_per_minute: int) -> None:
         self._max_rpm = requests_per_minute
-        self._timestamps: dict[str, deque[float]] = {}
+        # user_id -> (tokens left, monotonic time they were counted)
+        self._buckets: dict[str, tuple[float, float]] = {}
+        self._last_sweep = time.monotonic()
 
-    def _cleanup(self, user_id: str, now: float) -> deque[float]:
-        """Remove expired timestamps for a user and return their deque."""
-        if user_id not in self._timestamps:
-            self._timestamps[user_id] = deque()
+    def _tokens(self, user_id: str, now: float) -> float:
+        """Return the user's tokens refilled up to now. Users without a bucket have a full one."""
+        bucket = self._buckets.get(user_id)
+        if bucket is None:
+            return float(self._max_rpm)
 
-        timestamps = self._timestamps[user_id]
-        while timestamps and now - timestamps[0] > self._WINDOW_SECONDS:
-            timestamps.popleft()
+        tokens, counted_at = bucket
+        return min(float(self._max_rpm), tokens + (now - counted_at) * self._max_rpm / self._WINDOW_SECONDS)
 
-        return timestamps
+    def _sweep(self, now: float) -> None:
+        """Drop buckets idle for a full window; they have refilled completely, same as having no bucket."""
+        if now - self._last_sweep < self._SWEEP_INTERVAL_SECONDS:
+            return
+
+        self._last_sweep = now
+        self._buckets = {
+            user_id: bucket for user_id, bucket in self._buckets.items() if now - bucket[1] < self._WINDOW_SECONDS
+        }
 
     def try_acquire(self, user_id: str) -> bool:
-        """Check if the user is within rate limits and record the attempt if allowed."""
+        """Take a token for the user if one is available."""
         if self._max_rpm <= 0:
             return True
 
         now = time.monotonic()
-        timestamps = self._cleanup(user_id, now)
+        self._sweep(now)
 
-        if len(timestamps) >= self._max_rpm:
+        tokens = self._tokens(user_id, now)
+        if tokens < 1:
             return False
 
-        timestamps.append(now)
+        self._buckets[user_id] = (tokens - 1, now)
         return True
 
     def remaining(self, user_id: str) -> int:
-        """Return how many requests the user has left in the current window."""
+        """Return how many whole requests the user can make right now."""
         if self._max_rpm <= 0:
             return 999
 
-        now = time.monotonic()
+        return int(self._tokens(user_id, time.monotonic()))
+
+
+class _PendingRequests(asyncio.Queue[QueueItem]):
+    """Bounded asyncio queue stored as an OrderedDict keyed by request ID.
+
+    Keyed storage lets cancel and bump find, remove or reorder a waiting request in O(1)
+    while put/get keep asyncio.Queue's bounding and waiter handling.
+    """
+
+    _queue: OrderedDict[int, QueueItem]
 
-        if user_id not in self._timestamps:
-            return self._max_rpm
+    def _init(self, maxsize: int) -> None:
+        """asyncio.Queue storage hook: start with an empty ordered map."""
+        self._queue = OrderedDict()
 
-        timestamps = self._cleanup(user_id, now)
-        return max(0, self._max_rpm - len(timestamps))
+    def _put(self, item: QueueItem) -> None:
+        """asyncio.Queue storage hook: append behind every waiting request."""
+        self._queue[item.request_id] = item
+
+    def _get(self) -> QueueItem:
+        """asyncio.Queue storage hook: take the front request."""
+        return self._queue.popitem(last=False)[1]
+
+    def remove(self, request_id: int) -> bool:
+        """Drop a waiting request. Returns True if it was queued."""
+        return self._queue.pop(request_id, None) is not None
+
+    def move_to_front(self, request_id: int) -> bool:
+        """Make a waiting request the next one out. Returns True if it was queued."""
+        if request_id not in self._queue:
+            return False
+        self._queue.move_to_end(request_id, last=False)
+        return True
+
+    def index(self, request_id: int) -> int | None:
+        """0-based position of a waiting request, or None if not queued."""
+        for i, queued_id in enumerate(self._queue):
+            if queued_id == request_id:
+                return i
+        return None
+
+    def items(self) -> list[QueueItem]:
+        """Waiting requests in the order they will be dequeued."""
+        return list(self._queue.values())
 
 
 class TTSQueue:
     """Async TTS request queue with cancel and bump support."""
 
     def __init__(self, max_depth: int = 20) -> None:
-        self._items: deque[QueueItem] = deque()
+        self._queue = _PendingRequests(maxsize=max_depth)
         self._max_depth = max_depth
-        self._condition = asyncio.Condition()
         self._processing: QueueItem | None = None
 
     @property
     def depth(self) -> int:
         """Number of items waiting in the queue (not including the one being processed)."""
-        return len(self._items)
+        return self._queue.qsize()
 
     @property
     def is_full(self) -> bool:
         """Check if the queue has reached max depth."""
-        return len(self._items) >= self._max_depth
+        return self._queue.full()
 
     @property
     def processing(self) -> QueueItem | None:
@@ -123,26 +173,20 @@ class TTSQueue:
 
     async def submit(self, item: QueueItem) -> int:
         """Add a request to the queue. Returns 1-based queue position."""
-        async with self._condition:
-            if self.is_full:
-                raise QueueFullError(self._max_depth)
+        try:
+            self._queue.put_nowait(item)
+        except asyncio.QueueFull:
+            raise QueueFullError(self._max_depth) from None
 
-            self._items.append(item)
-            position = len(self._items)
-
-            self._condition.notify()
-            logger.info("Queued request %d at position %d", item.request_id, position)
-            return position
+        position = self._queue.qsize()
+        logger.info("Queued request %d at position %d", item.request_id, position)
+        return position
 
     async def dequeue(self) -> QueueItem:
         """Wait for and return the next item. Blocks until an item is available."""
-        async with self._condition:
-            while not self._items:
-                await self._condition.wait()
-
-            item = self._items.popleft()
-            self._processing = item
-            return item
+        item = await self._queue.get()
+        self._processing = item
+        return item
 
     def mark_done(self) -> None:
         """Mark the currently-processing item as finished."""
@@ -150,33 +194,24 @@ class TTSQueue:
 
     async def cancel(self, request_id: int) -> bool:
         """Remove a pending request from the queue. Returns True if found and removed."""
-        async with self._condition:
-            for i, item in enumerate(self._items):
-                if item.request_id == request_id:
-                    del self._items[i]
-                    logger.info("Cancelled request %d", request_id)
-                    return True
+        if not self._queue.remove(request_id):
+            return False
 
-        return False
+        logger.info("Cancelled request %d", request_id)
+        return True
 
     async def bump(self, request_id: int) -> bool:
         """Move a pending request to the front of the queue. Returns True if found."""
-        async with self._condition:
-            for i, item in enumerate(self._items):
-                if item.request_id == request_id:
-                    del self._items[i]
-                    self._items.appendleft(item)
-                    logger.info("Bumped request %d to front", request_id)
-                    return True
+        if not self._queue.move_to_front(request_id):
+            return False
 
-        return False
+        logger.info("Bumped request %d to front", request_id)
+        return True
 
     def position(self, request_id: int) -> int | None:
         """Get the 1-based queue position of a request, or None if not found."""
-        for i, item in enumerate(self._items):
-            if item.request_id == request_id:
-                return i + 1
-        return None
+        index = self._queue.index(request_id)
+        return None if index is None else index + 1
 
     def _item_to_state(self, item: QueueItem) -> QueueItemState:
         """Convert a QueueItem to a serializable state dict."""
@@ -191,7 +226,7 @@ class TTSQueue:
 
     def get_state(self) -> QueueState:
         """Return the current queue state for API consumption."""
-        pending = [self._item_to_state(item) for item in self._items]
+        pending = [self._item_to_state(item) for item in self._queue.items()]
 
         processing = None
         if self._processing is not None:
@@ -11,14 +11,46 @@ import discord
 
 logger = logging.getLogger(__name__)
 
+# Discord voice plays 48 kHz stereo signed 16-bit little-endian PCM
+_PCM_FFMPEG_ARGS = ("-f", "s16le", "-ar", "48000", "-ac", "2")
+
+
+async def decode_to_pcm(audio_bytes: bytes) -> bytes:
+    """Decode audio to raw PCM in Discord's playback format with a single FFmpeg run."""
+    process = await asyncio.create_subprocess_exec(
+        "ffmpeg",
+        "-hide_banner",
+        "-loglevel",
+        "error",
+        "-i",
+        "pipe:0",
+        *_PCM_FFMPEG_ARGS,
+        "pipe:1",
+        stdin=asyncio.subprocess.PIPE,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+    )
+    pcm, stderr = await process.communicate(audio_bytes)
+    if process.returncode != 0:
+        msg = f"FFmpeg exited with {process.returncode}: {stderr.decode(errors='replace').strip()}"
+        raise RuntimeError(msg)
+    return pcm
+
 
 class VoiceManager:
     """Manages voice channel connections and audio playback."""
 
-    def __init__(self, cooldown_seconds: int, entrance_sound: str = "") -> None:
+    def __init__(self, cooldown_seconds: int, entrance_sound: str = "", idle_seconds: float = 300) -> None:
         self._cooldown_seconds = cooldown_seconds
+        self._idle_seconds = idle_seconds
         self._last_play_time: dict[int, float] = {}
         self._entrance_sound: Path | None = None
+        # Decoded on the first join and replayed from memory after that
+        self._entrance_pcm: bytes | None = None
+        # Voice connections kept open between plays, so each item skips the websocket + UDP handshake
+        self._clients: dict[int, discord.VoiceClient] = {}
+        self._idle_timers: dict[int, asyncio.TimerHandle] = {}
+        self._disconnect_tasks: set[asyncio.Task[None]] = set()
 
         if entrance_sound:
             path = Path(entrance_sound)
@@ -55,25 +87,88 @@ class VoiceManager:
         voice_client.play(source, after=_after_callback)
         await done_event.wait()
 
+    async def _connect(self, channel: discord.VoiceChannel) -> tuple[discord.VoiceClient, bool]:
+        """Return a connected client for the channel's guild and whether it just joined the channel."""
+        guild_id = channel.guild.id
+        voice_client = self._clients.get(guild_id)
+
+        if voice_client is not None and voice_client.is_connected():
+            if voice_client.channel.id == channel.id:
+                return voice_client, False
+            await voice_client.move_to(channel)
+            logger.debug("Moved to voice channel %s in guild %s", channel.name, guild_id)
+            return voice_client, True
+
+        if voice_client is not None:
+            # Stale socket: clear discord.py's record of it so connect() doesn't see an existing client
+            await voice_client.disconnect(force=True)
+
+        voice_client = await channel.connect()
+        self._clients[guild_id] = voice_client
+        logger.debug("Connected to voice channel %s in guild %s", channel.name, guild_id)
+        return voice_client, True
+
+    def _reset_idle_timer(self, guild_id: int) -> None:
+        """(Re)start the countdown to leaving the guild's voice channel."""
+        timer = self._idle_timers.pop(guild_id, None)
+        if timer is not None:
+            timer.cancel()
+        loop = asyncio.get_running_loop()
+        self._idle_timers[guild_id] = loop.call_later(self._idle_seconds, self._maybe_disconnect, guild_id)
+
+    def _maybe_disconnect(self, guild_id: int) -> None:
+        """Idle timer callback: leave the voice channel if nothing has played since the timer started."""
+        self._idle_timers.pop(guild_id, None)
+        task = asyncio.create_task(self._disconnect(guild_id))
+        self._disconnect_tasks.add(task)
+        task.add_done_callback(self._disconnect_tasks.discard)
+
+    async def _disconnect(self, guild_id: int) -> None:
+        """Disconnect and forget the guild's voice client."""
+        timer = self._idle_timers.pop(guild_id, None)
+        if timer is not None:
+            timer.cancel()
+
+        voice_client = self._clients.pop(guild_id, None)
+        if voice_client is None:
+            return
+        try:
+            await voice_client.disconnect()
+            logger.debug("Disconnected from voice in guild %s", guild_id)
+        except Exception:
+            logger.exception("Failed to disconnect from voice in guild %s", guild_id)
+
     async def play(
         self,
         channel: discord.VoiceChannel,
         audio_bytes: bytes,
         *,
+        pcm: bytes | None = None,
         after: Callable[..., object] | None = None,
     ) -> None:
-        """Join channel, play optional entrance sound then WAV bytes, leave after playback."""
+        """Join or reuse the guild's voice connection, play the entrance sound on join, then the audio.
+
+        When pcm holds the audio already decoded by decode_to_pcm, it is played directly instead of the WAV bytes.
+        """
         guild_id = channel.guild.id
-        voice_client: discord.VoiceClient | None = None
+        timer = self._idle_timers.pop(guild_id, None)
+        if timer is not None:
+            timer.cancel()
+
         try:
-            voice_client = await channel.connect()
-            logger.debug("Connected to voice channel %s in guild %s", channel.name, guild_id)
+            voice_client, joined = await self._connect(channel)
 
-            if self._entrance_sound is not None:
-                entrance_source = discord.FFmpegPCMAudio(str(self._entrance_sound))
-                await self._play_source(voice_client, entrance_source, guild_id)
+            if joined and self._entrance_sound is not None:
+                if self._entrance_pcm is None:
+                    entrance_bytes = await asyncio.to_thread(self._entrance_sound.read_bytes)
+                    self._entrance_pcm = await decode_to_pcm(entrance_bytes)
+                await self._play_source(voice_client, discord.PCMAudio(io.BytesIO(self._entrance_pcm)), guild_id)
 
-            tts_source = discord.FFmpegPCMAudio(io.BytesIO(audio_bytes), pipe=True)
+            # Pre-decoded PCM skips spawning FFmpeg; WAV bytes are decoded on the fly as a fallback
+            if pcm is not None:
+                tts_source: discord.AudioSource = discord.PCMAudio(io.BytesIO(pcm))
+            else:
+                tts_source = discord.FFmpegPCMAudio(io.BytesIO(audio_bytes), pipe=True)
             await self._play_source(voice_client, tts_source, guild_id)
 
             if after is not None:
@@ -83,8 +178,13 @@ class VoiceManager:
 
         except Exception:
             logger.exception("Voice playback failed in guild %s, channel %s", guild_id, channel.name)
+            # The connection may be half-open after a failure; start clean on the next play
+            await self._disconnect(guild_id)
             raise
 
-        finally:
-            if voice_client is not None:
-                await voice_client.disconnect()
+        self._reset_idle_timer(guild_id)
+
+    async def shutdown(self) -> None:
+        """Leave every voice channel the bot is still connected to."""
+        for guild_id in list(self._clients):
+            await self._disconnect(guild_id)
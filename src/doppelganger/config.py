@@ -5,6 +5,8 @@ from functools import lru_cache
 from pydantic import BaseModel, Field, SecretStr
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+from doppelganger.tts.cache import CacheEvictionPolicy
+
 
 class DatabaseSettings(BaseModel):
     """PostgreSQL connection settings."""
@@ -16,6 +18,8 @@ class DatabaseSettings(BaseModel):
     name: str = Field(default="doppelganger", description="Database name")
     pool_size: int = Field(default=5, description="Number of persistent connections in the pool")
     pool_max_overflow: int = Field(default=10, description="Max temporary connections above pool_size")
+    pool_timeout: float = Field(default=30.0, description="Seconds to wait for a free pooled connection")
+    pool_recycle: int = Field(default=1800, description="Seconds before an idle connection is replaced (-1 disables)")
 
     @property
     def async_url(self) -> str:
@@ -38,6 +42,9 @@ class ChatterboxSettings(BaseModel):
     cfg_weight: float = Field(default=3.0, description="Classifier-free guidance strength for voice cloning fidelity")
     temperature: float = Field(default=0.5, description="Sampling temperature; higher produces more variation")
     chunk_size: int = Field(default=50, description="Number of tokens per streaming chunk")
+    half_precision: bool = Field(default=False, description="Run CUDA inference under fp16 autocast")
+    compile_model: bool = Field(default=False, description="torch.compile the T3 transformer backbone on load")
+    warmup: bool = Field(default=False, description="Run a short generation after load to pay one-time setup costs")
 
 
 class OrpheusSettings(BaseModel):
@@ -69,9 +76,12 @@ class DiscordSettings(BaseModel):
     cooldown_seconds: int = Field(default=5, description="Per-guild cooldown between TTS plays in seconds")
     command_prefix: str = Field(default="!", description="Prefix for text-based commands (slash commands are always /)")
     entrance_sound: str = Field(default="", description="Path to a WAV file played when the bot joins a voice channel")
+    voice_idle_seconds: int = Field(
+        default=300, description="Seconds to stay in a voice channel after the last play before disconnecting"
+    )
     max_text_length: int = Field(default=255, description="Max characters per /say request")
     max_queue_depth: int = Field(default=20, description="Max pending requests in the TTS queue before rejecting")
-    requests_per_minute: int = Field(default=3, description="Per-user rate limit for /say requests per rolling minute")
+    requests_per_minute: int = Field(default=3, description="Per-user /say requests per minute, refilled steadily")
 
 
 class Settings(BaseSettings):
@@ -91,6 +101,9 @@ class Settings(BaseSettings):
     allowed_origins: list[str] = Field(default=["*"], description="CORS allowed origins for the API")
     voices_dir: str = Field(default="voices", description="Directory containing character voice subdirectories")
     cache_max_size: int = Field(default=100, description="Max entries in the in-memory audio LRU cache")
+    cache_eviction_policy: CacheEvictionPolicy = Field(
+        default=CacheEvictionPolicy.LRU, description="Audio cache eviction policy: lru, counter, or importance"
+    )
 
     database: DatabaseSettings = Field(default_factory=DatabaseSettings, description="PostgreSQL connection settings")
     chatterbox: ChatterboxSettings = Field(
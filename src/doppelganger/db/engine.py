@@ -1,20 +1,56 @@
 """Async SQLAlchemy engine creation and lifecycle management."""
 
+import asyncio
+
 from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
 
 from doppelganger.config import Settings
 
+# Live engines keyed by event loop, URL and pool options, with the number of apps currently holding each one
+_engines: dict[tuple[object, ...], tuple[AsyncEngine, int]] = {}
+
+
+def _engine_key(settings: Settings) -> tuple[object, ...]:
+    """Identify engines that can be shared: same event loop, same database and same pool configuration."""
+    db = settings.database
+    # asyncpg connections belong to the loop that opened them, so apps on other loops never share a pool.
+    # The loop object itself (not its id) is held so a finished loop's id can't be reused by a new one
+    loop = asyncio.get_running_loop()
+    return (loop, db.async_url, db.pool_size, db.pool_max_overflow, db.pool_timeout, db.pool_recycle)
+
 
 def create_db_engine(settings: Settings) -> AsyncEngine:
-    """Create an async SQLAlchemy engine with connection pooling."""
-    return create_async_engine(
+    """Create a pooled async SQLAlchemy engine, reusing a live one on this loop with the same settings.
+
+    Must be called from a running event loop.
+    """
+    key = _engine_key(settings)
+    shared = _engines.get(key)
+    if shared is not None:
+        engine, refs = shared
+        _engines[key] = (engine, refs + 1)
+        return engine
+
+    engine = create_async_engine(
         settings.database.async_url,
         pool_size=settings.database.pool_size,
         max_overflow=settings.database.pool_max_overflow,
+        pool_timeout=settings.database.pool_timeout,
+        pool_recycle=settings.database.pool_recycle,
         pool_pre_ping=True,
     )
+    _engines[key] = (engine, 1)
+    return engine
 
 
 async def dispose_db_engine(engine: AsyncEngine) -> None:
-    """Dispose the engine and close all pooled connections."""
+    """Release the engine, closing all pooled connections once no other app is using it."""
+    for key, (shared, refs) in _engines.items():
+        if shared is engine:
+            if refs > 1:
+                _engines[key] = (shared, refs - 1)
+                return
+            del _engines[key]
+            break
+
     await engine.dispose()
@@ -5,6 +5,7 @@ import logging
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncConnection
 
+from doppelganger.db.queries.voice_registry_state import get_voice_fingerprint, set_voice_fingerprint
 from doppelganger.db.types import CharacterRow
 from doppelganger.tts.engine import TTSOverrides
 from doppelganger.tts.voice_registry import VoiceRegistry
@@ -118,8 +119,13 @@ async def get_character_overrides(conn: AsyncConnection, character_name: str) ->
 async def sync_voices_to_db(conn: AsyncConnection, registry: VoiceRegistry) -> int:
     """Insert DB rows for any filesystem voices not already in the characters table.
 
-    Returns the number of new rows created.
+    Returns the number of new rows created. Skipped when the voices directory is unchanged since the last sync.
     """
+    fingerprint = registry.fingerprint
+    if fingerprint is not None and fingerprint == await get_voice_fingerprint(conn):
+        logger.debug("Voices directory unchanged since last sync, skipping")
+        return 0
+
     existing = await list_characters(conn)
     existing_names = {c.name for c in existing}
 
@@ -130,4 +136,7 @@ async def sync_voices_to_db(conn: AsyncConnection, registry: VoiceRegistry) -> i
             logger.info("Synced filesystem voice to DB: %s (engine=%s)", voice.name, voice.engine.value)
             created += 1
 
+    if fingerprint is not None:
+        await set_voice_fingerprint(conn, fingerprint)
+
     return created
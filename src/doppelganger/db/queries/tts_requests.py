@@ -18,6 +18,35 @@ async def create_tts_request(conn: AsyncConnection, user_id: int, character: str
     return TTSRequestRow(**result.mappings().one())
 
 
+async def upsert_user_and_create_request(
+    conn: AsyncConnection, discord_id: str, username: str | None, character: str, request_text: str
+) -> tuple[int, int]:
+    """Create or rename the requesting user and insert their TTS request in one statement.
+
+    Returns (user_id, request_id).
+    """
+    sql = text(
+        "WITH requester AS ("
+        "    INSERT INTO users (discord_id, username) VALUES (:discord_id, :username) "
+        "    ON CONFLICT (discord_id) DO UPDATE SET username = EXCLUDED.username "
+        "    RETURNING id"
+        ") "
+        "INSERT INTO tts_requests (user_id, character, text) "
+        "SELECT id, :character, :text FROM requester "
+        "RETURNING user_id, id"
+    )
+    params: dict[str, Any] = {
+        "discord_id": discord_id,
+        "username": username,
+        "character": character,
+        "text": request_text,
+    }
+
+    result = await conn.execute(sql, params)
+    row = result.mappings().one()
+    return row["user_id"], row["id"]
+
+
 async def update_tts_request_status(
     conn: AsyncConnection, request_id: int, status: RequestStatus
 ) -> TTSRequestRow | None:
@@ -72,6 +101,29 @@ async def list_tts_requests(
     return [TTSRequestRow(**row) for row in result.mappings().all()]
 
 
+async def list_tts_requests_page(
+    conn: AsyncConnection, *, status: RequestStatus | None = None, limit: int = 50, offset: int = 0
+) -> tuple[list[TTSRequestRow], int]:
+    """Fetch one page of TTS requests together with the total number of matching requests."""
+    # COUNT(*) OVER () is evaluated before LIMIT, so every row carries the unpaginated total
+    where = "WHERE status = :status " if status is not None else ""
+    sql = text(
+        f"SELECT *, COUNT(*) OVER () AS total_count FROM tts_requests {where}"  # noqa: S608
+        "ORDER BY created_at DESC LIMIT :limit OFFSET :offset"
+    )
+    params: dict[str, Any] = {"status": status, "limit": limit, "offset": offset}
+    result = await conn.execute(sql, params)
+
+    rows = [dict(row) for row in result.mappings().all()]
+    if not rows:
+        # A page past the end has no rows to carry the total, so count separately
+        total = await count_tts_requests(conn, status=status) if offset > 0 else 0
+        return [], total
+
+    total = int(rows[0]["total_count"])
+    return [TTSRequestRow(**{k: v for k, v in row.items() if k != "total_count"}) for row in rows], total
+
+
 async def get_tts_request(conn: AsyncConnection, request_id: int) -> TTSRequestRow | None:
     """Fetch a single TTS request by ID."""
     sql = text("SELECT * FROM tts_requests WHERE id = :id")
@@ -0,0 +1,23 @@
+"""Database queries for the voice_registry_state table."""
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+
+async def get_voice_fingerprint(conn: AsyncConnection) -> str | None:
+    """Fetch the voices directory fingerprint recorded at the last sync, if any."""
+    sql = text("SELECT fingerprint FROM voice_registry_state WHERE id = 1")
+
+    result = await conn.execute(sql)
+    return result.scalar_one_or_none()
+
+
+async def set_voice_fingerprint(conn: AsyncConnection, fingerprint: str) -> None:
+    """Record the voices directory fingerprint after a sync."""
+    sql = text(
+        "INSERT INTO voice_registry_state (id, fingerprint) VALUES (1, :fingerprint) "
+        "ON CONFLICT (id) DO UPDATE SET fingerprint = EXCLUDED.fingerprint, updated_at = NOW()"
+    )
+    params = {"fingerprint": fingerprint}
+
+    await conn.execute(sql, params)
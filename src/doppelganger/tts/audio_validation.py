@@ -3,6 +3,7 @@
 import io
 import wave
 from dataclasses import dataclass
+from typing import BinaryIO
 
 MAX_FILE_SIZE = 10 * 1024 * 1024  # 10 MB
 MIN_DURATION = 5.0  # seconds
@@ -25,8 +26,10 @@ class AudioInfo:
     file_size: int
 
 
-def validate_reference_audio(file_data: bytes) -> AudioInfo:
-    """Validate WAV file data and return its metadata.
+def validate_reference_audio(file_data: bytes | BinaryIO) -> AudioInfo:
+    """Validate WAV file data, given as bytes or a seekable binary file, and return its metadata.
+
+    Only the WAV header is read from a file, so its payload is never loaded into memory.
 
     Checks:
         - Valid WAV format (parseable by stdlib wave)
@@ -34,12 +37,19 @@ def validate_reference_audio(file_data: bytes) -> AudioInfo:
         - Sample rate between 16000-48000 Hz
         - File size under 10 MB
     """
-    file_size = len(file_data)
+    if isinstance(file_data, bytes):
+        stream: BinaryIO = io.BytesIO(file_data)
+        file_size = len(file_data)
+    else:
+        stream = file_data
+        file_size = stream.seek(0, io.SEEK_END)
+        stream.seek(0)
+
     if file_size > MAX_FILE_SIZE:
         raise AudioValidationError(f"File too large: {file_size} bytes (max {MAX_FILE_SIZE})")
 
     try:
-        with wave.open(io.BytesIO(file_data), "rb") as wf:
+        with wave.open(stream, "rb") as wf:
             sample_rate = wf.getframerate()
             channels = wf.getnchannels()
             n_frames = wf.getnframes()
@@ -1,9 +1,33 @@
 """In-memory LRU audio cache backed by OrderedDict."""
 
 import hashlib
+import itertools
 import time
 from collections import OrderedDict
 from dataclasses import dataclass
+from enum import StrEnum
+
+# Counter policy: once any entry reaches this many hits, every count is halved so old popularity fades
+_COUNTER_MAX_HITS = 255
+# Importance policy: scores lose 10% per hour, and only the least recent 10% of entries are eviction candidates
+_IMPORTANCE_HOURLY_DECAY = 0.9
+_IMPORTANCE_CANDIDATE_FRACTION = 0.1
+# Line breaks and tabs read the same as spaces when spoken, so they shouldn't split cache entries
+_WHITESPACE_TO_SPACE = str.maketrans("\r\n\t", "   ")
+
+
+def cache_key(character: str, text: str) -> str:
+    """Cache key for a character and text, ignoring case, surrounding whitespace, and line breaks."""
+    normalized = text.strip().lower().translate(_WHITESPACE_TO_SPACE)
+    return hashlib.blake2b(f"{character}\x00{normalized}".encode(), digest_size=16).hexdigest()
+
+
+class CacheEvictionPolicy(StrEnum):
+    """How the audio cache picks an entry to evict when full."""
+
+    LRU = "lru"
+    COUNTER = "counter"
+    IMPORTANCE = "importance"
 
 
 @dataclass
@@ -16,13 +40,35 @@ class CacheEntry:
     audio_bytes: bytes
     byte_size: int
     created_at: float
+    hits: int = 0
+    importance: float = 0.0
+    importance_updated_at: float = 0.0
+    # Playback-ready PCM for the Discord bot, attached after the first decode
+    pcm_bytes: bytes | None = None
+
+    def decayed_importance(self, now: float) -> float:
+        """Importance score decayed from its last update to now (monotonic seconds)."""
+        hours = (now - self.importance_updated_at) / 3600
+        return self.importance * _IMPORTANCE_HOURLY_DECAY**hours
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    """Point-in-time cache counters, read together so the hit rate matches the hit and miss counts."""
+
+    hits: int
+    misses: int
+    hit_rate: float
+    size: int
+    total_bytes: int
 
 
 class AudioCache:
     """LRU cache for generated audio bytes, keyed by character+text."""
 
-    def __init__(self, max_size: int = 100) -> None:
+    def __init__(self, max_size: int = 100, eviction_policy: CacheEvictionPolicy = CacheEvictionPolicy.LRU) -> None:
         self._max_size = max_size
+        self._eviction_policy = eviction_policy
         self._cache: OrderedDict[str, CacheEntry] = OrderedDict()
         self._enabled: bool = True
         self._hits: int = 0
@@ -42,16 +88,20 @@ class AudioCache:
         """Maximum number of entries the cache can hold."""
         return self._max_size
 
+    @property
+    def eviction_policy(self) -> CacheEvictionPolicy:
+        """Policy used to choose which entry to evict when the cache is full."""
+        return self._eviction_policy
+
     @property
     def total_bytes(self) -> int:
-        """Sum of byte sizes across all cached entries."""
-        return sum(entry.byte_size for entry in self._cache.values())
+        """Bytes held across all cached entries, counting attached PCM as well as the audio."""
+        return sum(entry.byte_size + len(entry.pcm_bytes or b"") for entry in self._cache.values())
 
     @staticmethod
     def _make_key(character: str, text: str) -> str:
         """Generate a deterministic cache key from character and text."""
-        raw = f"{character}:{text}"
-        return hashlib.sha256(raw.encode()).hexdigest()
+        return cache_key(character, text)
 
     @property
     def hits(self) -> int:
@@ -71,20 +121,62 @@ class AudioCache:
             return 0.0
         return self._hits / total
 
+    def snapshot(self) -> CacheStats:
+        """Return all cache counters in one consistent read."""
+        hits, misses = self._hits, self._misses
+        total = hits + misses
+        return CacheStats(
+            hits=hits,
+            misses=misses,
+            hit_rate=hits / total if total else 0.0,
+            size=len(self._cache),
+            total_bytes=self.total_bytes,
+        )
+
+    def _evict(self) -> None:
+        """Remove one entry according to the eviction policy."""
+        if self._eviction_policy is CacheEvictionPolicy.COUNTER:
+            # Fewest hits goes first; min() keeps the oldest entry on ties
+            key = min(self._cache, key=lambda k: self._cache[k].hits)
+            del self._cache[key]
+        elif self._eviction_policy is CacheEvictionPolicy.IMPORTANCE:
+            # Among the least recently used entries, drop the one whose reuse has saved the least audio
+            now = time.monotonic()
+            count = max(1, int(len(self._cache) * _IMPORTANCE_CANDIDATE_FRACTION))
+            candidates = itertools.islice(self._cache.values(), count)
+            victim = min(candidates, key=lambda e: e.decayed_importance(now))
+            del self._cache[victim.key]
+        else:
+            self._cache.popitem(last=False)
+
     def get(self, character: str, text: str) -> bytes | None:
-        """Retrieve cached audio. Moves entry to end on hit."""
+        """Retrieve cached audio. Moves entry to end (LRU) or bumps its hit count (counter) on hit."""
         if not self._enabled:
             return None
 
         key = self._make_key(character, text)
+        entry = self._cache.get(key)
 
-        if key not in self._cache:
+        if entry is None:
             self._misses += 1
             return None
 
         self._hits += 1
-        self._cache.move_to_end(key)
-        return self._cache[key].audio_bytes
+        if self._eviction_policy is CacheEvictionPolicy.COUNTER:
+            entry.hits += 1
+            if entry.hits >= _COUNTER_MAX_HITS:
+                for other in self._cache.values():
+                    other.hits //= 2
+        else:
+            self._cache.move_to_end(key)
+
+        if self._eviction_policy is CacheEvictionPolicy.IMPORTANCE:
+            # WAV size stands in for clip duration, i.e. the generation time each reuse saves
+            now = time.monotonic()
+            entry.importance = entry.decayed_importance(now) + entry.byte_size
+            entry.importance_updated_at = now
+
+        return entry.audio_bytes
 
     def put(self, character: str, text: str, audio_bytes: bytes) -> None:
         """Store audio bytes, evicting oldest entry if over max_size."""
@@ -102,11 +194,14 @@ class AudioCache:
                 audio_bytes=audio_bytes,
                 byte_size=len(audio_bytes),
                 created_at=self._cache[key].created_at,
+                hits=self._cache[key].hits,
+                importance=self._cache[key].importance,
+                importance_updated_at=self._cache[key].importance_updated_at,
             )
             return
 
         if len(self._cache) >= self._max_size:
-            self._cache.popitem(last=False)
+            self._evict()
 
         self._cache[key] = CacheEntry(
             key=key,
@@ -115,8 +210,20 @@ class AudioCache:
             audio_bytes=audio_bytes,
             byte_size=len(audio_bytes),
             created_at=time.time(),
+            importance_updated_at=time.monotonic(),
         )
 
+    def get_pcm(self, character: str, text: str) -> bytes | None:
+        """Return decoded PCM attached to a cached entry, without counting a hit or miss."""
+        entry = self._cache.get(self._make_key(character, text))
+        return entry.pcm_bytes if entry is not None else None
+
+    def set_pcm(self, character: str, text: str, pcm_bytes: bytes) -> None:
+        """Attach decoded PCM to a cached entry. Does nothing if the entry is not cached."""
+        entry = self._cache.get(self._make_key(character, text))
+        if entry is not None:
+            entry.pcm_bytes = pcm_bytes
+
     def get_entry(self, key: str) -> CacheEntry | None:
         """Retrieve a full cache entry by its key."""
         return self._cache.get(key)
@@ -1,5 +1,6 @@
 """Chatterbox TTS engine for zero-shot voice cloning."""
 
+import contextlib
 import io
 import logging
 import wave
@@ -20,6 +21,8 @@ from doppelganger.tts.exceptions import (
 
 logger = logging.getLogger(__name__)
 
+_WARMUP_TEXT = "Warming up."
+
 
 class ChatterboxEngine(TTSEngine):
     """Wraps ChatterboxTTS for zero-shot voice cloning from a reference WAV."""
@@ -33,7 +36,27 @@ class ChatterboxEngine(TTSEngine):
     def load_model(self) -> None:
         """Load the ChatterboxTTS model onto the configured device."""
         logger.info("Loading ChatterboxTTS model on device=%s", self._settings.device)
-        self._model = ChatterboxTTS.from_pretrained(device=self._settings.device)
+        model = ChatterboxTTS.from_pretrained(device=self._settings.device)
+
+        if self._settings.compile_model:
+            # ChatterboxTTS is a plain wrapper; the per-token cost is in T3's Llama backbone
+            backbone = getattr(getattr(model, "t3", None), "tfmr", None)
+            if backbone is None:
+                logger.warning("Chatterbox model has no T3 transformer to compile, skipping torch.compile")
+            else:
+                model.t3.tfmr = torch.compile(backbone, dynamic=True)
+                logger.info("Compiled ChatterboxTTS T3 backbone with torch.compile")
+
+        if self._settings.warmup:
+            # First generation pays for CUDA kernel selection and graph compilation; do it before serving
+            try:
+                with self._inference_context():
+                    model.generate(_WARMUP_TEXT)
+                logger.info("ChatterboxTTS warmup generation complete")
+            except Exception:
+                logger.warning("ChatterboxTTS warmup generation failed", exc_info=True)
+
+        self._model = model
         logger.info("ChatterboxTTS model loaded successfully")
 
     def unload_model(self) -> None:
@@ -57,6 +80,22 @@ class ChatterboxEngine(TTSEngine):
         """The device the model runs on (e.g. 'cpu', 'cuda')."""
         return self._settings.device
 
+    def _inference_context(self) -> contextlib.AbstractContextManager[Any]:
+        """Return fp16 autocast when half precision is enabled on CUDA, else a no-op context."""
+        if self._settings.half_precision and self._settings.device.startswith("cuda"):
+            return torch.autocast(device_type="cuda", dtype=torch.float16)
+        return contextlib.nullcontext()
+
+    def _with_inference_context(self, chunks: Iterator[Any]) -> Iterator[Any]:
+        """Advance a streaming iterator with the inference context entered around each step only."""
+        # Streams interleave on the TTS thread, so autocast state must not stay entered across a yield
+        while True:
+            with self._inference_context():
+                chunk = next(chunks, None)
+            if chunk is None:
+                return
+            yield chunk
+
     def _require_model(self) -> Any:
         """Return the loaded model, or raise if not loaded."""
         if self._model is None:
@@ -90,13 +129,14 @@ class ChatterboxEngine(TTSEngine):
         temperature = resolve_override(overrides, "temperature", self._settings.temperature)
 
         try:
-            wav = model.generate(
-                text,
-                audio_prompt_path=voice_path,
-                exaggeration=exaggeration,
-                cfg_weight=cfg_weight,
-                temperature=temperature,
-            )
+            with self._inference_context():
+                wav = model.generate(
+                    text,
+                    audio_prompt_path=voice_path,
+                    exaggeration=exaggeration,
+                    cfg_weight=cfg_weight,
+                    temperature=temperature,
+                )
         except RuntimeError as e:
             if "out of memory" in str(e).lower():
                 logger.error("CUDA OOM during Chatterbox generation for voice=%s", voice_path)
@@ -134,7 +174,7 @@ class ChatterboxEngine(TTSEngine):
                 temperature=temperature,
             )
 
-            for i, chunk_tensor in enumerate(chunk_iter):
+            for i, chunk_tensor in enumerate(self._with_inference_context(iter(chunk_iter))):
                 audio_bytes = self._tensor_to_wav_bytes(chunk_tensor, sample_rate)
                 yield TTSChunk(audio_bytes=audio_bytes, chunk_index=i, is_final=False)
 
@@ -6,6 +6,7 @@ from pathlib import Path
 from typing import Any
 
 import httpx
+import numpy as np
 
 from doppelganger.config import OrpheusSettings
 from doppelganger.tts.engine import EngineType, TTSEngine, TTSOverrides, TTSResult, resolve_override
@@ -15,6 +16,7 @@ from doppelganger.tts.exceptions import (
     TTSModelNotLoadedError,
     TTSOutOfMemoryError,
 )
+from doppelganger.tts.snac_constants import NUM_CODEBOOKS
 from doppelganger.tts.snac_decoder import SNACDecoder
 
 logger = logging.getLogger(__name__)
@@ -124,20 +126,18 @@ class OrpheusEngine(TTSEngine):
 
     def _filter_audio_tokens(self, token_ids: list[int]) -> list[int]:
         """Keep only audio tokens, stripping control tokens and truncating to a multiple of 7."""
-        audio_tokens = []
+        ids = np.asarray(token_ids, dtype=np.int64)
 
-        for tid in token_ids:
-            if tid == _END_OF_AI:
-                break
-            if tid >= _AUDIO_TOKEN_MIN:
-                audio_tokens.append(tid)
+        # Everything after the first END_OF_AI is discarded
+        end = np.flatnonzero(ids == _END_OF_AI)
+        if end.size:
+            ids = ids[: end[0]]
 
-        # Truncate to a complete frame (7 codebooks per frame)
-        remainder = len(audio_tokens) % 7
-        if remainder:
-            audio_tokens = audio_tokens[:-remainder]
+        audio_tokens = ids[ids >= _AUDIO_TOKEN_MIN]
 
-        return audio_tokens
+        # Truncate to a complete frame (7 codebooks per frame)
+        n_frames = audio_tokens.size // NUM_CODEBOOKS
+        return audio_tokens[: n_frames * NUM_CODEBOOKS].tolist()
 
     def generate(self, voice_path: str, text: str, overrides: TTSOverrides | None = None) -> TTSResult:
         """Generate speech via vLLM and decode with SNAC."""
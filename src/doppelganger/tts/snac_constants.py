@@ -1,8 +1,16 @@
 """Shared SNAC codec constants used by both encoder and decoder."""
 
+import numpy as np
+
 # Orpheus interleaves 7 codebook layers and offsets each by a vocab constant.
 CODEBOOK_OFFSETS = [0, 4096, 8192, 12288, 16384, 20480, 24576]
 NUM_CODEBOOKS = 7
 
+# Number of entries in each SNAC codebook, so valid codes are [0, CODEBOOK_SIZE).
+CODEBOOK_SIZE = 4096
+
 # Base shift into the Orpheus tokenizer vocabulary for audio tokens.
 AUDIO_VOCAB_OFFSET = 128266
+
+# Full token offset for each of the 7 positions in an interleaved frame.
+FRAME_TOKEN_OFFSETS = AUDIO_VOCAB_OFFSET + np.asarray(CODEBOOK_OFFSETS, dtype=np.int64)
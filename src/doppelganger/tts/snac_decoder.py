@@ -5,11 +5,12 @@ import logging
 import wave
 from typing import Any
 
+import numpy as np
 import snac
 import torch
 
 from doppelganger.tts.exceptions import TTSGenerationError, TTSModelNotLoadedError
-from doppelganger.tts.snac_constants import AUDIO_VOCAB_OFFSET, CODEBOOK_OFFSETS, NUM_CODEBOOKS
+from doppelganger.tts.snac_constants import CODEBOOK_SIZE, FRAME_TOKEN_OFFSETS, NUM_CODEBOOKS
 
 logger = logging.getLogger(__name__)
 
@@ -48,7 +49,7 @@ class SNACDecoder:
             raise TTSModelNotLoadedError("SNAC decoder is not loaded")
         return self._model
 
-    def _redistribute_codes(self, token_ids: list[int]) -> tuple[list[int], list[int], list[int]]:
+    def _redistribute_codes(self, token_ids: list[int]) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
         """Regroup interleaved Orpheus tokens into SNAC's 3 codebook levels.
 
         Orpheus outputs 7 tokens per frame in round-robin order. Per frame:
@@ -59,20 +60,16 @@ class SNACDecoder:
         if not token_ids:
             raise TTSGenerationError("No audio tokens to decode")
 
-        layer_0: list[int] = []
-        layer_1: list[int] = []
-        layer_2: list[int] = []
-
+        # View whole frames as (n_frames, 7) rows so each position is a column
         n_frames = len(token_ids) // NUM_CODEBOOKS
-        for i in range(n_frames):
-            base = NUM_CODEBOOKS * i
-            layer_0.append(token_ids[base] - AUDIO_VOCAB_OFFSET)
-            layer_1.append(token_ids[base + 1] - AUDIO_VOCAB_OFFSET - CODEBOOK_OFFSETS[1])
-            layer_2.append(token_ids[base + 2] - AUDIO_VOCAB_OFFSET - CODEBOOK_OFFSETS[2])
-            layer_2.append(token_ids[base + 3] - AUDIO_VOCAB_OFFSET - CODEBOOK_OFFSETS[3])
-            layer_1.append(token_ids[base + 4] - AUDIO_VOCAB_OFFSET - CODEBOOK_OFFSETS[4])
-            layer_2.append(token_ids[base + 5] - AUDIO_VOCAB_OFFSET - CODEBOOK_OFFSETS[5])
-            layer_2.append(token_ids[base + 6] - AUDIO_VOCAB_OFFSET - CODEBOOK_OFFSETS[6])
+        frames = np.asarray(token_ids[: n_frames * NUM_CODEBOOKS], dtype=np.int64).reshape(-1, NUM_CODEBOOKS)
+        frames -= FRAME_TOKEN_OFFSETS
+        # Keep stray tokens inside the codebook so they can't index out of range on the GPU
+        np.clip(frames, 0, CODEBOOK_SIZE - 1, out=frames)
+
+        layer_0 = frames[:, 0]
+        layer_1 = frames[:, [1, 4]].reshape(-1)
+        layer_2 = frames[:, [2, 3, 5, 6]].reshape(-1)
 
         return layer_0, layer_1, layer_2
 
@@ -82,22 +79,36 @@ class SNACDecoder:
         layer_0, layer_1, layer_2 = self._redistribute_codes(token_ids)
 
         with torch.no_grad():
-            codes = [
-                torch.tensor(layer_0, device=self._device).unsqueeze(0),
-                torch.tensor(layer_1, device=self._device).unsqueeze(0),
-                torch.tensor(layer_2, device=self._device).unsqueeze(0),
-            ]
+            codes = self._upload_codes((layer_0, layer_1, layer_2))
             audio = model.decode(codes)
 
-        # Convert to PCM16 WAV
-        audio_np = audio.squeeze().cpu().numpy()
-        pcm16 = (audio_np.clip(-1.0, 1.0) * 32767).astype("int16")
+            # Quantize to PCM16 on the device so only half the bytes cross back to the host
+            pcm16 = audio.reshape(-1).clamp(-1.0, 1.0).mul(32767).to(torch.int16)
 
         buf = io.BytesIO()
         with wave.open(buf, "wb") as wf:
             wf.setnchannels(1)
             wf.setsampwidth(2)
             wf.setframerate(sample_rate)
-            wf.writeframes(pcm16.tobytes())
+            wf.writeframes(self._copy_to_host(pcm16).numpy().tobytes())
 
         return buf.getvalue()
+
+    def _upload_codes(self, layers: tuple[np.ndarray, ...]) -> list[torch.Tensor]:
+        """Move all code levels to the device in one transfer and split them there as [1, N] tensors."""
+        flat = torch.from_numpy(np.concatenate(layers))
+        if self._device.startswith("cuda"):
+            flat = flat.pin_memory()
+        flat = flat.to(self._device, non_blocking=True)
+
+        return [level.unsqueeze(0) for level in flat.split([layer.size for layer in layers])]
+
+    def _copy_to_host(self, tensor: torch.Tensor) -> torch.Tensor:
+        """Copy a decoded tensor to the CPU, staging GPU results through pinned memory."""
+        if tensor.device.type != "cuda":
+            return tensor.cpu()
+
+        host = torch.empty(tensor.shape, dtype=tensor.dtype, pin_memory=True)
+        host.copy_(tensor, non_blocking=True)
+        torch.cuda.current_stream(tensor.device).synchronize()
+        return host
@@ -1,24 +1,39 @@
 """SNAC audio encoder for converting WAV audio to interleaved Orpheus token IDs."""
 
+import contextlib
+import functools
 import logging
+import math
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
+import numpy as np
 import snac
 import torch
 import torchaudio
 
 from doppelganger.tts.exceptions import TTSModelNotLoadedError
-from doppelganger.tts.snac_constants import AUDIO_VOCAB_OFFSET, CODEBOOK_OFFSETS
+from doppelganger.tts.snac_constants import FRAME_TOKEN_OFFSETS, NUM_CODEBOOKS
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on threads used to load clips for a batched encode
+_LOAD_WORKERS = 4
+
+
+@functools.lru_cache(maxsize=8)
+def _get_resampler(orig_sample_rate: int, target_sample_rate: int) -> torchaudio.transforms.Resample:
+    """Build the resampling kernel for a sample-rate pair once and reuse it across clips."""
+    return torchaudio.transforms.Resample(orig_sample_rate, target_sample_rate)
+
 
 class SNACEncoder:
     """Encodes WAV audio into Orpheus-style interleaved SNAC token IDs."""
 
-    def __init__(self, device: str = "cpu") -> None:
-        """Initialize the encoder with the target device."""
+    def __init__(self, device: str = "cpu", half_precision: bool = False) -> None:
+        """Initialize the encoder with the target device and optional bf16 autocast on CUDA."""
         self._device = device
+        self._half_precision = half_precision
         self._model: Any | None = None
 
     def load(self) -> None:
@@ -48,6 +63,15 @@ class SNACEncoder:
             raise TTSModelNotLoadedError("SNAC encoder is not loaded")
         return self._model
 
+    def _run_encoder(self, model: Any, audio_tensor: torch.Tensor) -> list[Any]:
+        """Run SNAC's encoder in inference mode, under bf16 autocast when half precision is enabled on CUDA."""
+        precision: contextlib.AbstractContextManager[Any] = contextlib.nullcontext()
+        if self._half_precision and self._device.startswith("cuda"):
+            precision = torch.autocast(device_type="cuda", dtype=torch.bfloat16)
+
+        with torch.inference_mode(), precision:
+            return model.encode(audio_tensor)
+
     def _interleave_codes(self, codes: list[Any]) -> list[int]:
         """Interleave 3-level SNAC codes into flat Orpheus token IDs.
 
@@ -65,27 +89,33 @@ class SNACEncoder:
           pos 5: fine[4*i+2]    (third fine)
           pos 6: fine[4*i+3]    (fourth fine)
         """
-        n_frames = codes[0].shape[1]
+        # One bulk device-to-host copy per level instead of an .item() sync per token
+        coarse, mid, fine = (level.squeeze(0).cpu().numpy() for level in codes)
+        n_frames = min(coarse.size, mid.size // 2, fine.size // 4)
+        return self._interleave_levels(coarse[:n_frames], mid[: 2 * n_frames], fine[: 4 * n_frames])
+
+    def _interleave_levels(self, coarse: np.ndarray, mid: np.ndarray, fine: np.ndarray) -> list[int]:
+        """Interleave one clip's host-side code levels, already trimmed to whole frames."""
+        n_frames = coarse.size
         if n_frames == 0:
             return []
 
-        tokens: list[int] = []
-        for i in range(n_frames):
-            tokens.append(int(codes[0][0][i]) + AUDIO_VOCAB_OFFSET + CODEBOOK_OFFSETS[0])
-            tokens.append(int(codes[1][0][2 * i]) + AUDIO_VOCAB_OFFSET + CODEBOOK_OFFSETS[1])
-            tokens.append(int(codes[2][0][4 * i]) + AUDIO_VOCAB_OFFSET + CODEBOOK_OFFSETS[2])
-            tokens.append(int(codes[2][0][4 * i + 1]) + AUDIO_VOCAB_OFFSET + CODEBOOK_OFFSETS[3])
-            tokens.append(int(codes[1][0][2 * i + 1]) + AUDIO_VOCAB_OFFSET + CODEBOOK_OFFSETS[4])
-            tokens.append(int(codes[2][0][4 * i + 2]) + AUDIO_VOCAB_OFFSET + CODEBOOK_OFFSETS[5])
-            tokens.append(int(codes[2][0][4 * i + 3]) + AUDIO_VOCAB_OFFSET + CODEBOOK_OFFSETS[6])
+        frames = np.empty((n_frames, NUM_CODEBOOKS), dtype=np.int64)
+        frames[:, 0] = coarse
+        frames[:, [1, 4]] = mid.reshape(-1, 2)
+        frames[:, [2, 3, 5, 6]] = fine.reshape(-1, 4)
+        frames += FRAME_TOKEN_OFFSETS
 
-        return tokens
+        return frames.reshape(-1).tolist()
 
-    def encode(self, audio_path: str, target_sample_rate: int = 24000) -> list[int]:
-        """Encode a WAV file into interleaved Orpheus token IDs."""
-        model = self._require_model()
+    def _frames_for_length(self, model: Any, n_samples: int) -> int:
+        """Number of coarse frames SNAC produces for a clip of n_samples, matching its own padding."""
+        pad_to = model.hop_length * math.lcm(model.vq_strides[0], model.attn_window_size or 1)
+        frames_per_pad = pad_to // (model.hop_length * model.vq_strides[0])
+        return math.ceil(n_samples / pad_to) * frames_per_pad
 
-        # Load and preprocess audio
+    def _load_waveform(self, audio_path: str, target_sample_rate: int) -> torch.Tensor:
+        """Load a WAV file as a peak-normalized mono waveform of shape [1, samples]."""
         waveform, sample_rate = torchaudio.load(audio_path)
 
         # Mix stereo to mono by averaging channels
@@ -94,18 +124,54 @@ class SNACEncoder:
 
         # Resample if needed
         if sample_rate != target_sample_rate:
-            resampler = torchaudio.transforms.Resample(sample_rate, target_sample_rate)
-            waveform = resampler(waveform)
+            waveform = _get_resampler(sample_rate, target_sample_rate)(waveform)
 
         # Normalize amplitude to [-1, 1]
         peak = waveform.abs().max()
         if peak > 0:
             waveform = waveform / peak
 
+        return waveform
+
+    def encode(self, audio_path: str, target_sample_rate: int = 24000) -> list[int]:
+        """Encode a WAV file into interleaved Orpheus token IDs."""
+        model = self._require_model()
+        waveform = self._load_waveform(audio_path, target_sample_rate)
+
         # SNAC expects shape [batch, channels, samples]
         audio_tensor = waveform.unsqueeze(0).to(self._device)
 
-        with torch.no_grad():
-            codes = model.encode(audio_tensor)
+        codes = self._run_encoder(model, audio_tensor)
 
         return self._interleave_codes(codes)
+
+    def encode_batch(self, audio_paths: list[str], target_sample_rate: int = 24000) -> list[list[int]]:
+        """Encode several WAV files in one padded forward pass, returning token IDs per file."""
+        model = self._require_model()
+        if not audio_paths:
+            return []
+
+        # Decoding and resampling release the GIL, so overlap them across files
+        with ThreadPoolExecutor(max_workers=min(len(audio_paths), _LOAD_WORKERS)) as pool:
+            waveforms = list(
+                pool.map(functools.partial(self._load_waveform, target_sample_rate=target_sample_rate), audio_paths)
+            )
+
+        # Zero-pad to the longest clip: [batch, samples] -> [batch, 1, samples]
+        batch = torch.nn.utils.rnn.pad_sequence([w.squeeze(0) for w in waveforms], batch_first=True).unsqueeze(1)
+        if self._device.startswith("cuda"):
+            batch = batch.pin_memory()
+        batch = batch.to(self._device, non_blocking=True)
+
+        codes = self._run_encoder(model, batch)
+
+        # Slice each clip back to the frames its own samples cover, dropping frames that only saw padding
+        coarse, mid, fine = (level.cpu().numpy() for level in codes)
+        tokens: list[list[int]] = []
+        for i, waveform in enumerate(waveforms):
+            n_frames = self._frames_for_length(model, waveform.shape[-1])
+            tokens.append(
+                self._interleave_levels(coarse[i, :n_frames], mid[i, : 2 * n_frames], fine[i, : 4 * n_frames])
+            )
+
+        return tokens
@@ -1,6 +1,11 @@
 """Voice registry that scans the filesystem for reference audio files."""
 
+import hashlib
+import itertools
 import logging
+import os
+import shutil
+import uuid
 from dataclasses import dataclass, field
 from pathlib import Path
 
@@ -8,6 +13,14 @@ from doppelganger.tts.engine import EngineType
 
 logger = logging.getLogger(__name__)
 
+# Hidden names character directories are renamed to while their files are removed
+_TOMBSTONE_GLOB = ".*.deleted-*"
+
+
+def tombstone_path(char_dir: Path) -> Path:
+    """Unique hidden sibling path to move a character directory to before deleting it."""
+    return char_dir.with_name(f".{char_dir.name}.deleted-{uuid.uuid4().hex}")
+
 
 @dataclass(frozen=True)
 class VoiceEntry:
@@ -27,47 +40,99 @@ class VoiceRegistry:
     def __init__(self, voices_dir: str) -> None:
         self._voices_dir = Path(voices_dir)
         self._voices: dict[str, VoiceEntry] = {}
+        self._fingerprint: str | None = None
 
     def scan(self) -> None:
         """Walk the voices directory and register all valid voices."""
         self._voices.clear()
+        self._fingerprint = None
 
         if not self._voices_dir.exists():
             logger.warning("Voices directory does not exist: %s", self._voices_dir)
             return
 
-        for subdir in sorted(self._voices_dir.iterdir()):
-            if not subdir.is_dir():
-                continue
+        # scandir entries carry their file type from the directory listing, so only registered sources get stat'd
+        with os.scandir(self._voices_dir) as it:
+            # Hidden directories include characters that are mid-deletion
+            subdirs = sorted((e for e in it if not e.name.startswith(".") and e.is_dir()), key=lambda e: e.name)
 
-            has_adapter = (subdir / "adapter_config.json").is_file()
-            has_reference = (subdir / "reference.wav").is_file()
+        digest = hashlib.sha256()
+        for subdir in subdirs:
+            with os.scandir(subdir.path) as it:
+                files = {e.name: e for e in it if e.is_file()}
 
-            if has_adapter:
+            name = subdir.name.lower()
+            if "adapter_config.json" in files:
                 # LoRA adapter directory - use Orpheus engine, path is the dir itself
-                name = subdir.name.lower()
-                self._voices[name] = VoiceEntry(name=name, reference_audio_path=subdir, engine=EngineType.ORPHEUS)
-                logger.info("Registered voice: %s (orpheus)", name)
-            elif has_reference:
+                source: os.DirEntry[str] = subdir
+                entry = VoiceEntry(name=name, reference_audio_path=Path(subdir.path), engine=EngineType.ORPHEUS)
+            elif "reference.wav" in files:
                 # Reference WAV - use Chatterbox engine
-                name = subdir.name.lower()
-                self._voices[name] = VoiceEntry(
-                    name=name, reference_audio_path=subdir / "reference.wav", engine=EngineType.CHATTERBOX
-                )
-                logger.info("Registered voice: %s (chatterbox)", name)
+                source = files["reference.wav"]
+                entry = VoiceEntry(name=name, reference_audio_path=Path(source.path), engine=EngineType.CHATTERBOX)
             else:
                 logger.debug("Skipping %s: no reference.wav or adapter_config.json found", subdir.name)
+                continue
+
+            self._voices[name] = entry
+            stat = source.stat()
+            digest.update(f"{name}:{entry.engine.value}:{stat.st_mtime_ns}:{stat.st_size}\n".encode())
+            logger.info("Registered voice: %s (%s)", name, entry.engine.value)
 
+        self._fingerprint = digest.hexdigest()
         logger.info("Voice registry loaded %d voice(s)", len(self._voices))
 
+    def purge_tombstones(self) -> int:
+        """Remove character directories a previous run moved aside but never finished deleting.
+
+        Returns the number of directories removed.
+        """
+        if not self._voices_dir.is_dir():
+            return 0
+
+        removed = 0
+        for path in self._voices_dir.glob(_TOMBSTONE_GLOB):
+            if path.is_dir():
+                shutil.rmtree(path, ignore_errors=True)
+                removed += 1
+        return removed
+
     def list_voices(self) -> list[VoiceEntry]:
         """Return all registered voices."""
         return list(self._voices.values())
 
+    def snapshot(self) -> dict[str, VoiceEntry]:
+        """Return a shallow copy of the registered voices keyed by lowercase name."""
+        return dict(self._voices)
+
+    def search_names(self, fragment: str, limit: int) -> list[str]:
+        """Return up to limit voice names containing fragment, case-insensitively."""
+        # Keys are stored lowercase, so only the fragment needs lowering and the scan stops at limit
+        needle = fragment.lower()
+        return list(itertools.islice((name for name in self._voices if needle in name), limit))
+
     def get_voice(self, name: str) -> VoiceEntry | None:
         """Look up a voice by name. Returns None if not found."""
         return self._voices.get(name.lower())
 
+    def add_voice(
+        self, name: str, reference_audio_path: Path, engine: EngineType = EngineType.CHATTERBOX
+    ) -> VoiceEntry:
+        """Register a single voice without rescanning the voices directory."""
+        entry = VoiceEntry(name=name.lower(), reference_audio_path=reference_audio_path, engine=engine)
+        self._voices[entry.name] = entry
+        self._fingerprint = None
+        logger.info("Registered voice: %s (%s)", entry.name, engine.value)
+        return entry
+
+    def remove_voice(self, name: str) -> VoiceEntry | None:
+        """Unregister a single voice. Returns the removed entry, or None if it wasn't registered."""
+        entry = self._voices.pop(name.lower(), None)
+        if entry is not None:
+            self._fingerprint = None
+            logger.info("Unregistered voice: %s", entry.name)
+        return entry
+
     def refresh(self) -> None:
         """Clear and re-scan the voices directory."""
         self.scan()
@@ -77,6 +142,11 @@ class VoiceRegistry:
         """The directory containing voice reference audio files."""
         return self._voices_dir
 
+    @property
+    def fingerprint(self) -> str | None:
+        """Digest of the voices found by the last scan, or None if voices changed since."""
+        return self._fingerprint
+
     @property
     def size(self) -> int:
         """Number of registered voices."""
@@ -40,7 +40,7 @@ async def test_get_cache_populated(app: MagicMock, client: AsyncClient) -> None:
     assert entry["text"] == "hello"
     assert entry["byte_size"] == len(b"wav-data-here")
     assert entry["created_at"] > 0
-    assert len(entry["key"]) == 64  # sha256 hex
+    assert len(entry["key"]) == 32  # 128-bit blake2b hex
 
 
 @pytest.mark.asyncio
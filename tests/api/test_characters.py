@@ -1,12 +1,12 @@
 """Tests for the characters API endpoints."""
 
 from datetime import datetime
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import MagicMock
 
 import pytest
 from httpx import AsyncClient
 
-from tests.conftest import mock_db_begin_single, mock_db_connect_list
+from tests.conftest import mock_db_begin_single, mock_db_connect_list, mock_db_connect_single
 
 _NOW = datetime(2026, 1, 1)
 
@@ -96,6 +96,32 @@ async def test_put_tuning(app: MagicMock, client: AsyncClient) -> None:
     assert data["name"] == "gandalf"
 
 
+@pytest.mark.asyncio
+async def test_put_tuning_invalidates_bot_overrides(app: MagicMock, client: AsyncClient) -> None:
+    """PUT /api/characters/{id}/tuning drops the bot's cached overrides for the character."""
+    app.state.db_engine = mock_db_begin_single(
+        {
+            "id": 1,
+            "name": "gandalf",
+            "reference_audio_path": "/voices/gandalf/reference.wav",
+            "created_at": _NOW,
+            "engine": "chatterbox",
+            "tts_exaggeration": 0.5,
+            "tts_cfg_weight": None,
+            "tts_temperature": None,
+            "tts_repetition_penalty": None,
+            "tts_top_p": None,
+            "tts_frequency_penalty": None,
+        }
+    )
+    app.state.bot = MagicMock()
+
+    response = await client.put("/api/characters/1/tuning", json={"exaggeration": 0.5})
+
+    assert response.status_code == 200
+    app.state.bot.overrides_cache.invalidate.assert_called_once_with("gandalf")
+
+
 @pytest.mark.asyncio
 async def test_put_tuning_not_found(app: MagicMock, client: AsyncClient) -> None:
     """PUT /api/characters/{id}/tuning returns 404 when character not found."""
@@ -108,13 +134,70 @@ async def test_put_tuning_not_found(app: MagicMock, client: AsyncClient) -> None
 @pytest.mark.asyncio
 async def test_delete_not_found(app: MagicMock, client: AsyncClient) -> None:
     """DELETE /api/characters/999 returns 404 when not found."""
-    mock_conn = AsyncMock()
-    mock_result = MagicMock()
-    mock_result.mappings.return_value.first.return_value = None
-    mock_conn.execute = AsyncMock(return_value=mock_result)
-    mock_conn.__aenter__ = AsyncMock(return_value=mock_conn)
-    mock_conn.__aexit__ = AsyncMock(return_value=False)
-    app.state.db_engine.begin = MagicMock(return_value=mock_conn)
+    engine = mock_db_connect_single(None)
+    app.state.db_engine = engine
 
     response = await client.delete("/api/characters/999")
     assert response.status_code == 404
+    engine.begin.assert_not_called()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("name", ["", "bad_name", "café", "two words"])
+async def test_create_invalid_name(client: AsyncClient, name: str) -> None:
+    """POST /api/characters rejects names outside ^[a-z0-9-]+$, including non-ASCII letters."""
+    response = await client.post(
+        "/api/characters",
+        params={"name": name},
+        files={"audio": ("reference.wav", b"RIFF", "audio/wav")},
+    )
+    assert response.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_create_invalid_audio_leaves_no_files(app: MagicMock, client: AsyncClient) -> None:
+    """POST /api/characters with invalid audio returns 422 and removes the streamed file."""
+    response = await client.post(
+        "/api/characters",
+        params={"name": "gandalf"},
+        files={"audio": ("reference.wav", b"not a wav file", "audio/wav")},
+    )
+    assert response.status_code == 422
+    assert not (app.state.voice_registry.voices_dir / "gandalf").exists()
+
+
+@pytest.mark.asyncio
+async def test_delete_removes_character_dir(app: MagicMock, client: AsyncClient) -> None:
+    """DELETE /api/characters/{id} unregisters the voice and removes its directory, tombstone included."""
+    registry = app.state.voice_registry
+    char_dir = registry.voices_dir / "gandalf"
+    char_dir.mkdir()
+    ref_path = char_dir / "reference.wav"
+    ref_path.write_bytes(b"RIFF")
+    registry.scan()
+
+    row = {"id": 1, "name": "gandalf", "reference_audio_path": str(ref_path), "created_at": _NOW}
+    engine = mock_db_connect_single(row)
+    engine.begin.return_value.__aenter__.return_value.execute.return_value.rowcount = 1
+    app.state.db_engine = engine
+
+    response = await client.delete("/api/characters/1")
+    assert response.status_code == 204
+    assert registry.get_voice("gandalf") is None
+    assert list(registry.voices_dir.iterdir()) == []
+
+
+@pytest.mark.asyncio
+async def test_delete_invalidates_bot_overrides(app: MagicMock, client: AsyncClient) -> None:
+    """DELETE /api/characters/{id} drops the bot's cached overrides for the character."""
+    ref_path = app.state.voice_registry.voices_dir / "gandalf" / "reference.wav"
+    row = {"id": 1, "name": "gandalf", "reference_audio_path": str(ref_path), "created_at": _NOW}
+    engine = mock_db_connect_single(row)
+    engine.begin.return_value.__aenter__.return_value.execute.return_value.rowcount = 1
+    app.state.db_engine = engine
+    app.state.bot = MagicMock()
+
+    response = await client.delete("/api/characters/1")
+
+    assert response.status_code == 204
+    app.state.bot.overrides_cache.invalidate.assert_called_once_with("gandalf")
@@ -0,0 +1,41 @@
+"""Tests for the read-only config API endpoint."""
+
+from unittest.mock import patch
+
+import pytest
+from httpx import AsyncClient
+from pydantic import SecretStr
+
+from doppelganger.api import config as config_api
+from doppelganger.config import Settings
+
+
+@pytest.mark.asyncio
+async def test_config_redacts_secrets(client: AsyncClient) -> None:
+    """GET /api/config returns every section with secret values redacted."""
+    settings = Settings()
+    settings.discord.token = SecretStr("super-secret")
+
+    with patch("doppelganger.api.config.get_settings", return_value=settings):
+        response = await client.get("/api/config")
+
+    assert response.status_code == 200
+    sections = {s["name"]: s for s in response.json()["sections"]}
+    assert list(sections) == ["General", "Database", "Discord", "Chatterbox", "Orpheus"]
+    assert "super-secret" not in response.text
+
+
+@pytest.mark.asyncio
+async def test_config_response_cached_per_settings(client: AsyncClient) -> None:
+    """The serialized config is reused until get_settings returns a different object."""
+    first, second = Settings(), Settings()
+
+    with patch.object(config_api, "_build_config_response", wraps=config_api._build_config_response) as build:
+        with patch("doppelganger.api.config.get_settings", return_value=first):
+            await client.get("/api/config")
+            await client.get("/api/config")
+        assert build.call_count == 1
+
+        with patch("doppelganger.api.config.get_settings", return_value=second):
+            await client.get("/api/config")
+        assert build.call_count == 2
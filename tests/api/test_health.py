@@ -1,10 +1,12 @@
 """Tests for the health check endpoint."""
 
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from httpx import AsyncClient
 
+from doppelganger.api.health import _check_gpu
+
 
 @pytest.mark.asyncio
 async def test_health_returns_200(client: AsyncClient) -> None:
@@ -42,3 +44,50 @@ async def test_health_includes_request_id(client: AsyncClient) -> None:
     response = await client.get("/health")
     assert "x-request-id" in response.headers
     assert len(response.headers["x-request-id"]) > 0
+
+
+@pytest.mark.asyncio
+async def test_error_body_request_id_matches_header(client: AsyncClient) -> None:
+    """Error responses carry the same request ID in their body as in the X-Request-ID header."""
+    response = await client.get("/does-not-exist")
+    assert response.status_code == 404
+    assert response.json()["error"]["request_id"] == response.headers["x-request-id"]
+
+
+@pytest.mark.asyncio
+async def test_cors_preflight_answered_before_request_id(client: AsyncClient) -> None:
+    """CORS preflights are answered by the outermost middleware without generating a request ID."""
+    headers = {"Origin": "http://example.com", "Access-Control-Request-Method": "GET"}
+    response = await client.options("/health", headers=headers)
+    assert response.status_code == 200
+    assert "access-control-allow-origin" in response.headers
+    assert "x-request-id" not in response.headers
+
+
+@pytest.mark.asyncio
+async def test_health_probes_gpu_once(client: AsyncClient) -> None:
+    """GPU availability is probed on the first health check and reused afterwards."""
+    _check_gpu.cache_clear()
+    with patch("doppelganger.api.health.torch.cuda.is_available", return_value=True) as is_available:
+        await client.get("/health")
+        response = await client.get("/health")
+
+    _check_gpu.cache_clear()
+    assert response.json()["gpu_available"] is True
+    is_available.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_health_reuses_recent_db_probe(app: MagicMock, client: AsyncClient) -> None:
+    """Back-to-back health checks share one SELECT 1 probe within the TTL."""
+    mock_conn = AsyncMock()
+    mock_conn.execute = AsyncMock()
+    mock_conn.__aenter__ = AsyncMock(return_value=mock_conn)
+    mock_conn.__aexit__ = AsyncMock(return_value=False)
+    app.state.db_engine.connect = MagicMock(return_value=mock_conn)
+
+    await client.get("/health")
+    response = await client.get("/health")
+
+    assert response.json()["database"] == "connected"
+    mock_conn.execute.assert_awaited_once()
@@ -12,19 +12,20 @@ _NOW = datetime(2026, 1, 1)
 
 
 def _mock_db_for_requests(rows: list[dict[str, object]], count: int | None = None) -> MagicMock:
-    """Create a mock DB engine for request listing (count query + list query)."""
+    """Create a mock DB engine for request listing (windowed list query + fallback count query)."""
     engine = MagicMock()
     conn = AsyncMock()
+    total = count if count is not None else len(rows)
 
-    # First call: count_tts_requests -> mappings().first()
-    count_result = MagicMock()
-    count_result.mappings.return_value.first.return_value = {"cnt": count if count is not None else len(rows)}
-
-    # Second call: list_tts_requests -> mappings().all()
+    # First call: list_tts_requests_page -> mappings().all(), each row carrying the window total
     list_result = MagicMock()
-    list_result.mappings.return_value.all.return_value = rows
+    list_result.mappings.return_value.all.return_value = [{**row, "total_count": total} for row in rows]
+
+    # Second call (empty pages only): count_tts_requests -> mappings().first()
+    count_result = MagicMock()
+    count_result.mappings.return_value.first.return_value = {"cnt": total}
 
-    conn.execute = AsyncMock(side_effect=[count_result, list_result])
+    conn.execute = AsyncMock(side_effect=[list_result, count_result])
 
     ctx = AsyncMock()
     ctx.__aenter__.return_value = conn
@@ -1,16 +1,22 @@
 """Tests for the TTS API endpoints."""
 
+import asyncio
+import threading
+import time
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import MagicMock
 
 import pytest
 from httpx import AsyncClient
 
+from doppelganger.api import tts as tts_api
 from doppelganger.tts.exceptions import (
     TTSModelNotLoadedError,
     TTSOutOfMemoryError,
     TTSVoiceNotFoundError,
 )
-from doppelganger.tts.service import TTSResult
+from doppelganger.tts.service import TTSChunk, TTSResult
 
 
 @pytest.mark.asyncio
@@ -65,6 +71,71 @@ async def test_generate_503_model_not_loaded(app: MagicMock, client: AsyncClient
     assert response.status_code == 503
 
 
+@pytest.mark.asyncio
+async def test_generate_maps_error_subclasses(app: MagicMock, client: AsyncClient) -> None:
+    """Subclasses of a mapped TTS error get their base class's status instead of a 500."""
+
+    class CudaOutOfMemoryError(TTSOutOfMemoryError):
+        pass
+
+    app.state.tts_service.generate.side_effect = CudaOutOfMemoryError("OOM")
+
+    response = await client.post(
+        "/api/tts/generate",
+        json={"character": "gandalf", "text": "hello"},
+    )
+    assert response.status_code == 503
+
+
+@pytest.mark.asyncio
+async def test_generate_coalesces_identical_requests(app: MagicMock, client: AsyncClient) -> None:
+    """Concurrent identical requests share a single TTS generation."""
+
+    def slow_generate(*_args: object) -> TTSResult:
+        time.sleep(0.05)
+        return TTSResult(audio_bytes=b"RIFF-shared", sample_rate=24000, duration_ms=1000)
+
+    app.state.tts_service.generate.side_effect = slow_generate
+    payload = {"character": "gandalf", "text": "hello"}
+
+    responses = await asyncio.gather(*(client.post("/api/tts/generate", json=payload) for _ in range(3)))
+
+    assert [r.content for r in responses] == [b"RIFF-shared"] * 3
+    app.state.tts_service.generate.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_generate_survives_first_request_cancel(app: MagicMock, client: AsyncClient) -> None:
+    """Cancelling the request that started a generation doesn't fail or discard it for the others."""
+    started = threading.Event()
+    release = threading.Event()
+
+    def blocking_generate(*_args: object) -> TTSResult:
+        started.set()
+        release.wait(timeout=5)
+        return TTSResult(audio_bytes=b"RIFF-shared", sample_rate=24000, duration_ms=1000)
+
+    app.state.tts_service.generate.side_effect = blocking_generate
+    payload = {"character": "gandalf", "text": "hello"}
+
+    first = asyncio.create_task(client.post("/api/tts/generate", json=payload))
+    await asyncio.to_thread(started.wait, 5)
+    second = asyncio.create_task(client.post("/api/tts/generate", json=payload))
+    await asyncio.sleep(0.01)
+
+    first.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await first
+    release.set()
+
+    response = await second
+    assert response.status_code == 200
+    assert response.content == b"RIFF-shared"
+    app.state.tts_service.generate.assert_called_once()
+    assert app.state.audio_cache.get("gandalf", "hello") == b"RIFF-shared"
+    assert app.state.tts_inflight == {}
+
+
 @pytest.mark.asyncio
 async def test_generate_cache_hit(app: MagicMock, client: AsyncClient) -> None:
     """Cached results skip the TTS service call."""
@@ -87,3 +158,78 @@ async def test_generate_validation_error(client: AsyncClient) -> None:
         json={"character": "INVALID NAME!", "text": "hello"},
     )
     assert response.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_stream_yields_every_chunk(app: MagicMock, client: AsyncClient) -> None:
+    """POST /api/tts/stream sends every generated chunk in order, even beyond the queue depth."""
+    chunks = [TTSChunk(audio_bytes=f"chunk{i};".encode(), chunk_index=i, is_final=i == 9) for i in range(10)]
+    app.state.tts_service.generate_stream.return_value = iter(chunks)
+
+    response = await client.post("/api/tts/stream", json={"character": "gandalf", "text": "hello"})
+    assert response.status_code == 200
+    assert response.content == b"".join(c.audio_bytes for c in chunks)
+
+
+@pytest.mark.asyncio
+async def test_stream_stops_on_generation_error(app: MagicMock, client: AsyncClient) -> None:
+    """A generation error mid-stream ends the response after the chunks already produced."""
+
+    def failing_stream(*_args: object) -> Iterator[TTSChunk]:
+        yield TTSChunk(audio_bytes=b"first", chunk_index=0, is_final=False)
+        raise TTSOutOfMemoryError("OOM")
+
+    app.state.tts_service.generate_stream.side_effect = failing_stream
+
+    response = await client.post("/api/tts/stream", json={"character": "gandalf", "text": "hello"})
+    assert response.content == b"first"
+
+
+@pytest.mark.asyncio
+async def test_stream_holds_generation_lock(app: MagicMock, client: AsyncClient) -> None:
+    """Every step of a stream runs under the lock that serializes generations."""
+    held: list[bool] = []
+
+    def locked_stream(*_args: object) -> Iterator[TTSChunk]:
+        for i in range(3):
+            held.append(tts_api._generation_lock.locked())
+            yield TTSChunk(audio_bytes=b"chunk", chunk_index=i, is_final=i == 2)
+
+    app.state.tts_service.generate_stream.side_effect = locked_stream
+
+    await client.post("/api/tts/stream", json={"character": "gandalf", "text": "hello"})
+    assert held == [True, True, True]
+    assert not tts_api._generation_lock.locked()
+
+
+@pytest.mark.asyncio
+async def test_stream_closes_generator_on_disconnect(app: MagicMock, client: AsyncClient) -> None:
+    """An abandoned stream closes its chunk generator on the TTS executor so the engine's cleanup runs there."""
+    stepped = threading.Event()
+    release = threading.Event()
+    closed = threading.Event()
+    closed_on: list[str] = []
+
+    def blocking_stream(*_args: object) -> Iterator[TTSChunk]:
+        try:
+            yield TTSChunk(audio_bytes=b"first", chunk_index=0, is_final=False)
+            stepped.set()
+            release.wait(timeout=5)
+            yield TTSChunk(audio_bytes=b"second", chunk_index=1, is_final=True)
+        finally:
+            closed_on.append(threading.current_thread().name)
+            closed.set()
+
+    app.state.tts_service.generate_stream.side_effect = blocking_stream
+    app.state.tts_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="tts")
+
+    task = asyncio.create_task(client.post("/api/tts/stream", json={"character": "gandalf", "text": "hello"}))
+    await asyncio.to_thread(stepped.wait, 5)
+    task.cancel()
+    release.set()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    assert await asyncio.to_thread(closed.wait, 5)
+    assert closed_on[0].startswith("tts")
+    app.state.tts_executor.shutdown(wait=True)
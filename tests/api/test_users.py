@@ -43,11 +43,13 @@ async def test_list_users_populated(app: MagicMock, client: AsyncClient) -> None
 
 @pytest.mark.asyncio
 async def test_blacklist_user(app: MagicMock, client: AsyncClient) -> None:
-    """POST /api/users/{id}/blacklist toggles blacklist status."""
+    """POST /api/users/{id}/blacklist toggles blacklist status and drops the bot's cached check."""
     app.state.db_engine = mock_db_begin_single({"id": 1, "discord_id": "111", "blacklisted": True, "created_at": _NOW})
+    app.state.bot = MagicMock()
     response = await client.post("/api/users/1/blacklist", json={"blacklisted": True})
     assert response.status_code == 200
     assert response.json()["blacklisted"] is True
+    app.state.bot.blacklist_cache.invalidate.assert_called_once_with("111")
 
 
 @pytest.mark.asyncio
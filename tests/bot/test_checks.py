@@ -6,7 +6,7 @@ from unittest.mock import AsyncMock, MagicMock
 import discord
 import pytest
 
-from doppelganger.bot.checks import has_required_role, is_not_blacklisted
+from doppelganger.bot.checks import BlacklistCache, has_required_role, is_not_blacklisted
 
 _NOW = datetime(2026, 1, 1)
 
@@ -21,6 +21,7 @@ def interaction() -> MagicMock:
     role2 = MagicMock()
     role2.id = 222
     user.roles = [role1, role2]
+    user.get_role.side_effect = lambda role_id: next((r for r in user.roles if r.id == role_id), None)
     inter.user = user
     return inter
 
@@ -45,18 +46,18 @@ class TestHasRequiredRole:
     """Tests for has_required_role check."""
 
     async def test_returns_true_when_no_role_configured(self, interaction: MagicMock) -> None:
-        """has_required_role returns True when required_role_id is empty."""
-        result = await has_required_role(interaction, "")
+        """has_required_role returns True when no required role is configured."""
+        result = await has_required_role(interaction, None)
         assert result is True
 
     async def test_returns_true_when_user_has_role(self, interaction: MagicMock) -> None:
         """has_required_role returns True when user has the required role."""
-        result = await has_required_role(interaction, "222")
+        result = await has_required_role(interaction, 222)
         assert result is True
 
     async def test_returns_false_when_user_lacks_role(self, interaction: MagicMock) -> None:
         """has_required_role returns False when user does not have the role."""
-        result = await has_required_role(interaction, "999")
+        result = await has_required_role(interaction, 999)
         assert result is False
 
 
@@ -80,3 +81,22 @@ class TestIsNotBlacklisted:
         engine = _make_db_engine({"id": 1, "discord_id": "12345", "blacklisted": True, "created_at": _NOW})
         result = await is_not_blacklisted(engine, "12345")
         assert result is False
+
+    async def test_cache_skips_database_on_repeat(self) -> None:
+        """is_not_blacklisted answers repeat checks from the cache without opening a connection."""
+        engine = _make_db_engine({"id": 1, "discord_id": "12345", "blacklisted": True, "created_at": _NOW})
+        cache = BlacklistCache()
+
+        assert await is_not_blacklisted(engine, "12345", cache) is False
+        assert await is_not_blacklisted(engine, "12345", cache) is False
+        engine.connect.assert_called_once()
+
+    async def test_cache_invalidate_rereads_database(self) -> None:
+        """An invalidated entry is looked up again on the next check."""
+        engine = _make_db_engine(None)
+        cache = BlacklistCache()
+
+        await is_not_blacklisted(engine, "12345", cache)
+        cache.invalidate("12345")
+        await is_not_blacklisted(engine, "12345", cache)
+        assert engine.connect.call_count == 2
@@ -1,12 +1,16 @@
 """Tests for the TTS cog slash commands."""
 
+import asyncio
 from datetime import datetime
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from doppelganger.bot.checks import BlacklistCache
 from doppelganger.bot.cogs.tts import TTSCog
+from doppelganger.bot.overrides import OverridesCache
 from doppelganger.bot.queue import QueueItem, RateLimiter, TTSQueue
+from doppelganger.bot.voice import VoiceManager
 from doppelganger.tts.voice_registry import VoiceEntry
 
 _NOW = datetime(2026, 1, 1)
@@ -113,6 +117,8 @@ def _make_db_engine(user_row: dict[str, object] | None = None, *, blacklisted: b
             return _make_execute_result(audit_dict)
         if "tts_requests" in sql_str:
             return _make_execute_result(tts_request_dict)
+        if "characters" in sql_str:
+            return _make_execute_result(default_character)
         return _make_execute_result(default_user)
 
     begin_conn = AsyncMock()
@@ -131,14 +137,20 @@ def bot() -> MagicMock:
     bot = MagicMock()
     bot.settings.cooldown_seconds = 5
     bot.settings.required_role_id = ""
+    bot.required_role_id = None
     bot.settings.max_text_length = 2000
     bot.settings.entrance_sound = ""
     bot.db_engine = _make_db_engine({"id": 1, "discord_id": "12345", "blacklisted": False, "created_at": _NOW})
     bot.tts_service = MagicMock()
+    bot.tts_executor = None
+    bot.tts_load_task = None
+    bot.blacklist_cache = BlacklistCache()
+    bot.overrides_cache = OverridesCache()
     bot.voice_registry = MagicMock()
     bot.audio_cache = MagicMock()
     bot.tts_queue = TTSQueue(max_depth=20)
     bot.rate_limiter = RateLimiter(requests_per_minute=10)
+    bot.voice_manager = VoiceManager(cooldown_seconds=5)
     return bot
 
 
@@ -213,13 +225,40 @@ class TestSayCommand:
         self, cog: TTSCog, bot: MagicMock, interaction: MagicMock
     ) -> None:
         """Missing required role should return a permission error."""
-        bot.settings.required_role_id = "999"
+        bot.required_role_id = 999
 
         await cog.say.callback(cog, interaction, "gandalf", "Hello", None)
 
         last_call = interaction.followup.send.call_args
         assert "required role" in str(last_call)
 
+    async def test_say_while_model_loading_returns_warming_up(
+        self, cog: TTSCog, bot: MagicMock, interaction: MagicMock
+    ) -> None:
+        """Requests that arrive before the model has loaded are turned away without using the rate limit."""
+        bot.tts_service.is_loaded = False
+        bot.tts_load_task = asyncio.get_running_loop().create_future()
+
+        await cog.say.callback(cog, interaction, "gandalf", "Hello", None)
+
+        last_call = interaction.followup.send.call_args
+        assert "warming up" in str(last_call)
+        assert bot.rate_limiter.remaining("12345") == 10
+
+    async def test_say_after_model_load_failed_returns_unavailable(
+        self, cog: TTSCog, bot: MagicMock, interaction: MagicMock
+    ) -> None:
+        """Once the load has finished without a model, requests are told TTS is unavailable, not to wait."""
+        bot.tts_service.is_loaded = False
+        bot.tts_load_task = asyncio.get_running_loop().create_future()
+        bot.tts_load_task.set_result(None)
+
+        await cog.say.callback(cog, interaction, "gandalf", "Hello", None)
+
+        last_call = interaction.followup.send.call_args
+        assert "unavailable" in str(last_call)
+        assert bot.rate_limiter.remaining("12345") == 10
+
     async def test_say_with_blacklisted_user_returns_error(
         self, cog: TTSCog, bot: MagicMock, interaction: MagicMock
     ) -> None:
@@ -277,6 +316,8 @@ class TestProcessItem:
     async def test_process_item_generates_and_plays(self, cog: TTSCog, bot: MagicMock) -> None:
         """Processing an item should generate audio and play it."""
         bot.audio_cache.get.return_value = None
+        bot.audio_cache.get_pcm.return_value = None
+        bot.audio_cache.enabled = True
         result = MagicMock()
         result.audio_bytes = b"audio"
         bot.tts_service.generate.return_value = result
@@ -296,10 +337,17 @@ class TestProcessItem:
             interaction=interaction,
         )
 
-        with patch.object(cog.voice_manager, "play", new_callable=AsyncMock) as mock_play:
+        with (
+            patch("doppelganger.bot.cogs.tts.decode_to_pcm", AsyncMock(return_value=b"pcm")),
+            patch.object(cog.voice_manager, "play", new_callable=AsyncMock) as mock_play,
+        ):
             await cog._process_item(item)
 
-        mock_play.assert_awaited_once()
+        mock_play.assert_awaited_once_with(channel, b"audio", pcm=b"pcm")
+        bot.audio_cache.set_pcm.assert_called_once_with("gandalf", "Hello world", b"pcm")
+        # Start + overrides share one transaction, completion + audit share another
+        assert bot.db_engine.begin.call_count == 2
+        bot.db_engine.connect.assert_not_called()
         # generate is now called with three args: character, text, overrides
         call_args = bot.tts_service.generate.call_args
         assert call_args[0][0] == "gandalf"
@@ -309,6 +357,7 @@ class TestProcessItem:
     async def test_process_item_uses_cache(self, cog: TTSCog, bot: MagicMock) -> None:
         """Cached audio should skip generation."""
         bot.audio_cache.get.return_value = b"cached_audio"
+        bot.audio_cache.get_pcm.return_value = b"cached_pcm"
 
         interaction = MagicMock()
         interaction.followup.send = AsyncMock()
@@ -324,11 +373,109 @@ class TestProcessItem:
             channel=channel,
             interaction=interaction,
         )
-        with patch.object(cog.voice_manager, "play", new_callable=AsyncMock) as mock_play:
+        with (
+            patch("doppelganger.bot.cogs.tts.decode_to_pcm", new_callable=AsyncMock) as decode,
+            patch.object(cog.voice_manager, "play", new_callable=AsyncMock) as mock_play,
+        ):
             await cog._process_item(item)
 
-        mock_play.assert_awaited_once_with(channel, b"cached_audio")
+        mock_play.assert_awaited_once_with(channel, b"cached_audio", pcm=b"cached_pcm")
         bot.tts_service.generate.assert_not_called()
+        decode.assert_not_awaited()
+
+    async def test_process_item_uses_cached_overrides(self, cog: TTSCog, bot: MagicMock) -> None:
+        """Overrides are read from the database once, then served from the bot's cache."""
+        bot.audio_cache.get.return_value = b"cached_audio"
+        bot.audio_cache.get_pcm.return_value = b"cached_pcm"
+
+        def _item(request_id: int) -> QueueItem:
+            return QueueItem(
+                request_id=request_id,
+                user_id=1,
+                discord_id="12345",
+                character="gandalf",
+                text="Hello",
+                channel=MagicMock(),
+                interaction=MagicMock(),
+            )
+
+        with patch.object(cog.voice_manager, "play", new_callable=AsyncMock):
+            await cog._process_item(_item(1))
+            await cog._process_item(_item(2))
+
+        conn = bot.db_engine.begin.return_value.__aenter__.return_value
+        character_queries = [c for c in conn.execute.call_args_list if "FROM characters" in str(c.args[0])]
+        assert len(character_queries) == 1
+        assert bot.overrides_cache.get("gandalf") is not None
+
+    async def test_process_item_streams_wav_when_cache_disabled(self, cog: TTSCog, bot: MagicMock) -> None:
+        """With the cache off there is nowhere to keep PCM, so the WAV is handed to FFmpeg at play time."""
+        bot.audio_cache.get.return_value = None
+        bot.audio_cache.get_pcm.return_value = None
+        bot.audio_cache.enabled = False
+        result = MagicMock()
+        result.audio_bytes = b"audio"
+        bot.tts_service.generate.return_value = result
+
+        channel = MagicMock()
+        item = QueueItem(
+            request_id=1,
+            user_id=1,
+            discord_id="12345",
+            character="gandalf",
+            text="Hello",
+            channel=channel,
+            interaction=MagicMock(),
+        )
+        with (
+            patch("doppelganger.bot.cogs.tts.decode_to_pcm", new_callable=AsyncMock) as decode,
+            patch.object(cog.voice_manager, "play", new_callable=AsyncMock) as mock_play,
+        ):
+            await cog._process_item(item)
+
+        mock_play.assert_awaited_once_with(channel, b"audio", pcm=None)
+        decode.assert_not_awaited()
+
+    async def test_process_item_streams_wav_when_decode_fails(self, cog: TTSCog, bot: MagicMock) -> None:
+        """A failed PCM decode falls back to handing the WAV to FFmpeg instead of failing the request."""
+        bot.audio_cache.get.return_value = None
+        bot.audio_cache.get_pcm.return_value = None
+        bot.audio_cache.enabled = True
+        result = MagicMock()
+        result.audio_bytes = b"audio"
+        bot.tts_service.generate.return_value = result
+
+        channel = MagicMock()
+        item = QueueItem(
+            request_id=1,
+            user_id=1,
+            discord_id="12345",
+            character="gandalf",
+            text="Hello",
+            channel=channel,
+            interaction=MagicMock(),
+        )
+        with (
+            patch("doppelganger.bot.cogs.tts.decode_to_pcm", AsyncMock(side_effect=RuntimeError("ffmpeg"))),
+            patch.object(cog.voice_manager, "play", new_callable=AsyncMock) as mock_play,
+        ):
+            await cog._process_item(item)
+
+        mock_play.assert_awaited_once_with(channel, b"audio", pcm=None)
+        bot.audio_cache.set_pcm.assert_not_called()
+
+
+class TestCogLifecycle:
+    """Tests for state shared across cog reloads."""
+
+    async def test_reloaded_cog_keeps_voice_manager(self, bot: MagicMock) -> None:
+        """A fresh cog instance reuses the bot's VoiceManager so cooldowns survive reloads."""
+        bot.voice_manager._last_play_time[42] = 1.0
+
+        reloaded = TTSCog(bot)
+
+        assert reloaded.voice_manager is bot.voice_manager
+        assert reloaded.voice_manager._last_play_time == {42: 1.0}
 
 
 class TestVoicesCommand:
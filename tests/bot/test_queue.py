@@ -22,7 +22,7 @@ def _make_item(request_id: int = 1, discord_id: str = "12345") -> QueueItem:
 
 
 class TestRateLimiter:
-    """Tests for the sliding-window rate limiter."""
+    """Tests for the token-bucket rate limiter."""
 
     def test_allows_first_request(self) -> None:
         limiter = RateLimiter(requests_per_minute=3)
@@ -55,6 +55,34 @@ class TestRateLimiter:
             mock_time.monotonic.return_value = 61.0
             assert limiter.try_acquire("user1") is True
 
+    def test_refills_gradually(self) -> None:
+        """Tokens come back at requests_per_minute / 60 per second rather than all at once."""
+        limiter = RateLimiter(requests_per_minute=2)
+
+        with patch("doppelganger.bot.queue.time") as mock_time:
+            mock_time.monotonic.return_value = 0.0
+            limiter.try_acquire("user1")
+            limiter.try_acquire("user1")
+            assert limiter.remaining("user1") == 0
+
+            mock_time.monotonic.return_value = 30.0
+            assert limiter.remaining("user1") == 1
+            assert limiter.try_acquire("user1") is True
+            assert limiter.try_acquire("user1") is False
+
+    def test_sweep_drops_idle_buckets(self) -> None:
+        """Buckets untouched for a full window are dropped on the periodic sweep."""
+        with patch("doppelganger.bot.queue.time") as mock_time:
+            mock_time.monotonic.return_value = 0.0
+            limiter = RateLimiter(requests_per_minute=1)
+            limiter.try_acquire("idle")
+
+            mock_time.monotonic.return_value = 300.0
+            limiter.try_acquire("active")
+
+            assert list(limiter._buckets) == ["active"]
+            assert limiter.remaining("idle") == 1
+
     def test_remaining_shows_correct_count(self) -> None:
         limiter = RateLimiter(requests_per_minute=3)
         assert limiter.remaining("user1") == 3
@@ -118,6 +146,16 @@ class TestTTSQueue:
         item = await queue.dequeue()
         assert item.request_id == 2
 
+    async def test_cancel_frees_capacity(self) -> None:
+        queue = TTSQueue(max_depth=2)
+        await queue.submit(_make_item(request_id=1))
+        await queue.submit(_make_item(request_id=2))
+
+        await queue.cancel(1)
+        assert await queue.submit(_make_item(request_id=3)) == 2
+
+        assert [(await queue.dequeue()).request_id for _ in range(2)] == [2, 3]
+
     async def test_cancel_returns_false_for_missing(self) -> None:
         queue = TTSQueue(max_depth=10)
         result = await queue.cancel(999)
@@ -135,6 +173,31 @@ class TestTTSQueue:
         item = await queue.dequeue()
         assert item.request_id == 3
 
+    async def test_latest_bump_comes_first(self) -> None:
+        queue = TTSQueue(max_depth=10)
+        for request_id in (1, 2, 3):
+            await queue.submit(_make_item(request_id=request_id))
+
+        await queue.bump(2)
+        await queue.bump(3)
+
+        assert [p.request_id for p in queue.get_state().pending] == [3, 2, 1]
+        assert queue.position(1) == 3
+        assert [(await queue.dequeue()).request_id for _ in range(3)] == [3, 2, 1]
+
+    async def test_cancel_after_bump(self) -> None:
+        queue = TTSQueue(max_depth=10)
+        await queue.submit(_make_item(request_id=1))
+        await queue.submit(_make_item(request_id=2))
+
+        await queue.bump(2)
+        await queue.cancel(2)
+        await queue.submit(_make_item(request_id=3))
+
+        assert queue.depth == 2
+        assert [(await queue.dequeue()).request_id for _ in range(2)] == [1, 3]
+        assert queue.depth == 0
+
     async def test_bump_returns_false_for_missing(self) -> None:
         queue = TTSQueue(max_depth=10)
         result = await queue.bump(999)
@@ -178,6 +241,21 @@ class TestTTSQueue:
         assert result[0].request_id == 1
         task.cancel()
 
+    async def test_waiting_dequeue_survives_cancel(self) -> None:
+        """A consumer woken for a request that is cancelled before it runs keeps waiting for the next one."""
+        queue = TTSQueue(max_depth=10)
+        consumer = asyncio.create_task(queue.dequeue())
+        await asyncio.sleep(0)
+
+        await queue.submit(_make_item(request_id=1))
+        await queue.cancel(1)
+        await asyncio.sleep(0.01)
+        assert not consumer.done()
+
+        await queue.submit(_make_item(request_id=2))
+        item = await asyncio.wait_for(consumer, timeout=1)
+        assert item.request_id == 2
+
     async def test_get_state_returns_correct_shape(self) -> None:
         queue = TTSQueue(max_depth=10)
         await queue.submit(_make_item(request_id=1))
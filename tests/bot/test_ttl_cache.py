@@ -0,0 +1,53 @@
+"""Tests for the TTL cache behind the bot's blacklist and overrides caches."""
+
+from unittest.mock import patch
+
+from doppelganger.bot.checks import BlacklistCache
+from doppelganger.bot.overrides import OverridesCache
+from doppelganger.bot.ttl_cache import TTLCache
+from doppelganger.tts.engine import TTSOverrides
+
+
+def test_entry_expires() -> None:
+    """Entries older than the TTL are treated as missing."""
+    cache: TTLCache[str, bool] = TTLCache(max_size=10, ttl_seconds=60.0)
+    with patch("doppelganger.bot.ttl_cache.time.monotonic", return_value=100.0):
+        cache.put("1", True)
+    with patch("doppelganger.bot.ttl_cache.time.monotonic", return_value=159.0):
+        assert cache.get("1") is True
+    with patch("doppelganger.bot.ttl_cache.time.monotonic", return_value=160.0):
+        assert cache.get("1") is None
+
+
+def test_evicts_least_recently_used() -> None:
+    """The least recently used entry is dropped once max_size is exceeded."""
+    cache: TTLCache[str, bool] = TTLCache(max_size=2, ttl_seconds=60.0)
+    cache.put("1", False)
+    cache.put("2", True)
+    cache.get("1")
+    cache.put("3", False)
+
+    assert cache.get("2") is None
+    assert cache.get("1") is False
+    assert cache.get("3") is False
+
+
+def test_invalidate() -> None:
+    """invalidate drops the entry and ignores unknown keys."""
+    cache: TTLCache[str, bool] = TTLCache(max_size=10, ttl_seconds=60.0)
+    cache.put("1", True)
+    cache.invalidate("1")
+    cache.invalidate("missing")
+
+    assert cache.get("1") is None
+
+
+def test_bot_caches_share_behavior() -> None:
+    """The blacklist and overrides caches are TTL caches with their own defaults."""
+    blacklist = BlacklistCache()
+    overrides = OverridesCache()
+    blacklist.put("1", True)
+    overrides.put("gandalf", TTSOverrides(exaggeration=0.5))
+
+    assert blacklist.get("1") is True
+    assert overrides.get("gandalf") == TTSOverrides(exaggeration=0.5)
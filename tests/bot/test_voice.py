@@ -1,12 +1,14 @@
 """Tests for VoiceManager."""
 
+import asyncio
 import time
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import discord
 import pytest
 
-from doppelganger.bot.voice import VoiceManager
+from doppelganger.bot.voice import VoiceManager, decode_to_pcm
 
 
 @pytest.fixture
@@ -19,6 +21,7 @@ def voice_manager() -> VoiceManager:
 def voice_channel() -> MagicMock:
     """Create a mock voice channel."""
     channel = MagicMock()
+    channel.id = 7
     channel.guild.id = 42
     channel.connect = AsyncMock()
     return channel
@@ -30,10 +33,13 @@ def wav_bytes() -> bytes:
     return b"RIFF" + b"\x00" * 100
 
 
-def _make_voice_client() -> MagicMock:
-    """Create a mock voice client that simulates immediate playback completion."""
+def _make_voice_client(channel: MagicMock) -> MagicMock:
+    """Create a mock voice client connected to channel that simulates immediate playback completion."""
     vc = MagicMock()
+    vc.channel = channel
+    vc.is_connected.return_value = True
     vc.disconnect = AsyncMock()
+    vc.move_to = AsyncMock()
 
     def fake_play(source: object, *, after: object = None) -> None:
         if callable(after):
@@ -49,7 +55,7 @@ class TestVoiceManager:
     async def test_play_joins_channel_and_plays_audio(
         self, voice_manager: VoiceManager, voice_channel: MagicMock, wav_bytes: bytes
     ) -> None:
-        vc = _make_voice_client()
+        vc = _make_voice_client(voice_channel)
         voice_channel.connect.return_value = vc
 
         with patch("doppelganger.bot.voice.discord.FFmpegPCMAudio"):
@@ -58,14 +64,83 @@ class TestVoiceManager:
         voice_channel.connect.assert_awaited_once()
         vc.play.assert_called_once()
 
-    async def test_play_disconnects_after_playback(
+    async def test_play_stays_connected_between_plays(
         self, voice_manager: VoiceManager, voice_channel: MagicMock, wav_bytes: bytes
     ) -> None:
-        vc = _make_voice_client()
+        vc = _make_voice_client(voice_channel)
         voice_channel.connect.return_value = vc
 
         with patch("doppelganger.bot.voice.discord.FFmpegPCMAudio"):
             await voice_manager.play(voice_channel, wav_bytes)
+            await voice_manager.play(voice_channel, wav_bytes)
+
+        voice_channel.connect.assert_awaited_once()
+        vc.disconnect.assert_not_awaited()
+        assert vc.play.call_count == 2
+
+    async def test_play_moves_when_channel_changes(
+        self, voice_manager: VoiceManager, voice_channel: MagicMock, wav_bytes: bytes
+    ) -> None:
+        vc = _make_voice_client(voice_channel)
+        voice_channel.connect.return_value = vc
+        other_channel = MagicMock()
+        other_channel.id = 8
+        other_channel.guild.id = 42
+
+        with patch("doppelganger.bot.voice.discord.FFmpegPCMAudio"):
+            await voice_manager.play(voice_channel, wav_bytes)
+            await voice_manager.play(other_channel, wav_bytes)
+
+        vc.move_to.assert_awaited_once_with(other_channel)
+        other_channel.connect.assert_not_called()
+
+    async def test_play_reconnects_stale_client(
+        self, voice_manager: VoiceManager, voice_channel: MagicMock, wav_bytes: bytes
+    ) -> None:
+        stale = _make_voice_client(voice_channel)
+        fresh = _make_voice_client(voice_channel)
+        voice_channel.connect.side_effect = [stale, fresh]
+
+        with patch("doppelganger.bot.voice.discord.FFmpegPCMAudio"):
+            await voice_manager.play(voice_channel, wav_bytes)
+            stale.is_connected.return_value = False
+            await voice_manager.play(voice_channel, wav_bytes)
+
+        stale.disconnect.assert_awaited_once_with(force=True)
+        fresh.play.assert_called_once()
+
+    async def test_play_disconnects_after_idle_timeout(self, voice_channel: MagicMock, wav_bytes: bytes) -> None:
+        vm = VoiceManager(cooldown_seconds=2, idle_seconds=0.01)
+        vc = _make_voice_client(voice_channel)
+        voice_channel.connect.return_value = vc
+
+        with patch("doppelganger.bot.voice.discord.FFmpegPCMAudio"):
+            await vm.play(voice_channel, wav_bytes)
+
+        await asyncio.sleep(0.05)
+        vc.disconnect.assert_awaited_once()
+
+    async def test_play_disconnects_on_failure(
+        self, voice_manager: VoiceManager, voice_channel: MagicMock, wav_bytes: bytes
+    ) -> None:
+        vc = _make_voice_client(voice_channel)
+        vc.play.side_effect = RuntimeError("boom")
+        voice_channel.connect.return_value = vc
+
+        with patch("doppelganger.bot.voice.discord.FFmpegPCMAudio"), pytest.raises(RuntimeError):
+            await voice_manager.play(voice_channel, wav_bytes)
+
+        vc.disconnect.assert_awaited_once()
+
+    async def test_shutdown_disconnects_all(
+        self, voice_manager: VoiceManager, voice_channel: MagicMock, wav_bytes: bytes
+    ) -> None:
+        vc = _make_voice_client(voice_channel)
+        voice_channel.connect.return_value = vc
+
+        with patch("doppelganger.bot.voice.discord.FFmpegPCMAudio"):
+            await voice_manager.play(voice_channel, wav_bytes)
+        await voice_manager.shutdown()
 
         vc.disconnect.assert_awaited_once()
 
@@ -75,7 +150,7 @@ class TestVoiceManager:
     async def test_is_on_cooldown_returns_true_after_play(
         self, voice_manager: VoiceManager, voice_channel: MagicMock, wav_bytes: bytes
     ) -> None:
-        vc = _make_voice_client()
+        vc = _make_voice_client(voice_channel)
         voice_channel.connect.return_value = vc
 
         with patch("doppelganger.bot.voice.discord.FFmpegPCMAudio"):
@@ -92,10 +167,54 @@ class TestVoiceManager:
         entrance_file.write_bytes(b"RIFF" + b"\x00" * 100)
         vm = VoiceManager(cooldown_seconds=2, entrance_sound=str(entrance_file))
 
-        vc = _make_voice_client()
+        vc = _make_voice_client(voice_channel)
         voice_channel.connect.return_value = vc
 
-        with patch("doppelganger.bot.voice.discord.FFmpegPCMAudio"):
+        with (
+            patch("doppelganger.bot.voice.decode_to_pcm", AsyncMock(return_value=b"\x00" * 4)) as decode,
+            patch("doppelganger.bot.voice.discord.FFmpegPCMAudio"),
+        ):
+            await vm.play(voice_channel, wav_bytes)
             await vm.play(voice_channel, wav_bytes)
 
-        assert vc.play.call_count == 2
+        # Entrance sound plays on join only, not on every item while connected
+        assert vc.play.call_count == 3
+        decode.assert_awaited_once()
+
+    async def test_play_with_pcm_skips_ffmpeg(
+        self, voice_manager: VoiceManager, voice_channel: MagicMock, wav_bytes: bytes
+    ) -> None:
+        vc = _make_voice_client(voice_channel)
+        voice_channel.connect.return_value = vc
+
+        with patch("doppelganger.bot.voice.discord.FFmpegPCMAudio") as ffmpeg:
+            await voice_manager.play(voice_channel, wav_bytes, pcm=b"\x00" * 3840)
+
+        ffmpeg.assert_not_called()
+        assert isinstance(vc.play.call_args[0][0], discord.PCMAudio)
+
+
+class TestDecodeToPcm:
+    """Tests for the one-shot FFmpeg decode."""
+
+    async def test_decode_returns_stdout(self) -> None:
+        process = MagicMock()
+        process.communicate = AsyncMock(return_value=(b"pcm", b""))
+        process.returncode = 0
+
+        with patch("doppelganger.bot.voice.asyncio.create_subprocess_exec", AsyncMock(return_value=process)) as spawn:
+            assert await decode_to_pcm(b"wav") == b"pcm"
+
+        process.communicate.assert_awaited_once_with(b"wav")
+        assert spawn.call_args[0][0] == "ffmpeg"
+
+    async def test_decode_failure_raises(self) -> None:
+        process = MagicMock()
+        process.communicate = AsyncMock(return_value=(b"", b"Invalid data found"))
+        process.returncode = 1
+
+        with (
+            patch("doppelganger.bot.voice.asyncio.create_subprocess_exec", AsyncMock(return_value=process)),
+            pytest.raises(RuntimeError, match="Invalid data found"),
+        ):
+            await decode_to_pcm(b"not audio")
@@ -134,6 +134,7 @@ def app(
     application.state.tts_service = mock_tts_service
     application.state.voice_registry = mock_voice_registry
     application.state.audio_cache = audio_cache
+    application.state.tts_inflight = {}
     return application
 
 
@@ -0,0 +1,53 @@
+"""Tests for shared async engine lifecycle."""
+
+import asyncio
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from doppelganger.config import DatabaseSettings, Settings
+from doppelganger.db import engine as engine_module
+from doppelganger.db.engine import create_db_engine, dispose_db_engine
+
+
+@pytest.mark.asyncio
+async def test_engine_shared_until_last_dispose() -> None:
+    """Apps with identical DB settings share one engine, which is only disposed by the last release."""
+    settings = Settings(database=DatabaseSettings(name="shared_engine_test"))
+    first = create_db_engine(settings)
+    second = create_db_engine(settings)
+    assert first is second
+
+    await dispose_db_engine(first)
+    assert create_db_engine(settings) is first
+
+    await dispose_db_engine(first)
+    await dispose_db_engine(first)
+    assert all(shared is not first for shared, _ in engine_module._engines.values())
+
+
+@pytest.mark.asyncio
+async def test_engine_not_shared_across_pool_settings() -> None:
+    """Different pool options get their own engine."""
+    small = create_db_engine(Settings(database=DatabaseSettings(name="pool_test", pool_size=1)))
+    large = create_db_engine(Settings(database=DatabaseSettings(name="pool_test", pool_size=20)))
+    assert small is not large
+
+    await dispose_db_engine(small)
+    await dispose_db_engine(large)
+
+
+def test_engine_not_shared_across_event_loops() -> None:
+    """An app on another event loop gets its own engine, since asyncpg connections are bound to their loop."""
+    settings = Settings(database=DatabaseSettings(name="loop_test"))
+
+    async def create() -> AsyncEngine:
+        return create_db_engine(settings)
+
+    first = asyncio.run(create())
+    second = asyncio.run(create())
+    assert first is not second
+
+    for engine in (first, second):
+        asyncio.run(dispose_db_engine(engine))
+    assert all(shared not in (first, second) for shared, _ in engine_module._engines.values())
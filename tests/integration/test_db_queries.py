@@ -1,10 +1,13 @@
 """Integration tests for DB query functions against a real Postgres."""
 
+from pathlib import Path
+
 import pytest
 from sqlalchemy.ext.asyncio import AsyncConnection
 
 from doppelganger.db.queries import audit_log, characters, tts_requests, users
 from doppelganger.db.types import UserRow
+from doppelganger.tts.voice_registry import VoiceRegistry
 
 pytestmark = pytest.mark.integration
 
@@ -115,6 +118,27 @@ async def test_list_characters(db_conn: AsyncConnection) -> None:
     assert names == sorted(names)
 
 
+async def test_sync_voices_skips_unchanged_directory(db_conn: AsyncConnection, tmp_path: Path) -> None:
+    """sync_voices_to_db inserts new voices, then skips while the voices directory fingerprint is unchanged."""
+    char_dir = tmp_path / "syncvoice"
+    char_dir.mkdir()
+    (char_dir / "reference.wav").write_bytes(b"RIFF")
+    registry = VoiceRegistry(str(tmp_path))
+    registry.scan()
+
+    assert await characters.sync_voices_to_db(db_conn, registry) == 1
+
+    # With the fingerprint recorded, a missing row isn't noticed until the directory changes
+    row = await characters.get_character_by_name(db_conn, "syncvoice")
+    assert row is not None
+    await characters.delete_character(db_conn, row.id)
+    assert await characters.sync_voices_to_db(db_conn, registry) == 0
+
+    (char_dir / "reference.wav").write_bytes(b"RIFF-changed")
+    registry.scan()
+    assert await characters.sync_voices_to_db(db_conn, registry) == 1
+
+
 async def _create_test_user(db_conn: AsyncConnection, discord_id: str) -> UserRow:
     """Helper to create a user for FK references."""
     return await users.create_user(db_conn, discord_id=discord_id)
@@ -132,6 +156,29 @@ async def test_create_tts_request(db_conn: AsyncConnection) -> None:
     assert row.completed_at is None
 
 
+async def test_upsert_user_and_create_request(db_conn: AsyncConnection) -> None:
+    """upsert_user_and_create_request creates a new user, then reuses and renames them on later requests."""
+    user_id, request_id = await tts_requests.upsert_user_and_create_request(
+        db_conn, "600000000000000005", "frodo", "voice", "first"
+    )
+    again_user_id, again_request_id = await tts_requests.upsert_user_and_create_request(
+        db_conn, "600000000000000005", "mr-underhill", "voice", "second"
+    )
+
+    assert again_user_id == user_id
+    assert again_request_id != request_id
+
+    user = await users.get_user_by_discord_id(db_conn, "600000000000000005")
+    assert user is not None
+    assert user.id == user_id
+    assert user.username == "mr-underhill"
+
+    request = await tts_requests.get_tts_request(db_conn, again_request_id)
+    assert request is not None
+    assert request.user_id == user_id
+    assert request.text == "second"
+
+
 async def test_update_tts_request_status(db_conn: AsyncConnection) -> None:
     """update_tts_request_status changes the status field."""
     user = await _create_test_user(db_conn, "610000000000000000")
@@ -193,6 +240,22 @@ async def test_list_tts_requests_with_status_filter(db_conn: AsyncConnection) ->
     assert all(r.id != req.id for r in pending)
 
 
+async def test_list_tts_requests_page_total(db_conn: AsyncConnection) -> None:
+    """list_tts_requests_page returns the page alongside the unpaginated total, even past the end."""
+    user = await _create_test_user(db_conn, "655000000000000000")
+    await tts_requests.create_tts_request(db_conn, user.id, "voice", "one")
+    await tts_requests.create_tts_request(db_conn, user.id, "voice", "two")
+    expected = await tts_requests.count_tts_requests(db_conn)
+
+    rows, total = await tts_requests.list_tts_requests_page(db_conn, limit=1)
+    assert len(rows) == 1
+    assert total == expected
+
+    rows, total = await tts_requests.list_tts_requests_page(db_conn, limit=1, offset=expected)
+    assert rows == []
+    assert total == expected
+
+
 async def test_get_tts_request_found(db_conn: AsyncConnection) -> None:
     """get_tts_request returns the request when present."""
     user = await _create_test_user(db_conn, "660000000000000000")
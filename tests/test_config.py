@@ -26,6 +26,7 @@ def test_default_settings(_clean_env: None) -> None:
     assert settings.database.host == "localhost"
     assert settings.database.port == 5432
     assert settings.database.pool_size == 5
+    assert settings.database.pool_timeout == 30.0
 
 
 def test_database_async_url() -> None:
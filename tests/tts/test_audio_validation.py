@@ -97,3 +97,14 @@ def test_boundary_duration_max() -> None:
     data = _make_wav(duration_seconds=30.0)
     info = validate_reference_audio(data)
     assert info.duration_seconds <= 30.0
+
+
+def test_file_object_validated_from_header() -> None:
+    """A seekable file object is validated in place and reports its full size."""
+    data = _make_wav(sample_rate=22050, duration_seconds=10.0)
+    stream = io.BytesIO(data)
+    stream.seek(100)
+
+    info = validate_reference_audio(stream)
+    assert info.file_size == len(data)
+    assert abs(info.duration_seconds - 10.0) < 0.1
@@ -1,6 +1,9 @@
 """Tests for the audio cache."""
 
-from doppelganger.tts.cache import AudioCache
+import pytest
+
+from doppelganger.tts import cache as cache_module
+from doppelganger.tts.cache import AudioCache, CacheEvictionPolicy
 
 
 def test_miss_returns_none() -> None:
@@ -53,6 +56,65 @@ def test_access_refreshes_lru() -> None:
     assert cache.get("c", "3") == b"c3"
 
 
+def test_counter_evicts_fewest_hits() -> None:
+    """Counter policy evicts the least-hit entry, regardless of recency."""
+    cache = AudioCache(max_size=2, eviction_policy=CacheEvictionPolicy.COUNTER)
+    cache.put("a", "1", b"a1")
+    cache.put("b", "2", b"b2")
+
+    cache.get("a", "1")
+    cache.get("a", "1")
+    cache.get("b", "2")  # Most recent, but fewer hits than "a"
+    cache.put("c", "3", b"c3")
+
+    assert cache.get("a", "1") == b"a1"
+    assert cache.get("b", "2") is None
+    assert cache.get("c", "3") == b"c3"
+
+
+def test_counter_halves_counts_at_cap(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Reaching the hit cap halves every entry's count so stale popularity decays."""
+    monkeypatch.setattr(cache_module, "_COUNTER_MAX_HITS", 4)
+    cache = AudioCache(max_size=10, eviction_policy=CacheEvictionPolicy.COUNTER)
+    cache.put("a", "1", b"a1")
+    cache.put("b", "2", b"b2")
+    cache.get("b", "2")
+    cache.get("b", "2")
+    for _ in range(4):
+        cache.get("a", "1")
+
+    hits = {e.character: e.hits for e in cache.list_entries()}
+    assert hits == {"a": 2, "b": 1}
+
+
+def test_importance_evicts_least_reused_audio(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Importance policy evicts the candidate whose reuse saved the least audio, not the least recent."""
+    monkeypatch.setattr(cache_module, "_IMPORTANCE_CANDIDATE_FRACTION", 1.0)
+    cache = AudioCache(max_size=3, eviction_policy=CacheEvictionPolicy.IMPORTANCE)
+    cache.put("long", "1", b"x" * 1000)
+    cache.put("short", "2", b"y" * 10)
+    cache.put("fresh", "3", b"z" * 10)
+
+    cache.get("long", "1")
+    cache.get("short", "2")  # "long" is now least recent, but its reuse saved far more
+    cache.put("new", "4", b"n")
+
+    assert cache.get("long", "1") is not None
+    assert cache.get("short", "2") is not None
+    assert cache.get("fresh", "3") is None
+
+
+def test_importance_decays_hourly() -> None:
+    """Importance loses 10% per hour since its last update."""
+    cache = AudioCache(max_size=10, eviction_policy=CacheEvictionPolicy.IMPORTANCE)
+    cache.put("a", "1", b"x" * 100)
+    cache.get("a", "1")
+
+    entry = cache.list_entries()[0]
+    later = entry.importance_updated_at + 3600
+    assert entry.decayed_importance(later) == pytest.approx(90.0)
+
+
 def test_clear() -> None:
     """Clear removes all entries."""
     cache = AudioCache(max_size=10)
@@ -281,3 +343,74 @@ def test_disabled_get_does_not_track() -> None:
     cache.get("gandalf", "hello")
     assert cache.hits == 0
     assert cache.misses == 0
+
+
+def test_snapshot_counters() -> None:
+    """snapshot reports hits, misses, hit rate, size, and bytes together."""
+    cache = AudioCache(max_size=10)
+    cache.put("gandalf", "hello", b"abcd")
+    cache.get("gandalf", "hello")
+    cache.get("gandalf", "missing")
+    cache.get("gandalf", "also missing")
+
+    stats = cache.snapshot()
+    assert (stats.hits, stats.misses, stats.size, stats.total_bytes) == (1, 2, 1, 4)
+    assert stats.hit_rate == 1 / 3
+
+
+def test_snapshot_empty_hit_rate() -> None:
+    """snapshot of an unused cache reports a zero hit rate."""
+    assert AudioCache().snapshot().hit_rate == 0.0
+
+
+def test_pcm_attached_without_touching_stats() -> None:
+    """set_pcm stores decoded audio on the entry and get_pcm reads it back without counting a hit."""
+    cache = AudioCache(max_size=10)
+    cache.put("gandalf", "hello", b"wav")
+    cache.set_pcm("gandalf", "hello", b"pcm")
+
+    assert cache.get_pcm("gandalf", "hello") == b"pcm"
+    assert (cache.hits, cache.misses) == (0, 0)
+
+
+def test_pcm_dropped_when_audio_replaced() -> None:
+    """Re-putting an entry discards PCM decoded from the old audio."""
+    cache = AudioCache(max_size=10)
+    cache.put("gandalf", "hello", b"wav")
+    cache.set_pcm("gandalf", "hello", b"pcm")
+    cache.put("gandalf", "hello", b"new wav")
+
+    assert cache.get_pcm("gandalf", "hello") is None
+
+
+def test_total_bytes_counts_pcm() -> None:
+    """Attached PCM counts toward total bytes and the snapshot, and stops counting once its entry is evicted."""
+    cache = AudioCache(max_size=1)
+    cache.put("gandalf", "hello", b"wav")
+    cache.set_pcm("gandalf", "hello", b"pcm-bytes")
+
+    assert cache.total_bytes == 12
+    assert cache.snapshot().total_bytes == 12
+
+    cache.put("gandalf", "other", b"wav")
+    assert cache.total_bytes == 3
+
+
+def test_set_pcm_ignores_uncached_entry() -> None:
+    """set_pcm for an evicted or never-cached entry is a no-op."""
+    cache = AudioCache(max_size=10)
+    cache.set_pcm("gandalf", "hello", b"pcm")
+
+    assert cache.get_pcm("gandalf", "hello") is None
+    assert cache.size == 0
+
+
+def test_key_ignores_case_and_surrounding_whitespace() -> None:
+    """Texts differing only in case, surrounding whitespace, or line breaks share one entry."""
+    cache = AudioCache(max_size=10)
+    cache.put("gandalf", "You shall not pass", b"wav")
+
+    assert cache.get("gandalf", "  you shall NOT pass\n") == b"wav"
+    assert cache.get("gandalf", "you shall\nnot pass") == b"wav"
+    assert cache.get("gandalf", "you shallnot pass") is None
+    assert cache.get("gollum", "you shall not pass") is None
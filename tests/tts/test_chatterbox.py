@@ -223,3 +223,46 @@ def test_device_property(chatterbox_settings: ChatterboxSettings) -> None:
     """device property returns the configured device."""
     engine = ChatterboxEngine(chatterbox_settings)
     assert engine.device == "cpu"
+
+
+def test_load_compiles_and_warms_up(
+    mock_chatterbox: tuple[MagicMock, MagicMock],
+    mock_torch: tuple[MagicMock, MagicMock],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """compile_model compiles the T3 backbone and warmup runs one generation before the model is served."""
+    chatterbox_tts_class, model = mock_chatterbox
+    torch, _tensor = mock_torch
+    backbone = model.t3.tfmr
+
+    monkeypatch.setattr("doppelganger.tts.chatterbox.ChatterboxTTS", chatterbox_tts_class)
+    monkeypatch.setattr("doppelganger.tts.chatterbox.torch", torch)
+
+    engine = ChatterboxEngine(ChatterboxSettings(device="cpu", compile_model=True, warmup=True))
+    engine.load_model()
+
+    torch.compile.assert_called_once_with(backbone, dynamic=True)
+    assert model.t3.tfmr is torch.compile.return_value
+    model.generate.assert_called_once()
+    assert engine.is_loaded is True
+
+
+def test_half_precision_autocasts_on_cuda(
+    voice_path: str,
+    mock_chatterbox: tuple[MagicMock, MagicMock],
+    mock_torch: tuple[MagicMock, MagicMock],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """half_precision wraps CUDA generation in fp16 autocast."""
+    chatterbox_tts_class, _model = mock_chatterbox
+    torch, _tensor = mock_torch
+
+    monkeypatch.setattr("doppelganger.tts.chatterbox.ChatterboxTTS", chatterbox_tts_class)
+    monkeypatch.setattr("doppelganger.tts.chatterbox.torch", torch)
+
+    engine = ChatterboxEngine(ChatterboxSettings(device="cuda", half_precision=True))
+    engine.load_model()
+    engine._tensor_to_wav_bytes = MagicMock(return_value=b"RIFF-wav-data")
+    engine.generate(voice_path, "hello")
+
+    torch.autocast.assert_called_once_with(device_type="cuda", dtype=torch.float16)
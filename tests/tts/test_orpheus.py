@@ -175,6 +175,14 @@ def test_filter_audio_tokens_keeps_valid_range(engine: OrpheusEngine) -> None:
     assert result == valid
 
 
+def test_filter_audio_tokens_truncates_partial_frame(engine: OrpheusEngine) -> None:
+    """Audio tokens short of a full 7-token frame are dropped; no END_OF_AI keeps everything."""
+    tokens = list(range(_AUDIO_TOKEN_MIN, _AUDIO_TOKEN_MIN + 10))
+    result = engine._filter_audio_tokens(tokens)
+    assert result == tokens[:7]
+    assert engine._filter_audio_tokens([]) == []
+
+
 def test_unload(engine: OrpheusEngine, mock_client: MagicMock) -> None:
     """Unloading clears SNAC and closes client."""
     engine.unload_model()
@@ -19,24 +19,16 @@ def mock_snac_modules(monkeypatch: pytest.MonkeyPatch) -> tuple[MagicMock, Magic
     mock_torch.no_grad.return_value.__enter__ = MagicMock(return_value=None)
     mock_torch.no_grad.return_value.__exit__ = MagicMock(return_value=False)
 
-    # torch.tensor returns a MagicMock that supports .unsqueeze
-    def fake_tensor(data: list[int], device: str = "cpu") -> MagicMock:
-        """Create a fake tensor from a list."""
-        t = MagicMock()
-        t.unsqueeze.return_value = t
-        return t
-
-    mock_torch.tensor = fake_tensor
-
     # SNAC model returns a fake audio tensor with a numpy chain that produces real bytes
     model = MagicMock()
-    audio_array = np.zeros(2400, dtype=np.float32)
+    pcm_array = np.zeros(2400, dtype=np.int16)
 
-    # Build a mock that mimics: audio.squeeze().cpu().numpy().clip(-1, 1) * 32767 -> .astype("int16")
+    # Build a mock that mimics: audio.reshape(-1).clamp(-1, 1).mul(32767).to(int16) -> .cpu().numpy()
+    pcm_tensor = MagicMock()
+    pcm_tensor.device.type = "cpu"
+    pcm_tensor.cpu.return_value.numpy.return_value = pcm_array
     audio_tensor = MagicMock()
-    audio_tensor.squeeze.return_value = audio_tensor
-    audio_tensor.cpu.return_value = audio_tensor
-    audio_tensor.numpy.return_value = audio_array
+    audio_tensor.reshape.return_value.clamp.return_value.mul.return_value.to.return_value = pcm_tensor
     model.decode.return_value = audio_tensor
 
     # .from_pretrained(...).to(device) must return the model mock
@@ -103,11 +95,33 @@ def test_redistribute_codes_interleaves_per_frame() -> None:
     layer_0, layer_1, layer_2 = decoder._redistribute_codes(tokens)
 
     # Coarse: 1 per frame
-    assert layer_0 == [10, 11]
+    assert layer_0.tolist() == [10, 11]
     # Mid: 2 per frame, interleaved [pos1, pos4, pos1, pos4]
-    assert layer_1 == [20, 50, 21, 51]
+    assert layer_1.tolist() == [20, 50, 21, 51]
     # Fine: 4 per frame, interleaved [pos2, pos3, pos5, pos6, ...]
-    assert layer_2 == [30, 40, 60, 70, 31, 41, 61, 71]
+    assert layer_2.tolist() == [30, 40, 60, 70, 31, 41, 61, 71]
+
+
+def test_redistribute_codes_drops_partial_frame_and_clamps() -> None:
+    """Trailing tokens short of a full frame are dropped and out-of-range codes are clamped."""
+    decoder = SNACDecoder()
+    offset = 128266
+    tokens = [
+        offset - 5,  # pos 0: below the audio vocab, clamps to 0
+        offset + 4096 + 5000,  # pos 1: past the codebook, clamps to 4095
+        offset + 8192,
+        offset + 12288,
+        offset + 16384,
+        offset + 20480,
+        offset + 24576,
+        offset + 1,  # partial second frame
+        offset + 4096 + 2,
+    ]
+    layer_0, layer_1, layer_2 = decoder._redistribute_codes(tokens)
+
+    assert layer_0.tolist() == [0]
+    assert layer_1.tolist() == [4095, 0]
+    assert layer_2.tolist() == [0, 0, 0, 0]
 
 
 def test_redistribute_codes_empty_raises() -> None:
@@ -128,3 +142,38 @@ def test_decode_returns_wav_bytes(mock_snac_modules: tuple[MagicMock, MagicMock]
 
     assert isinstance(result, bytes)
     assert result[:4] == b"RIFF"
+
+
+def test_upload_codes_transfers_all_levels_at_once(mock_snac_modules: tuple[MagicMock, MagicMock]) -> None:
+    """All three code levels are uploaded as one pinned buffer and split on the device."""
+    _, mock_torch = mock_snac_modules
+    decoder = SNACDecoder(device="cuda")
+    layers = (np.array([1]), np.array([2, 3]), np.array([4, 5, 6, 7]))
+    flat = mock_torch.from_numpy.return_value.pin_memory.return_value.to.return_value
+    flat.split.return_value = [MagicMock(), MagicMock(), MagicMock()]
+
+    codes = decoder._upload_codes(layers)
+
+    uploaded = mock_torch.from_numpy.call_args.args[0]
+    assert uploaded.tolist() == [1, 2, 3, 4, 5, 6, 7]
+    mock_torch.from_numpy.return_value.pin_memory.return_value.to.assert_called_once_with("cuda", non_blocking=True)
+    flat.split.assert_called_once_with([1, 2, 4])
+    assert len(codes) == 3
+
+
+def test_copy_to_host_stages_cuda_tensors_through_pinned_memory(
+    mock_snac_modules: tuple[MagicMock, MagicMock],
+) -> None:
+    """CUDA results are copied asynchronously into a pinned buffer before being read."""
+    _, mock_torch = mock_snac_modules
+    decoder = SNACDecoder(device="cuda")
+    tensor = MagicMock()
+    tensor.device.type = "cuda"
+
+    host = decoder._copy_to_host(tensor)
+
+    assert host is mock_torch.empty.return_value
+    assert mock_torch.empty.call_args.kwargs["pin_memory"] is True
+    host.copy_.assert_called_once_with(tensor, non_blocking=True)
+    mock_torch.cuda.current_stream.return_value.synchronize.assert_called_once()
+    tensor.cpu.assert_not_called()
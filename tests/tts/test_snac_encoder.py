@@ -2,12 +2,13 @@
 
 from unittest.mock import MagicMock
 
+import numpy as np
 import pytest
 
 from doppelganger.tts.exceptions import TTSModelNotLoadedError
 from doppelganger.tts.snac_constants import AUDIO_VOCAB_OFFSET, CODEBOOK_OFFSETS
 from doppelganger.tts.snac_decoder import SNACDecoder
-from doppelganger.tts.snac_encoder import SNACEncoder
+from doppelganger.tts.snac_encoder import SNACEncoder, _get_resampler
 
 
 @pytest.fixture
@@ -58,6 +59,14 @@ def test_load_and_unload(mock_encoder_modules: tuple[MagicMock, MagicMock, Magic
     assert encoder.is_loaded is False
 
 
+def _fake_level(values: list[int]) -> MagicMock:
+    """Build a fake [1, N] code tensor whose squeeze().cpu().numpy() chain yields the values."""
+    level = MagicMock()
+    level.shape = (1, len(values))
+    level.squeeze.return_value.cpu.return_value.numpy.return_value = np.asarray(values, dtype=np.int64)
+    return level
+
+
 def _make_fake_codes(n_frames: int, base: int = 0) -> list[MagicMock]:
     """Build 3-level fake SNAC codes with known values.
 
@@ -65,30 +74,11 @@ def _make_fake_codes(n_frames: int, base: int = 0) -> list[MagicMock]:
     Level 1: 2*N values starting at base + 100
     Level 2: 4*N values starting at base + 200
     """
-    level_0 = MagicMock()
-    level_0.shape = (1, n_frames)
-    level_0.__getitem__ = lambda self, idx: self._row if idx == 0 else None
-    row_0 = MagicMock()
-    row_0_values = [base + i for i in range(n_frames)]
-    row_0.__getitem__ = lambda self, idx: row_0_values[idx]
-    level_0._row = row_0
-    level_0.__getitem__ = lambda self, idx: row_0
-
-    level_1 = MagicMock()
-    level_1.shape = (1, 2 * n_frames)
-    row_1 = MagicMock()
-    row_1_values = [base + 100 + i for i in range(2 * n_frames)]
-    row_1.__getitem__ = lambda self, idx: row_1_values[idx]
-    level_1.__getitem__ = lambda self, idx: row_1
-
-    level_2 = MagicMock()
-    level_2.shape = (1, 4 * n_frames)
-    row_2 = MagicMock()
-    row_2_values = [base + 200 + i for i in range(4 * n_frames)]
-    row_2.__getitem__ = lambda self, idx: row_2_values[idx]
-    level_2.__getitem__ = lambda self, idx: row_2
-
-    return [level_0, level_1, level_2]
+    return [
+        _fake_level([base + i for i in range(n_frames)]),
+        _fake_level([base + 100 + i for i in range(2 * n_frames)]),
+        _fake_level([base + 200 + i for i in range(4 * n_frames)]),
+    ]
 
 
 def test_interleave_codes_single_frame() -> None:
@@ -202,6 +192,91 @@ def test_encode_converts_stereo_to_mono(mock_encoder_modules: tuple[MagicMock, M
     waveform.mean.assert_called_once_with(dim=0, keepdim=True)
 
 
+def test_half_precision_autocasts_on_cuda(mock_encoder_modules: tuple[MagicMock, MagicMock, MagicMock]) -> None:
+    """With half precision on a CUDA device, the encoder forward pass runs under bf16 autocast."""
+    _, mock_torch, _ = mock_encoder_modules
+    encoder = SNACEncoder(device="cuda", half_precision=True)
+    encoder.load()
+
+    encoder._run_encoder(encoder._model, MagicMock())
+
+    mock_torch.autocast.assert_called_once_with(device_type="cuda", dtype=mock_torch.bfloat16)
+
+
+def test_full_precision_by_default(mock_encoder_modules: tuple[MagicMock, MagicMock, MagicMock]) -> None:
+    """Autocast is not used unless half precision is requested."""
+    _, mock_torch, _ = mock_encoder_modules
+    encoder = SNACEncoder(device="cuda")
+    encoder.load()
+
+    encoder._run_encoder(encoder._model, MagicMock())
+
+    mock_torch.autocast.assert_not_called()
+
+
+def test_resampler_is_built_once_per_rate_pair(
+    mock_encoder_modules: tuple[MagicMock, MagicMock, MagicMock],
+) -> None:
+    """Clips at the same source rate share one Resample kernel."""
+    _, _, mock_torchaudio = mock_encoder_modules
+    _get_resampler.cache_clear()
+    encoder = SNACEncoder()
+
+    waveform = MagicMock()
+    waveform.shape = (1, 48000)
+    waveform.abs.return_value.max.return_value = 0.0
+    mock_torchaudio.load.return_value = (waveform, 48000)
+    mock_torchaudio.transforms.Resample.return_value.return_value = waveform
+
+    encoder._load_waveform("a.wav", 24000)
+    encoder._load_waveform("b.wav", 24000)
+
+    mock_torchaudio.transforms.Resample.assert_called_once_with(48000, 24000)
+    _get_resampler.cache_clear()
+
+
+def test_encode_batch_slices_each_clip_to_its_own_frames(
+    mock_encoder_modules: tuple[MagicMock, MagicMock, MagicMock],
+) -> None:
+    """Batched encode trims padded frames so each clip gets the tokens its own samples cover."""
+    _, _, mock_torchaudio = mock_encoder_modules
+    encoder = SNACEncoder()
+    encoder.load()
+    model = encoder._model
+    assert model is not None
+    model.hop_length = 512
+    model.vq_strides = [4, 2, 1]
+    model.attn_window_size = None
+
+    def fake_load(path: str) -> tuple[MagicMock, int]:
+        """Return a mono waveform two frames long for the first clip and one frame for the second."""
+        waveform = MagicMock()
+        n_samples = 4096 if path == "long.wav" else 2048
+        waveform.shape = (1, n_samples)
+        waveform.abs.return_value.max.return_value = 1.0
+        waveform.__truediv__ = lambda self, other: self
+        return waveform, 24000
+
+    mock_torchaudio.load.side_effect = fake_load
+
+    # Padded batch of 2 clips x 2 frames
+    levels = []
+    for values in ([[1, 2], [3, 4]], [[10, 11, 12, 13], [14, 15, 16, 17]], [list(range(20, 28)), list(range(30, 38))]):
+        level = MagicMock()
+        level.cpu.return_value.numpy.return_value = np.asarray(values, dtype=np.int64)
+        levels.append(level)
+    model.encode.return_value = levels
+
+    long_tokens, short_tokens = encoder.encode_batch(["long.wav", "short.wav"])
+
+    assert len(long_tokens) == 14
+    assert len(short_tokens) == 7
+    assert short_tokens[0] == 3 + AUDIO_VOCAB_OFFSET + CODEBOOK_OFFSETS[0]
+    assert short_tokens[1] == 14 + AUDIO_VOCAB_OFFSET + CODEBOOK_OFFSETS[1]
+    assert short_tokens[2] == 30 + AUDIO_VOCAB_OFFSET + CODEBOOK_OFFSETS[2]
+    model.encode.assert_called_once()
+
+
 def test_round_trip_with_decoder() -> None:
     """Encoding then decoding recovers the original code values.
 
@@ -219,23 +294,7 @@ def test_round_trip_with_decoder() -> None:
     level_1_vals = [40, 50, 60, 70, 80, 90]  # 2 * n_frames
     level_2_vals = [100, 110, 120, 130, 140, 150, 160, 170, 180, 190, 200, 210]  # 4 * n_frames
 
-    # Build mock codes for the encoder
-    codes = _make_fake_codes(n_frames, base=0)
-    # Override with our specific values
-    row_0 = MagicMock()
-    row_0.__getitem__ = lambda self, idx: level_0_vals[idx]
-    codes[0].shape = (1, n_frames)
-    codes[0].__getitem__ = lambda self, idx: row_0
-
-    row_1 = MagicMock()
-    row_1.__getitem__ = lambda self, idx: level_1_vals[idx]
-    codes[1].shape = (1, 2 * n_frames)
-    codes[1].__getitem__ = lambda self, idx: row_1
-
-    row_2 = MagicMock()
-    row_2.__getitem__ = lambda self, idx: level_2_vals[idx]
-    codes[2].shape = (1, 4 * n_frames)
-    codes[2].__getitem__ = lambda self, idx: row_2
+    codes = [_fake_level(level_0_vals), _fake_level(level_1_vals), _fake_level(level_2_vals)]
 
     # Encode: interleave into flat token IDs
     token_ids = encoder._interleave_codes(codes)
@@ -246,6 +305,6 @@ def test_round_trip_with_decoder() -> None:
 
     # With correct sequential indexing, encode then decode is a perfect round-trip:
     # the decoder recovers the original SNAC code values in temporal order.
-    assert layer_0 == level_0_vals
-    assert layer_1 == level_1_vals
-    assert layer_2 == level_2_vals
+    assert layer_0.tolist() == level_0_vals
+    assert layer_1.tolist() == level_1_vals
+    assert layer_2.tolist() == level_2_vals
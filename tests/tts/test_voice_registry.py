@@ -3,7 +3,7 @@
 from pathlib import Path
 
 from doppelganger.tts.engine import EngineType
-from doppelganger.tts.voice_registry import VoiceRegistry
+from doppelganger.tts.voice_registry import VoiceRegistry, tombstone_path
 
 
 def _make_voice(voices_dir: Path, name: str) -> Path:
@@ -99,6 +99,27 @@ def test_refresh_picks_up_new_voices(tmp_path: Path) -> None:
     assert registry.size == 2
 
 
+def test_add_and_remove_voice(tmp_path: Path) -> None:
+    """add_voice and remove_voice update the registry without rescanning the directory."""
+    voices_dir = tmp_path / "voices"
+    _make_voice(voices_dir, "gandalf")
+
+    registry = VoiceRegistry(str(voices_dir))
+    registry.scan()
+
+    # Not on disk, so only an incremental add can register it
+    entry = registry.add_voice("Gollum", voices_dir / "gollum" / "reference.wav")
+    assert entry.name == "gollum"
+    assert entry.engine == EngineType.CHATTERBOX
+    assert registry.get_voice("gollum") == entry
+    assert registry.size == 2
+
+    assert registry.remove_voice("gandalf") is not None
+    assert registry.get_voice("gandalf") is None
+    assert registry.remove_voice("gandalf") is None
+    assert registry.size == 1
+
+
 def test_chatterbox_engine_detected(tmp_path: Path) -> None:
     """Voice with reference.wav is detected as chatterbox engine."""
     voices_dir = tmp_path / "voices"
@@ -145,3 +166,97 @@ def test_orpheus_takes_priority_over_chatterbox(tmp_path: Path) -> None:
     voice = registry.get_voice("hybrid")
     assert voice is not None
     assert voice.engine == EngineType.ORPHEUS
+
+
+def test_snapshot_is_a_copy(tmp_path: Path) -> None:
+    """snapshot returns voices by name, unaffected by later registry changes."""
+    voices_dir = tmp_path / "voices"
+    _make_voice(voices_dir, "gandalf")
+
+    registry = VoiceRegistry(str(voices_dir))
+    registry.scan()
+
+    voices = registry.snapshot()
+    registry.remove_voice("gandalf")
+
+    assert list(voices) == ["gandalf"]
+    assert voices["gandalf"].engine == EngineType.CHATTERBOX
+
+
+def test_hidden_dirs_skipped(tmp_path: Path) -> None:
+    """Dot-prefixed directories, such as characters pending deletion, are not registered."""
+    voices_dir = tmp_path / "voices"
+    _make_voice(voices_dir, "gandalf")
+    _make_voice(voices_dir, ".gollum.deleted-abc")
+
+    registry = VoiceRegistry(str(voices_dir))
+    registry.scan()
+
+    assert [v.name for v in registry.list_voices()] == ["gandalf"]
+
+
+def test_purge_tombstones_removes_only_deleted_dirs(tmp_path: Path) -> None:
+    """purge_tombstones removes directories left mid-deletion and keeps live voices and other hidden entries."""
+    voices_dir = tmp_path / "voices"
+    _make_voice(voices_dir, "gandalf")
+    _make_voice(voices_dir, ".gollum.deleted-abc")
+    (voices_dir / ".keep").mkdir()
+
+    registry = VoiceRegistry(str(voices_dir))
+
+    assert registry.purge_tombstones() == 1
+    assert sorted(p.name for p in voices_dir.iterdir()) == [".keep", "gandalf"]
+
+
+def test_purge_tombstones_missing_dir(tmp_path: Path) -> None:
+    """purge_tombstones on a nonexistent voices directory removes nothing."""
+    assert VoiceRegistry(str(tmp_path / "nonexistent")).purge_tombstones() == 0
+
+
+def test_tombstone_path_is_hidden_sibling(tmp_path: Path) -> None:
+    """Tombstones sit next to the character directory under a unique name that purge_tombstones matches."""
+    char_dir = tmp_path / "gandalf"
+    first, second = tombstone_path(char_dir), tombstone_path(char_dir)
+
+    assert first.parent == tmp_path
+    assert first.name.startswith(".gandalf.deleted-")
+    assert first != second
+
+
+def test_search_names_case_insensitive_and_limited(tmp_path: Path) -> None:
+    """search_names matches fragments regardless of case and stops at the limit."""
+    registry = VoiceRegistry(str(tmp_path))
+    for name in ("gandalf", "galadriel", "gollum"):
+        registry.add_voice(name, tmp_path / name / "reference.wav")
+
+    assert registry.search_names("GA", 25) == ["gandalf", "galadriel"]
+    assert registry.search_names("", 2) == ["gandalf", "galadriel"]
+    assert registry.search_names("frodo", 25) == []
+
+
+def test_fingerprint_tracks_directory_changes(tmp_path: Path) -> None:
+    """The fingerprint is stable across rescans and changes when a reference file changes."""
+    voices_dir = tmp_path / "voices"
+    ref = _make_voice(voices_dir, "gandalf")
+    registry = VoiceRegistry(str(voices_dir))
+    registry.scan()
+    first = registry.fingerprint
+
+    registry.scan()
+    assert registry.fingerprint == first
+
+    ref.write_bytes(b"RIFF" + b"\x00" * 200)
+    registry.scan()
+    assert registry.fingerprint is not None
+    assert registry.fingerprint != first
+
+
+def test_fingerprint_cleared_by_manual_changes(tmp_path: Path) -> None:
+    """Adding or removing a voice without a scan invalidates the fingerprint."""
+    voices_dir = tmp_path / "voices"
+    _make_voice(voices_dir, "gandalf")
+    registry = VoiceRegistry(str(voices_dir))
+    registry.scan()
+
+    registry.remove_voice("gandalf")
+    assert registry.fingerprint is None